@@ -0,0 +1,500 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RESULT ANALYTICS
+###################################################################################
+
+from __future__ import print_function
+import os
+import sys
+import logging
+import argparse
+import collections
+
+import numpy as np
+from numpy.lib import recfunctions
+
+from config import STORE_LAYOUTS, open_results
+from regress import METRIC_DIRECTIONS, DEFAULT_DIRECTION
+from repetition import get_t_value
+from refine import find_crossovers
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+RESULTS_DIR = BASE_DIR + "/results/"
+
+# Dimensions collect_stats records a measurement under
+DIMENSIONS = ("layout", "operator", "selectivity", "projectivity", "column_count",
+              "write_ratio", "tuples_per_tg")
+
+# Per-group aggregates of group_by
+#   count   : measurements with a value
+#   geomean : geometric mean, NaN when a value is not positive
+AGGREGATES = ("count", "mean", "median", "std", "min", "max", "geomean")
+
+DEFAULT_AGGREGATES = ("count", "mean", "min", "max")
+
+BASELINE_LAYOUT = "row"
+
+OUTPUT_FORMATS = ("markdown", "csv")
+
+# Experiments whose layout curves trade places along their x axis
+CROSSOVER_EXPERIMENTS = ("projectivity", "selectivity", "operator", "join")
+
+# Crossovers of every CROSSOVER_EXPERIMENTS curve, one file for the whole
+# result tree so it can be compared across builds
+CROSSOVER_TABLE_FILE = "crossovers.csv"
+
+# Where two layouts cross within one configuration.
+#   x         : crossing of the mean curves
+#   low, high : range of the axis where the 95% confidence band of their
+#               difference still contains zero, the sampled range when the
+#               band never leaves it
+#   runs      : fewest measured runs behind a point of either curve
+LayoutCrossover = collections.namedtuple('LayoutCrossover',
+                                         ['configuration', 'first', 'second', 'x', 'low', 'high', 'runs'])
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def load_experiment(name, results_dir=RESULTS_DIR):
+    """ Rows of the experiment's result store and its y column.
+    """
+    result_file_name = name + ".csv"
+    if result_file_name not in STORE_LAYOUTS:
+        raise ValueError("Unknown experiment %s" % name)
+
+    results = open_results(os.path.join(results_dir, name) + "/", result_file_name)
+    return results.frozen(), results.y_column
+
+def filter_rows(data, **filters):
+    """ Rows matching every column=value filter; values compare as the
+        column's type.
+    """
+    mask = np.ones(len(data), dtype=bool)
+    for name, value in filters.items():
+        mask &= (data[name] == np.array(value).astype(data.dtype[name]))
+    return data[mask]
+
+def get_group_ids(data, keys):
+    """ Distinct key tuples of data, sorted, and the group of every row.
+        NaN keys, which never compare equal, form one group.
+    """
+    if not keys:
+        groups = np.zeros(1, dtype=[("all", "i8")])
+        return groups, np.zeros(len(data), dtype=np.int64)
+
+    key_data = recfunctions.repack_fields(data[list(keys)]).copy()
+    nan_fields = []
+    for name in keys:
+        if key_data.dtype[name].kind == "f":
+            missing = np.isnan(key_data[name])
+            if missing.any():
+                key_data[name][missing] = np.inf
+                nan_fields.append(name)
+
+    groups, inverse = np.unique(key_data, return_inverse=True)
+    for name in nan_fields:
+        groups[name][np.isinf(groups[name])] = np.nan
+    return groups, inverse.reshape(-1)
+
+###################################################################################
+# GROUP BY
+###################################################################################
+
+def group_by(data, keys, value="stat", aggregates=DEFAULT_AGGREGATES):
+    """ One row per distinct combination of the key columns, with the
+        aggregates of value over its measurements. Rows without a value are
+        left out.
+    """
+    for aggregate in aggregates:
+        if aggregate not in AGGREGATES:
+            raise ValueError("Unknown aggregate %s" % aggregate)
+
+    data = data[~np.isnan(data[value].astype(float))]
+    values = data[value].astype(float)
+    groups, inverse = get_group_ids(data, keys)
+    group_count = len(groups) if len(data) else 0
+
+    counts = np.bincount(inverse, minlength=group_count)
+    sums = np.bincount(inverse, weights=values, minlength=group_count)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+
+    columns = {"count" : counts, "mean" : means}
+
+    if "std" in aggregates:
+        squares = np.bincount(inverse, weights=(values - means[inverse]) ** 2, minlength=group_count)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            columns["std"] = np.sqrt(squares / (counts - 1))
+
+    if "min" in aggregates:
+        columns["min"] = np.full(group_count, np.inf)
+        np.minimum.at(columns["min"], inverse, values)
+
+    if "max" in aggregates:
+        columns["max"] = np.full(group_count, -np.inf)
+        np.maximum.at(columns["max"], inverse, values)
+
+    if "median" in aggregates:
+        order = np.lexsort((values, inverse))
+        sorted_values = values[order]
+        starts = np.cumsum(counts) - counts
+        columns["median"] = (sorted_values[starts + (counts - 1) // 2] +
+                             sorted_values[starts + counts // 2]) / 2.0
+
+    if "geomean" in aggregates:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            logs = np.where(values > 0, np.log(np.where(values > 0, values, 1.0)), np.nan)
+            columns["geomean"] = np.exp(np.bincount(inverse, weights=logs, minlength=group_count) / counts)
+
+    dtype = [(name, groups.dtype[name]) for name in keys]
+    dtype += [(aggregate, "i8" if aggregate == "count" else "f8") for aggregate in aggregates]
+    table = np.zeros(group_count, dtype=dtype)
+    for name in keys:
+        table[name] = groups[name][:group_count]
+    for aggregate in aggregates:
+        table[aggregate] = columns[aggregate]
+    return table
+
+###################################################################################
+# SPEEDUP
+###################################################################################
+
+def get_direction(experiment):
+    """ +1 when higher values are better, -1 when lower are, 0 when the
+        values are not a performance metric (see regress.py).
+    """
+    return METRIC_DIRECTIONS.get(experiment, DEFAULT_DIRECTION)
+
+def speedup_table(data, by=(), value="stat", baseline=BASELINE_LAYOUT,
+                  candidates=None, direction=DEFAULT_DIRECTION):
+    """ Speedup of every candidate layout over the baseline, per group of the
+        by columns.
+
+        Measurements are first averaged per configuration, one point per
+        combination of the other DIMENSIONS. Each candidate is paired with the
+        baseline at every point both have, and the ratios are summarised by
+        their geometric mean, min and max. Speedups are above 1 when the
+        candidate is better. For values that are not a performance metric
+        (direction 0), the table holds candidate / baseline ratios.
+    """
+    if "layout" in by:
+        raise ValueError("Cannot group speedups by layout")
+
+    layouts = sorted(set(data["layout"].tolist()) - set([""]))
+    if baseline not in layouts:
+        raise ValueError("No %s measurements to compare against" % baseline)
+    if candidates is None:
+        candidates = [layout for layout in layouts if layout != baseline]
+
+    point_keys = [name for name in DIMENSIONS if name != "layout" and name in data.dtype.names]
+    for name in by:
+        if name not in point_keys:
+            point_keys.append(name)
+
+    cells = group_by(data, point_keys + ["layout"], value, ("mean",))
+    points, point_ids = get_group_ids(cells, point_keys)
+
+    # point x layout means, NaN where a layout has no measurement
+    matrix = np.full((len(points), len(layouts)), np.nan)
+    matrix[point_ids, np.searchsorted(layouts, cells["layout"])] = cells["mean"]
+
+    group_keys = list(by)
+    groups, group_ids = get_group_ids(points, group_keys)
+    base = matrix[:, layouts.index(baseline)]
+
+    label = "speedup" if direction != 0 else "ratio"
+    dtype = [(name, groups.dtype[name]) for name in group_keys]
+    for candidate in candidates:
+        dtype += [(candidate + "_" + label, "f8"), (candidate + "_min", "f8"),
+                  (candidate + "_max", "f8"), (candidate + "_points", "i8")]
+    table = np.zeros(len(groups), dtype=dtype)
+    for name in group_keys:
+        table[name] = groups[name]
+
+    for candidate in candidates:
+        if candidate not in layouts:
+            raise ValueError("No %s measurements" % candidate)
+        other = matrix[:, layouts.index(candidate)]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratios = base / other if direction < 0 else other / base
+
+        paired = np.isfinite(ratios) & (ratios > 0)
+        ratio_rows = np.zeros(int(paired.sum()), dtype=[("group", "i8"), ("ratio", "f8")])
+        ratio_rows["group"] = group_ids[paired]
+        ratio_rows["ratio"] = ratios[paired]
+        summary = group_by(ratio_rows, ["group"], "ratio", ("count", "geomean", "min", "max"))
+
+        table[candidate + "_" + label] = np.nan
+        table[candidate + "_min"] = np.nan
+        table[candidate + "_max"] = np.nan
+        table[candidate + "_" + label][summary["group"]] = summary["geomean"]
+        table[candidate + "_min"][summary["group"]] = summary["min"]
+        table[candidate + "_max"][summary["group"]] = summary["max"]
+        table[candidate + "_points"][summary["group"]] = summary["count"]
+
+    return table
+
+###################################################################################
+# CROSSOVERS
+###################################################################################
+
+def get_bands(data, keys, value="stat"):
+    """ Mean of value per distinct key with its 95% confidence interval, and
+        the measured runs behind it.
+
+        Several rows of one key, e.g. from repeated sweeps, get the interval
+        of their spread. A single row keeps the interval recorded with it;
+        rows without one count as exact.
+    """
+    data = data[~np.isnan(data[value].astype(float))]
+    values = data[value].astype(float)
+    groups, inverse = get_group_ids(data, keys)
+    group_count = len(groups) if len(data) else 0
+
+    counts = np.bincount(inverse, minlength=group_count)
+    means = np.bincount(inverse, weights=values, minlength=group_count) / np.maximum(counts, 1)
+    squares = np.bincount(inverse, weights=(values - means[inverse]) ** 2, minlength=group_count)
+    std = np.sqrt(squares / np.maximum(counts - 1, 1))
+    t_values = np.array([get_t_value(count - 1) if count > 1 else 0.0 for count in counts])
+    half_widths = t_values * std / np.sqrt(np.maximum(counts, 1))
+    low, high = means - half_widths, means + half_widths
+
+    if value == "stat":
+        first_rows = np.zeros(group_count, dtype=np.int64)
+        first_rows[inverse[::-1]] = np.arange(len(data))[::-1]
+        recorded_low = data["stat_ci_low"][first_rows]
+        recorded_high = data["stat_ci_high"][first_rows]
+        recorded = (counts == 1) & ~np.isnan(recorded_low) & ~np.isnan(recorded_high)
+        low[recorded] = recorded_low[recorded]
+        high[recorded] = recorded_high[recorded]
+
+    runs = np.bincount(inverse, weights=np.maximum(data["repetitions"], 1), minlength=group_count)
+    return groups[:group_count], means, low, high, runs.astype(np.int64)
+
+def get_zero(xs, band, left, right):
+    """ Where band, linear between samples left and right, is zero.
+    """
+    if band[left] == band[right]:
+        return xs[right]
+    return xs[left] + (xs[right] - xs[left]) * band[left] / (band[left] - band[right])
+
+def get_band_limits(xs, lower, upper, left, right):
+    """ Axis range around a crossing, between samples left and right, where
+        the band [lower, upper] of the difference of two curves contains zero.
+    """
+    excluded = (lower > 0) | (upper < 0)
+
+    low = xs[0]
+    for index in range(left, -1, -1):
+        if excluded[index]:
+            low = get_zero(xs, lower if lower[index] > 0 else upper, index, index + 1)
+            break
+
+    high = xs[-1]
+    for index in range(right, len(xs)):
+        if excluded[index]:
+            high = get_zero(xs, lower if lower[index] > 0 else upper, index - 1, index)
+            break
+
+    return low, high
+
+def is_missing(value):
+    # store placeholders of columns an experiment does not record
+    if isinstance(value, (float, np.floating)):
+        return np.isnan(value)
+    return value == "" or value == -1
+
+def format_configuration(group, names):
+    return " ".join("%s=%s" % (name, format_cell(value))
+                    for name, value in zip(names, group) if not is_missing(value))
+
+def find_layout_crossovers(data, axis, value="stat"):
+    """ LayoutCrossover of every pair of layouts, per configuration of the
+        other DIMENSIONS, along axis.
+
+        Layout curves are the per-point means, linearly interpolated between
+        the axis values every layout of the configuration was measured at.
+    """
+    config_keys = [name for name in DIMENSIONS
+                   if name not in ("layout", axis) and name in data.dtype.names]
+    cells, means, low, high, runs = get_bands(data, config_keys + [axis, "layout"], value)
+    configurations, config_ids = get_group_ids(cells, config_keys)
+
+    crossovers = []
+    for config_id, configuration in enumerate(configurations):
+        mask = (config_ids == config_id)
+        layouts = sorted(set(cells["layout"][mask].tolist()) - set([""]))
+
+        # axis values every layout has, NaN axis values are not points
+        points = [set(cells[axis][mask & (cells["layout"] == layout)].tolist()) for layout in layouts]
+        xs = sorted(x for x in set.intersection(*points) if x == x) if points else []
+        if len(xs) < 2:
+            continue
+
+        curves = collections.OrderedDict()
+        bands = {}
+        for layout in layouts:
+            rows = np.nonzero(mask & (cells["layout"] == layout))[0]
+            rows = rows[np.argsort(cells[axis][rows])]
+            rows = rows[np.isin(cells[axis][rows], xs)]
+            curves[layout] = means[rows]
+            bands[layout] = (low[rows], high[rows], runs[rows].min())
+
+        xs = np.array(xs, dtype=float)
+        name = format_configuration(configuration, config_keys)
+        for crossover in find_crossovers(name, xs, curves):
+            first_low, first_high, first_runs = bands[crossover.first]
+            second_low, second_high, second_runs = bands[crossover.second]
+            index = int(np.searchsorted(xs, crossover.low))
+            left = index if crossover.low < crossover.x else index - 1
+            right = index + 1
+            limits = get_band_limits(xs, first_low - second_high, first_high - second_low, left, right)
+            crossovers.append(LayoutCrossover(name, crossover.first, crossover.second, crossover.x,
+                                              min(limits[0], crossover.x), max(limits[1], crossover.x),
+                                              min(first_runs, second_runs)))
+
+    return crossovers
+
+def get_crossover_table(experiments=CROSSOVER_EXPERIMENTS, results_dir=RESULTS_DIR, axis=None,
+                        filters=None):
+    """ Layout crossovers of every experiment along axis, its store's x
+        column by default, as one table.
+    """
+    rows = []
+    for experiment in experiments:
+        data, y_column = load_experiment(experiment, results_dir)
+        data = filter_rows(data, **(filters or {}))
+        experiment_axis = axis or STORE_LAYOUTS[experiment + ".csv"][1]
+        for crossover in find_layout_crossovers(data, experiment_axis, y_column):
+            rows.append((experiment, experiment_axis) + tuple(crossover))
+
+    width = max([len(row[2]) for row in rows] + [1])
+    dtype = [("experiment", "U16"), ("axis", "U16"), ("configuration", "U%d" % width),
+             ("first", "U8"), ("second", "U8"), ("x", "f8"), ("low", "f8"), ("high", "f8"),
+             ("runs", "i8")]
+    return np.array(rows, dtype=dtype)
+
+def write_crossover_table(results_dir=RESULTS_DIR, experiments=CROSSOVER_EXPERIMENTS):
+    """ Layout crossovers of the result tree, to CROSSOVER_TABLE_FILE in it.
+    """
+    experiments = [experiment for experiment in experiments
+                   if os.path.isdir(os.path.join(results_dir, experiment))]
+    table = get_crossover_table(experiments, results_dir)
+
+    path = os.path.join(results_dir, CROSSOVER_TABLE_FILE)
+    temp_path = path + ".tmp"
+    fp = open(temp_path, "w")
+    fp.write(format_table(table, "csv"))
+    fp.close()
+    os.rename(temp_path, path)
+
+    LOG.info("CROSSOVERS: %s (%d crossovers in %d experiments)", path, len(table), len(experiments))
+    return table
+
+###################################################################################
+# OUTPUT
+###################################################################################
+
+def format_cell(value):
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return ""
+        return "%.4g" % value
+    return str(value)
+
+def format_table(table, output_format="markdown"):
+    """ The table as Markdown or CSV text.
+    """
+    names = list(table.dtype.names)
+    rows = [[format_cell(value) for value in row] for row in table.tolist()]
+
+    if output_format == "csv":
+        lines = [",".join(names)]
+        lines.extend(",".join(row) for row in rows)
+    elif output_format == "markdown":
+        lines = ["| " + " | ".join(names) + " |",
+                 "|" + "|".join(" --- " if table.dtype[name].kind == "U" else " ---: "
+                                for name in names) + "|"]
+        lines.extend("| " + " | ".join(row) + " |" for row in rows)
+    else:
+        raise ValueError("Unknown output format %s" % output_format)
+
+    return "\n".join(lines) + "\n"
+
+def parse_filters(expressions):
+    """ column=value filters of the command line.
+    """
+    filters = {}
+    for expression in expressions or []:
+        if "=" not in expression:
+            raise ValueError("Filter %s is not column=value" % expression)
+        name, value = expression.split("=", 1)
+        filters[name.strip()] = value.strip()
+    return filters
+
+###################################################################################
+# MAIN
+###################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Group, aggregate and compare collected results')
+
+    parser.add_argument("experiment", help='experiment to analyse, e.g. selectivity')
+    parser.add_argument("--results", help='result tree', default=RESULTS_DIR)
+    parser.add_argument("--by", help='columns to group by', nargs='*', default=[])
+    parser.add_argument("--where", help='only rows with column=value', action='append')
+    parser.add_argument("--value", help='column to aggregate (default: the experiment\'s stat)')
+    parser.add_argument("--aggregate", help='aggregates per group', nargs='*', choices=AGGREGATES,
+                        default=list(DEFAULT_AGGREGATES))
+    parser.add_argument("--speedup", help='speedup of every layout over --baseline per group', action='store_true')
+    parser.add_argument("--baseline", help='layout speedups are relative to', default=BASELINE_LAYOUT)
+    parser.add_argument("--crossovers", help='where the layout curves cross, with 95%% confidence ranges', action='store_true')
+    parser.add_argument("--axis", help='axis --crossovers are found along (default: the experiment\'s x column)')
+    parser.add_argument("--format", help='output format', choices=OUTPUT_FORMATS, default="markdown")
+    parser.add_argument("--output", help='write the table to this file instead of stdout')
+
+    args = parser.parse_args()
+
+    filters = parse_filters(args.where)
+    data, y_column = load_experiment(args.experiment, args.results)
+    data = filter_rows(data, **filters)
+    value = args.value or y_column
+
+    if args.crossovers:
+        table = get_crossover_table([args.experiment], args.results, args.axis, filters)
+    elif args.speedup:
+        table = speedup_table(data, args.by, value, args.baseline,
+                              direction=get_direction(args.experiment))
+    else:
+        table = group_by(data, args.by, value, args.aggregate)
+
+    text = format_table(table, args.format)
+    if args.output:
+        fp = open(args.output, "w")
+        fp.write(text)
+        fp.close()
+        LOG.info("OUTPUT: %s (%d rows)", args.output, len(table))
+    else:
+        sys.stdout.write(text)
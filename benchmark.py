@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+
+###################################################################################
+# HARNESS BENCHMARKS
+###################################################################################
+
+from __future__ import print_function
+import os
+import glob
+import time
+import sys
+import random
+import shutil
+import tempfile
+import logging
+import argparse
+import subprocess
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+WEIGHT_DIR = BASE_DIR + "/results/weight/"
+
+BENCHMARK_REPEAT = 5
+
+COLLECT_LINE_COUNT = 1000000
+
+STARTUP_REPEAT = 10
+
+# Query-sequence charts rendered by --render, with the range of their values
+#   (name, chart, series, query count, low, high, width, height)
+RENDER_CASES = (
+    ("weight", "create_weight_line_chart", 4, "WEIGHT_QUERY_COUNT", 0, 500, 400, 120),
+    ("adapt", "create_adapt_line_chart", 3, "ADAPT_QUERY_COUNT", 100, 2400, 800, 200),
+    ("hyrise", "create_hyrise_line_chart", 2, "HYRISE_QUERY_COUNT", 150, 4000, 1200, 150),
+)
+
+# Copies of every render case in the figure set written by --report
+REPORT_COPIES = 4
+
+# Small charts rendered by --charts, like a full --plot-all run
+#   (chart, x values, series)
+CHART_CASES = (
+    ("create_selectivity_line_chart", "SELECTIVITY", 3),
+    ("create_operator_line_chart", "OP_SELECTIVITY", 3),
+    ("create_projectivity_bar_chart", "PROJECTIVITY", 3),
+)
+CHART_COUNT = 300
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def time_function(function, repeat=BENCHMARK_REPEAT):
+    """ Best wall-clock time of repeat calls, in seconds.
+    """
+    best = None
+    for itr in range(repeat):
+        start = time.time()
+        function()
+        duration = time.time() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+def report(name, baseline, candidate):
+    speedup = baseline / candidate if candidate > 0 else float('inf')
+    LOG.info("%-24s baseline %9.3f ms  new %9.3f ms  speedup %7.1fx",
+             name, baseline * 1000, candidate * 1000, speedup)
+
+###################################################################################
+# BENCHMARKS
+###################################################################################
+
+# LOADER -- BENCHMARK
+def loader_benchmark():
+    import loader
+
+    data_files = sorted(glob.glob(WEIGHT_DIR + "/*/weight.csv"))
+    if not data_files:
+        LOG.error("No result files under %s", WEIGHT_DIR)
+        return
+
+    def load_legacy():
+        for data_file in data_files:
+            n_rows = sum(1 for line in open(data_file))
+            loader.loadDataFile(n_rows, 2, data_file)
+
+    def load_parse():
+        for data_file in data_files:
+            loader.parse_data_file(data_file)
+
+    def load_cached():
+        for data_file in data_files:
+            loader.load_data_file(data_file)
+
+    LOG.info("Loading %d files from %s", len(data_files), WEIGHT_DIR)
+
+    baseline = time_function(load_legacy)
+    report("parse (cold)", baseline, time_function(load_parse))
+
+    loader.clear_data_cache()
+    load_cached()
+    report("mtime cache (warm)", baseline, time_function(load_cached))
+
+# COLLECT -- BENCHMARK
+def make_summary_file(path, line_count):
+    """ Synthetic selectivity summary: random grid points, one stat per line.
+    """
+    random.seed(0)
+    fp = open(path, "w")
+    for itr in range(line_count):
+        fields = [random.choice(("0", "1", "2")),
+                  random.choice(("1", "2")),
+                  random.choice(("0.2", "0.4", "0.6", "0.8", "1")),
+                  "0.1",
+                  random.choice(("50", "500")),
+                  random.choice(("0", "1")),
+                  "0", "1", "1", "1000", str(itr), "0", "0", "0", "1000",
+                  "%.3f" % random.uniform(100, 1000)]
+        fp.write(" ".join(fields) + "\n")
+    fp.close()
+
+def legacy_collect(summary_file, result_dir, result_file_name):
+    """ The original collect_stats loop: one open/append/close per line.
+    """
+    layouts = {"0" : "row", "1" : "column", "2" : "hybrid"}
+    operators = {"1" : "direct", "2" : "aggregate"}
+
+    fp = open(summary_file)
+    lines = fp.readlines()
+    fp.close()
+
+    for line in lines:
+        data = line.split()
+        result_directory = result_dir + "/" + layouts[data[0]] + "/" + operators[data[1]] + "/" + data[4] + "/" + data[5]
+        if not os.path.exists(result_directory):
+            os.makedirs(result_directory)
+        result_file = open(result_directory + "/" + result_file_name, "a")
+        result_file.write(data[2] + " , " + data[15] + "\n")
+        result_file.close()
+
+def collect_benchmark(line_count=COLLECT_LINE_COUNT):
+    import eval as harness
+
+    work_dir = tempfile.mkdtemp(prefix="collect-")
+    summary_file = os.path.join(work_dir, "outputfile.summary")
+
+    try:
+        LOG.info("Writing %d summary lines to %s", line_count, summary_file)
+        make_summary_file(summary_file, line_count)
+
+        start = time.time()
+        legacy_collect(summary_file, work_dir + "/legacy", "selectivity.csv")
+        baseline = time.time() - start
+
+        start = time.time()
+        harness.collect_stats(work_dir + "/pooled", "selectivity.csv",
+                              harness.SELECTIVITY_EXPERIMENT, summary_file)
+        candidate = time.time() - start
+
+        report("collect_stats", baseline, candidate)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+# STARTUP -- BENCHMARK
+def time_import(modules, repeat=STARTUP_REPEAT):
+    """ Best cold-start time of a fresh interpreter importing the modules.
+    """
+    command = [sys.executable, "-c", "import " + ", ".join(modules)]
+
+    def run():
+        subprocess.check_call(command, cwd=BASE_DIR)
+
+    return time_function(run, repeat)
+
+def startup_benchmark():
+    interpreter = time_import(["os"])
+    LOG.info("%-24s %9.3f ms", "interpreter", interpreter * 1000)
+
+    # eval.py used to import the whole plotting stack at the top
+    eager = time_import(["eval", "plots"]) - interpreter
+    lazy = time_import(["eval"]) - interpreter
+    report("eval startup", eager, lazy)
+
+# RENDER -- BENCHMARK
+def make_query_series(series_count, query_count, low, high):
+    """ Synthetic query sequences: a noisy random walk per series.
+    """
+    random.seed(0)
+    datasets = []
+    for itr in range(series_count):
+        value = random.uniform(low, high)
+        rows = []
+        for query in range(1, query_count + 1):
+            value = min(high, max(low, value + random.gauss(0, (high - low) / 50.0)))
+            rows.append([query, value])
+        datasets.append(rows)
+    return datasets
+
+def render_benchmark():
+    import numpy as np
+    import matplotlib
+    matplotlib.use('Agg')
+    import plots
+    import downsample
+
+    work_dir = tempfile.mkdtemp(prefix="render-")
+
+    try:
+        for name, chart, series_count, query_count, low, high, width, height in RENDER_CASES:
+            query_count = getattr(plots, query_count)
+            raw = [np.array(rows, dtype=float)
+                   for rows in make_query_series(series_count, query_count, low, high)]
+            reduced = [downsample.downsample(rows, width) for rows in raw]
+
+            timings = []
+            sizes = []
+            for label, datasets in (("all", raw), ("downsampled", reduced)):
+                file_name = os.path.join(work_dir, name + "-" + label + ".pdf")
+                job = plots.FigureJob(file_name, getattr(plots, chart), datasets, width, height)
+                timings.append(time_function(lambda: plots.render_figure(job)))
+                sizes.append(os.path.getsize(file_name))
+
+            LOG.info("%-24s %d x %d points -> %d (%s, %.1f per pixel)", name, series_count,
+                     query_count, len(reduced[0]), downsample.DOWNSAMPLE_METHOD,
+                     downsample.POINTS_PER_PIXEL)
+            report(name + " render", timings[0], timings[1])
+            LOG.info("%-24s baseline %9.1f KB  new %9.1f KB  smaller %7.1fx", name + " pdf",
+                     sizes[0] / 1024.0, sizes[1] / 1024.0, sizes[0] / float(sizes[1]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+# REPORT -- BENCHMARK
+def report_benchmark(copies=REPORT_COPIES):
+    import numpy as np
+    import matplotlib
+    matplotlib.use('Agg')
+    import plots
+
+    work_dir = tempfile.mkdtemp(prefix="report-")
+
+    jobs = []
+    for name, chart, series_count, query_count, low, high, width, height in RENDER_CASES:
+        datasets = [np.array(rows, dtype=float) for rows in
+                    make_query_series(series_count, getattr(plots, query_count), low, high)]
+        for itr in range(copies):
+            file_name = os.path.join(work_dir, "%s-%d.pdf" % (name, itr))
+            jobs.append(plots.FigureJob(file_name, getattr(plots, chart), datasets, width, height))
+
+    def write_separate():
+        # the original saveGraph: one PdfPages per figure, every path as vectors
+        for job in jobs:
+            fig = job.chart(job.datasets)
+            plots.setGraphSize(fig, job.width, job.height)
+            pp = plots.PdfPages(job.file_name)
+            fig.savefig(pp, format='pdf', bbox_inches='tight')
+            pp.close()
+            plots.plot.close(fig)
+
+    report_file = os.path.join(work_dir, "report.pdf")
+    plots.FORCE_RENDER = True
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+
+    try:
+        baseline = time_function(write_separate, 1)
+        baseline_size = sum(os.path.getsize(job.file_name) for job in jobs)
+
+        candidate = time_function(lambda: plots.render_report([("benchmark", jobs)], report_file), 1)
+        candidate_size = os.path.getsize(report_file)
+
+        LOG.info("%d figures of %d x %d series points", len(jobs), len(RENDER_CASES), copies)
+        report("figure set", baseline, candidate)
+        LOG.info("%-24s baseline %9.1f KB  new %9.1f KB  smaller %7.1fx", "figure set size",
+                 baseline_size / 1024.0, candidate_size / 1024.0, baseline_size / float(candidate_size))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+# CHARTS -- BENCHMARK
+def chart_benchmark(count=CHART_COUNT):
+    import numpy as np
+    import matplotlib
+    matplotlib.use('Agg')
+    import plots
+
+    random.seed(0)
+    work_dir = tempfile.mkdtemp(prefix="charts-")
+
+    jobs = []
+    for itr in range(count):
+        chart, x_values, series_count = CHART_CASES[itr % len(CHART_CASES)]
+        x_values = getattr(plots, x_values)
+        datasets = [np.array([[x_value, random.uniform(100, 1000)] for x_value in x_values])
+                    for series in range(series_count)]
+        file_name = os.path.join(work_dir, "chart-%d.pdf" % itr)
+        jobs.append(plots.FigureJob(file_name, getattr(plots, chart), datasets,
+                                    plots.OPT_GRAPH_WIDTH, plots.OPT_GRAPH_HEIGHT / 2.0))
+
+    def build(context):
+        # the charts alone, without drawing and writing them
+        plots.CHART_CONTEXT = context
+        for job in jobs:
+            context.release(job.chart(job.datasets))
+
+    def render(context):
+        plots.CHART_CONTEXT = context
+        for job in jobs:
+            plots.render_figure(job)
+
+    level = plots.LOG.level
+    plots.LOG.setLevel(logging.WARNING)
+    try:
+        LOG.info("%d charts of %d kinds", count, len(CHART_CASES))
+        for name, function in (("build", build), ("render", render)):
+            baseline = time_function(lambda: function(plots.ChartContext(reuse=False)), 1)
+            candidate = time_function(lambda: function(plots.ChartContext(reuse=True)), 1)
+            report("reused figure " + name, baseline, candidate)
+    finally:
+        plots.LOG.setLevel(level)
+        plots.CHART_CONTEXT = plots.ChartContext()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+###################################################################################
+# MAIN
+###################################################################################
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Benchmark the experiment harness')
+
+    parser.add_argument("--loader", help='benchmark result file loading', action='store_true')
+    parser.add_argument("--collect", help='benchmark summary ingestion', action='store_true')
+    parser.add_argument("--lines", help='summary lines for --collect', type=int, default=COLLECT_LINE_COUNT)
+    parser.add_argument("--startup", help='benchmark eval.py cold start', action='store_true')
+    parser.add_argument("--render", help='benchmark query-sequence charts with and without downsampling', action='store_true')
+    parser.add_argument("--report", help='benchmark separate figure PDFs against one rasterizing report', action='store_true')
+    parser.add_argument("--charts", help='benchmark rendering many small charts on one reused figure', action='store_true')
+
+    args = parser.parse_args()
+
+    if args.loader:
+        loader_benchmark()
+
+    if args.collect:
+        collect_benchmark(args.lines)
+
+    if args.startup:
+        startup_benchmark()
+
+    if args.render:
+        render_benchmark()
+
+    if args.report:
+        report_benchmark()
+
+    if args.charts:
+        chart_benchmark()
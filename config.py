@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+
+###################################################################################
+# TILE GROUP CONFIGURATION
+###################################################################################
+
+import os
+
+import store
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+PELOTON_BUILD_DIR = BASE_DIR + "/../peloton/build"
+HYADAPT = PELOTON_BUILD_DIR + "/src/hyadapt"
+YCSB = PELOTON_BUILD_DIR + "/src/ycsb"
+PERF = "/usr/bin/perf_3.9.0-7"
+
+OUTPUT_FILE = "outputfile.summary"
+
+PROJECTIVITY_DIR = BASE_DIR + "/results/projectivity/"
+SELECTIVITY_DIR = BASE_DIR + "/results/selectivity/"
+OPERATOR_DIR = BASE_DIR + "/results/operator/"
+YCSB_DIR = BASE_DIR + "/results/ycsb/"
+HORIZONTAL_DIR = BASE_DIR + "/results/horizontal/"
+SUBSET_DIR = BASE_DIR + "/results/subset/"
+ADAPT_DIR = BASE_DIR + "/results/adapt/"
+WEIGHT_DIR = BASE_DIR + "/results/weight/"
+REORG_DIR = BASE_DIR + "/results/reorg/"
+DISTRIBUTION_DIR = BASE_DIR + "/results/distribution/"
+JOIN_DIR = BASE_DIR + "/results/join/"
+CACHING_DIR = BASE_DIR + "/results/caching/"
+HYRISE_DIR = BASE_DIR + "/results/hyrise/"
+CONCURRENCY_DIR = BASE_DIR + "/results/concurrency/"
+
+LAYOUTS = ("row", "column", "hybrid")
+OPERATORS = ("direct", "aggregate")
+REORG_LAYOUTS = ("row", "hybrid")
+HYRISE_LAYOUTS = ("row", "hybrid")
+
+# HYADAPT layout modes (-l) of LAYOUTS
+LAYOUT_MODES = ("0", "1", "2")
+
+# The layout the caching sweep runs. With --memory-layouts it runs every
+# layout, for the peak memory chart; the caching charts and the caching
+# result tree show this one
+CACHING_LAYOUT = "hybrid"
+CACHING_LAYOUT_MODE = "2"
+
+SCALE_FACTOR = 1000.0
+
+SELECTIVITY = (0.2, 0.4, 0.6, 0.8, 1.0)
+PROJECTIVITY = (0.01, 0.1, 0.5)
+SUBSET_RATIOS = (0.2, 0.4, 0.6, 0.8, 1)
+ACCESS_NUM_GROUPS = (1, 2, 4, 8, 16)
+
+SUBSET_SINGLE_GROUP_EXPERIMENT = "1"
+SUBSET_MULTIPLE_GROUP_EXPERIMENT = "2"
+
+OP_PROJECTIVITY = (0.01, 0.1, 1.0)
+OP_COLUMN_COUNT = 100
+OP_SELECTIVITY = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+COLUMN_COUNTS = (50, 500)
+WRITE_RATIOS = (0, 1)
+TUPLES_PER_TILEGROUP = (100, 1000, 10000, 100000)
+NUM_GROUPS = 5
+
+SCAN_RATIOS = (0, 0.5, 0.9, 1)
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+# Thread placements of the affinity sweep of the concurrency experiment (see
+# topology.py); its thread counts come from the machine's topology
+AFFINITY_POLICIES = ("compact", "scatter")
+
+# HYADAPT option taking the thread count of a concurrency run. Not part of
+# this tree: check it against the help of the hyadapt build in use before
+# running the affinity sweep
+CONCURRENCY_THREAD_FLAG = "-b"
+
+# The affinity sweep, one pinned run per policy and thread count (eval.py -u
+# --affinity-sweep). Plain -u makes the single -e 14 run, whose results have
+# no affinity level
+CONCURRENCY_AFFINITY_SPEC = BASE_DIR + "/specs/concurrency_affinity.json"
+
+THETAS = (0, 0.5)
+DIST_TILE_GROUP_TYPES = 3
+
+TRANSACTION_COUNT = 3
+
+CONCURRENCY_TRANSACTION_COUNT = 1000
+CONCURRENCY_SCALE_FACTOR = 100
+
+NUM_ADAPT_TESTS = 12
+REPEAT_ADAPT_TEST = 25
+ADAPT_QUERY_COUNT = NUM_ADAPT_TESTS * REPEAT_ADAPT_TEST
+
+NUM_HYRISE_TESTS = 4
+REPEAT_HYRISE_TEST = 100
+HYRISE_QUERY_COUNT = NUM_HYRISE_TESTS * REPEAT_HYRISE_TEST
+
+SAMPLE_WEIGHTS = (0.0001, 0.001, 0.01, 0.1)
+NUM_WEIGHT_TEST = 10
+REPEAT_WEIGHT_TEST = 1000
+WEIGHT_QUERY_COUNT = NUM_WEIGHT_TEST * REPEAT_WEIGHT_TEST
+
+REORG_QUERY_COUNT = 25 * 4
+DIST_QUERY_COUNT = 13
+
+PROJECTIVITY_EXPERIMENT = 1
+SELECTIVITY_EXPERIMENT = 2
+OPERATOR_EXPERIMENT = 3
+HORIZONTAL_EXPERIMENT= 4
+SUBSET_EXPERIMENT= 5
+ADAPT_EXPERIMENT = 6
+WEIGHT_EXPERIMENT = 7
+REORG_EXPERIMENT = 8
+DISTRIBUTION_EXPERIMENT = 9
+JOIN_EXPERIMENT = 10
+CACHING_EXPERIMENT = 11
+HYRISE_EXPERIMENT = 13
+CONCURRENCY_EXPERIMENT = 14
+
+YCSB_EXPERIMENT = 1
+
+YCSB_SCALE_FACTOR = 100.0
+YCSB_rRANSACTION_COUNT = 100
+
+YCSB_OPERATIONS = ["Read", "Scan", "Insert", "Delete", "Update", "RMW"]
+
+# Repetitions per configuration (see repetition.py)
+WARMUP_RUNS = 1
+MIN_RUNS = 3
+MAX_RUNS = 10
+CI_TARGET = 5.0
+
+# Time limits and retries of every run (see watchdog.py)
+TIMEOUT_FACTOR = 3.0
+MIN_TIMEOUT = 60
+RETRY_COUNT = 2
+RETRY_BACKOFF = 5.0
+
+# Hardware counters recorded per run (see counters.py)
+PERF_EVENTS = ("cycles", "instructions", "cache-misses", "LLC-load-misses",
+               "L1-dcache-load-misses", "dTLB-load-misses", "branch-misses")
+
+# Tail latencies reported per configuration (see latency.py)
+LATENCY_PERCENTILES = (50.0, 99.0, 99.9)
+
+# File format of every figure (--format); --report writes one multi-page PDF
+FIGURE_FORMATS = ("pdf", "png", "svg")
+FIGURE_FORMAT = "pdf"
+
+# Fields of a summary line before the stat, naming a configuration
+SUMMARY_KEY_FIELDS = ("layout", "operator", "selectivity", "projectivity", "column_count",
+                      "write_ratio", "subset_experiment_type", "access_num_group",
+                      "subset_ratio", "tuples_per_tg", "txn_itr", "theta",
+                      "split_point", "sample_weight", "scale_factor")
+
+# Fields naming a whole benchmark invocation
+RUN_KEY_FIELDS = ("experiment_type", "scale_factor", "transaction_count")
+
+# Experiments reporting one measurement per configuration; the query-sequence
+# traces (adapt, weight, reorg, distribution, hyrise) are run once
+REPEATED_EXPERIMENTS = (PROJECTIVITY_EXPERIMENT, SELECTIVITY_EXPERIMENT,
+                        OPERATOR_EXPERIMENT, HORIZONTAL_EXPERIMENT,
+                        SUBSET_EXPERIMENT, JOIN_EXPERIMENT,
+                        CACHING_EXPERIMENT, CONCURRENCY_EXPERIMENT)
+
+def concurrency_path_fields(components):
+    # sweeps before the affinity policies had no policy level
+    if len(components) == 3:
+        return ("affinity", "layout", "theta")
+    return ("layout", "theta")
+
+def subset_path_fields(components):
+    if components[0] == SUBSET_MULTIPLE_GROUP_EXPERIMENT:
+        return ("subset_experiment_type", "access_num_group")
+    return ("subset_experiment_type", "subset_ratio")
+
+# Result file -> (directory fields below the result dir, x column, y column)
+STORE_LAYOUTS = {
+    "projectivity.csv" : (("layout", "operator", "column_count", "write_ratio"), "projectivity", "stat"),
+    "selectivity.csv" : (("layout", "operator", "column_count", "write_ratio"), "selectivity", "stat"),
+    "operator.csv" : (("layout", "projectivity", "column_count", "write_ratio"), "selectivity", "stat"),
+    "horizontal.csv" : (("tuples_per_tg", "column_count", "write_ratio"), "selectivity", "stat"),
+    "caching.csv" : (("tuples_per_tg", "column_count", "write_ratio"), "selectivity", "stat"),
+    "subset.csv" : (subset_path_fields, "selectivity", "stat"),
+    "adapt.csv" : (("column_count", "layout"), "txn_itr", "stat"),
+    "hyrise.csv" : (("column_count", "layout"), "txn_itr", "stat"),
+    "weight.csv" : (("sample_weight",), "txn_itr", "split_point"),
+    "reorg.csv" : (("scale_factor", "layout"), "txn_itr", "stat"),
+    "distribution.csv" : (("tile_group_type",), "txn_itr", "stat"),
+    "join.csv" : (("layout", "operator", "column_count"), "projectivity", "stat"),
+    "concurrency.csv" : (concurrency_path_fields, "sample_weight", "stat"),
+    "ycsb.csv" : (("layout", "column_count"), "operator", "stat"),
+}
+###################################################################################
+# UTILS
+###################################################################################
+
+def open_results(result_dir, result_file_name):
+    path_fields, x_column, y_column = STORE_LAYOUTS[result_file_name]
+    return store.open_store(result_dir, result_file_name, path_fields, x_column, y_column)
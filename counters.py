@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+###################################################################################
+# HARDWARE COUNTERS
+###################################################################################
+
+from __future__ import print_function
+import os
+import logging
+import collections
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# perf writes its machine-readable output here, next to the summary file
+PERF_OUTPUT_FILE = "perf.csv"
+PERF_SEPARATOR = ","
+
+# Sidecar table in each result directory
+COUNTERS_FILE_NAME = "counters.csv"
+
+###################################################################################
+# COLLECTOR
+###################################################################################
+
+class CounterCollector(object):
+    """ Runs a command under `perf stat -x,` and reads the counters back.
+    """
+
+    def __init__(self, perf, events):
+        self.perf = perf
+        self.events = tuple(events)
+
+    def wrap(self, command, output_file=PERF_OUTPUT_FILE):
+        return [self.perf, "stat",
+                "-x", PERF_SEPARATOR,
+                "-o", output_file,
+                "-e", ",".join(self.events)] + list(command)
+
+    def read(self, output_file=PERF_OUTPUT_FILE):
+        if not os.path.exists(output_file):
+            LOG.warning("No perf output in %s", output_file)
+            return collections.OrderedDict((event, None) for event in self.events)
+
+        fp = open(output_file)
+        counters = parse_perf_output(fp.read())
+        fp.close()
+
+        return collections.OrderedDict((event, counters.get(event)) for event in self.events)
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def parse_perf_output(text):
+    """ Counters of `perf stat -x,` output: value,unit,event,... per line.
+        Events perf could not count are None.
+    """
+    counters = collections.OrderedDict()
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        fields = line.split(PERF_SEPARATOR)
+        if len(fields) < 3:
+            continue
+
+        value, event = fields[0], fields[2]
+        # cycles:u -> cycles
+        event = event.split(":")[0]
+        try:
+            counters[event] = float(value)
+        except ValueError:
+            # <not counted>, <not supported>
+            counters[event] = None
+
+    return counters
+
+def mean_counters(samples):
+    """ Per-event mean over runs, ignoring runs where the event was not counted.
+    """
+    samples = [sample for sample in samples if sample]
+    if not samples:
+        return None
+
+    means = collections.OrderedDict()
+    for event in samples[0]:
+        values = [sample[event] for sample in samples if sample.get(event) is not None]
+        means[event] = sum(values) / len(values) if values else None
+    return means
+
+def derive_counters(counters, tuple_count=None):
+    """ Add IPC and, given the number of tuples processed, misses per tuple.
+        Runs covering a whole grid of configurations have no such count, so
+        their tables get no per-tuple columns.
+    """
+    derived = collections.OrderedDict(counters)
+
+    cycles = counters.get("cycles")
+    instructions = counters.get("instructions")
+    derived["ipc"] = instructions / cycles if cycles and instructions is not None else None
+
+    if not tuple_count:
+        return derived
+
+    for event, value in counters.items():
+        if "misses" in event:
+            per_tuple = value / float(tuple_count) if value is not None else None
+            derived[event + "-per-tuple"] = per_tuple
+
+    return derived
+
+def format_counter(value):
+    if value is None:
+        return ""
+    if value == int(value):
+        return str(int(value))
+    return "%.6f" % value
+
+def write_counters(result_dir, key_fields, key, counters):
+    """ Append one row to the result directory's counter table. The key
+        identifies the configuration the same way the summary line does.
+    """
+    if not os.path.exists(result_dir):
+        os.makedirs(result_dir)
+
+    file_name = os.path.join(result_dir, COUNTERS_FILE_NAME)
+    new_file = not os.path.exists(file_name)
+
+    fp = open(file_name, "a")
+    if new_file:
+        fp.write(" , ".join(list(key_fields) + list(counters.keys())) + "\n")
+    fp.write(" , ".join([str(value) for value in key] +
+                        [format_counter(value) for value in counters.values()]) + "\n")
+    fp.close()
@@ -0,0 +1,481 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RESULTS DASHBOARD
+###################################################################################
+
+from __future__ import print_function
+import os
+import math
+import time
+import json
+import logging
+import argparse
+import collections
+
+import numpy as np
+
+import store
+import downsample
+from config import STORE_LAYOUTS
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+RESULTS_DIR = BASE_DIR + "/results/"
+
+DASHBOARD_FILE = "dashboard.html"
+
+DASHBOARD_TITLE = "Tile Group Experiments"
+
+# Columns the dashboard filters every experiment on, where it has them
+FILTER_FIELDS = ("layout", "operator", "column_count", "write_ratio")
+
+# Experiments with at most this many x values get one table column per x,
+# the others one row of count, mean, min and max per series
+PIVOT_MAX_X = 12
+
+# Chart size in pixels; series are downsampled to the chart width
+CHART_WIDTH = 480
+CHART_HEIGHT = 220
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def find_experiments(results_dir=RESULTS_DIR):
+    """ (name, result dir, result file name) of every experiment in the tree.
+    """
+    experiments = []
+    for result_file_name in sorted(STORE_LAYOUTS):
+        name = os.path.splitext(result_file_name)[0]
+        result_dir = os.path.join(results_dir, name) + "/"
+        if os.path.isdir(result_dir):
+            experiments.append((name, result_dir, result_file_name))
+    return experiments
+
+def is_missing(value):
+    return value == "" or value == -1 or (isinstance(value, float) and math.isnan(value))
+
+def format_value(value):
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value.is_integer():
+            return str(int(value))
+        return "%g" % value
+    return str(value)
+
+def clean_number(value):
+    # JSON has no NaN
+    value = float(value)
+    return None if math.isnan(value) or math.isinf(value) else value
+
+def is_number(value):
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+def to_number(value):
+    return float(value) if is_number(value) else 0.0
+
+def sort_key(key):
+    return [(isinstance(value, float) and math.isnan(value), value) for value in key]
+
+def get_values(data, name):
+    # every NaN is a distinct float, so they would never group
+    return set(None if isinstance(value, float) and math.isnan(value) else value
+               for value in data[name].tolist())
+
+def get_fields(data, path_fields, x_column, y_column):
+    """ Columns that tell the experiment's series apart, and those every row
+        shares. Series are the directories of the result tree; experiments
+        whose directory levels vary are split on every column that varies.
+    """
+    if callable(path_fields):
+        candidates = store.INDEX_COLUMNS
+    else:
+        candidates = path_fields
+
+    series_fields = []
+    constants = collections.OrderedDict()
+    for name in store.INDEX_COLUMNS:
+        if name in (x_column, y_column):
+            continue
+        values = get_values(data, name)
+        if len(values) > 1 and name in candidates:
+            series_fields.append(name)
+        elif len(values) == 1:
+            value = values.pop()
+            if value is not None and not is_missing(value):
+                constants[name] = format_value(value)
+    return series_fields, constants
+
+###################################################################################
+# AGGREGATES
+###################################################################################
+
+def summarize_experiment(name, results, path_fields):
+    """ Series, aggregates and table rows of one experiment, ready for JSON.
+    """
+    data = results.frozen()
+    x_column, y_column = results.x_column, results.y_column
+    series_fields, constants = get_fields(data, path_fields, x_column, y_column)
+
+    # categorical x axes (ycsb operations) are drawn at their index
+    categorical = data[x_column].dtype.kind == "U"
+    if categorical:
+        x_labels = sorted(set(data[x_column].tolist()))
+        x_values = np.array([x_labels.index(value) for value in data[x_column].tolist()], dtype=float)
+    else:
+        x_labels = None
+        x_values = data[x_column].astype(float)
+    y_values = data[y_column].astype(float)
+
+    groups = collections.OrderedDict()
+    keys = zip(*[data[field].tolist() for field in series_fields]) if series_fields else [()] * len(data)
+    for row_id, key in enumerate(keys):
+        groups.setdefault(tuple(key), []).append(row_id)
+
+    distinct_x = np.unique(x_values[~np.isnan(x_values)])
+    pivot = len(distinct_x) <= PIVOT_MAX_X
+
+    series = []
+    for key in sorted(groups, key=sort_key):
+        row_ids = np.array(groups[key])
+        order = np.argsort(x_values[row_ids], kind="mergesort")
+        points = np.column_stack((x_values[row_ids][order], y_values[row_ids][order]))
+        valid = points[~np.isnan(points[:, 1])]
+
+        entry = collections.OrderedDict()
+        entry["key"] = ["" if is_missing(value) else format_value(value) for value in key]
+        entry["count"] = len(valid)
+        entry["mean"] = clean_number(valid[:, 1].mean()) if len(valid) else None
+        entry["min"] = clean_number(valid[:, 1].min()) if len(valid) else None
+        entry["max"] = clean_number(valid[:, 1].max()) if len(valid) else None
+        if pivot:
+            # repeated x values are averaged
+            entry["cells"] = [clean_number(valid[valid[:, 0] == x_value, 1].mean())
+                              if (valid[:, 0] == x_value).any() else None
+                              for x_value in distinct_x]
+        chart_points = downsample.downsample(valid, CHART_WIDTH)
+        entry["points"] = [[clean_number(x_value), clean_number(y_value)]
+                           for x_value, y_value in chart_points]
+        series.append(entry)
+
+    # mean of every layout over the whole experiment
+    layout_means = collections.OrderedDict()
+    layouts = data["layout"].tolist()
+    for layout in sorted(set(layouts)):
+        if layout:
+            values = y_values[(data["layout"] == layout) & ~np.isnan(y_values)]
+            if len(values):
+                layout_means[layout] = clean_number(values.mean())
+
+    summary = collections.OrderedDict()
+    summary["name"] = name
+    summary["x"] = x_column
+    summary["y"] = y_column
+    summary["rows"] = len(data)
+    summary["fields"] = series_fields
+    summary["constants"] = constants
+    summary["x_labels"] = x_labels
+    summary["pivot"] = [x_labels[int(x_value)] if categorical else format_value(float(x_value))
+                        for x_value in distinct_x] if pivot else None
+    summary["layout_means"] = layout_means
+    summary["series"] = series
+    return summary
+
+def collect_dashboard(results_dir=RESULTS_DIR):
+    """ Summaries of every experiment and the values of every filter.
+    """
+    experiments = []
+    for name, result_dir, result_file_name in find_experiments(results_dir):
+        path_fields, x_column, y_column = STORE_LAYOUTS[result_file_name]
+        results = store.open_store(result_dir, result_file_name, path_fields, x_column, y_column)
+        if len(results) == 0:
+            continue
+        experiments.append(summarize_experiment(name, results, path_fields))
+
+    filters = collections.OrderedDict()
+    for field in FILTER_FIELDS:
+        values = set()
+        for experiment in experiments:
+            if field in experiment["fields"]:
+                index = experiment["fields"].index(field)
+                values.update(entry["key"][index] for entry in experiment["series"])
+            elif field in experiment["constants"]:
+                values.add(experiment["constants"][field])
+        if values:
+            filters[field] = sorted(values, key=lambda value: (not is_number(value), to_number(value), value))
+
+    return {"title" : DASHBOARD_TITLE, "filters" : filters, "experiments" : experiments,
+            "chart" : [CHART_WIDTH, CHART_HEIGHT]}
+
+###################################################################################
+# HTML
+###################################################################################
+
+# One self-contained page: the summaries as JSON, styles and the script that
+# draws tables and SVG charts from them. Nothing is fetched from the network.
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+body { font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 20px; color: #222; }
+h1 { font-size: 20px; margin: 0 0 10px 0; }
+h2 { font-size: 16px; margin: 24px 0 4px 0; border-bottom: 1px solid #ccc; }
+#filters { position: sticky; top: 0; background: #fff; padding: 8px 0; border-bottom: 1px solid #ccc; }
+#filters label { margin-right: 14px; }
+table { border-collapse: collapse; margin: 6px 0; }
+th, td { border: 1px solid #ddd; padding: 2px 6px; text-align: right; }
+th { background: #f3f3f3; }
+td.key, th.key { text-align: left; }
+.note { color: #777; }
+.experiment { display: flex; flex-wrap: wrap; gap: 16px; align-items: flex-start; }
+svg text { font-size: 10px; fill: #444; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<div id="filters"></div>
+<h2>Overview</h2>
+<div id="overview"></div>
+<div id="experiments"></div>
+<script type="application/json" id="data">__DATA__</script>
+<script>
+(function () {
+  var DATA = JSON.parse(document.getElementById("data").textContent);
+  var COLORS = ["#F58A87", "#80CA86", "#9EC9E9", "#FED113", "#D89761",
+                "#8E7CC3", "#555555", "#C27BA0", "#6FA8DC", "#93C47D"];
+  var selected = {};
+
+  function el(tag, attrs, text) {
+    var node = document.createElement(tag);
+    for (var name in attrs || {}) { node.setAttribute(name, attrs[name]); }
+    if (text !== undefined) { node.textContent = text; }
+    return node;
+  }
+
+  function svg(tag, attrs) {
+    var node = document.createElementNS("http://www.w3.org/2000/svg", tag);
+    for (var name in attrs || {}) { node.setAttribute(name, attrs[name]); }
+    return node;
+  }
+
+  function number(value) {
+    if (value === null || value === undefined) { return "-"; }
+    var magnitude = Math.abs(value);
+    if (magnitude !== 0 && (magnitude >= 1e6 || magnitude < 1e-3)) { return value.toExponential(3); }
+    return String(Math.round(value * 1000) / 1000);
+  }
+
+  function matches(experiment, entry) {
+    for (var field in selected) {
+      if (selected[field] === "") { continue; }
+      var index = experiment.fields.indexOf(field);
+      if (index >= 0 && entry.key[index] !== selected[field]) { return false; }
+      if (index < 0 && field in experiment.constants && experiment.constants[field] !== selected[field]) { return false; }
+    }
+    return true;
+  }
+
+  function label(experiment, entry) {
+    var parts = [];
+    for (var i = 0; i < experiment.fields.length; i++) { parts.push(experiment.fields[i] + "=" + entry.key[i]); }
+    return parts.join(" ") || experiment.name;
+  }
+
+  function drawChart(experiment, series) {
+    var width = DATA.chart[0], height = DATA.chart[1], left = 56, bottom = 20, top = 8, right = 8;
+    var chart = svg("svg", {width: width, height: height});
+    var xMin = Infinity, xMax = -Infinity, yMin = Infinity, yMax = -Infinity;
+    series.forEach(function (entry) {
+      entry.points.forEach(function (point) {
+        if (point[0] === null || point[1] === null) { return; }
+        xMin = Math.min(xMin, point[0]); xMax = Math.max(xMax, point[0]);
+        yMin = Math.min(yMin, point[1]); yMax = Math.max(yMax, point[1]);
+      });
+    });
+    if (xMin > xMax) { return chart; }
+    yMin = Math.min(yMin, 0);
+    if (xMax === xMin) { xMax = xMin + 1; }
+    if (yMax === yMin) { yMax = yMin + 1; }
+
+    function sx(x) { return left + (x - xMin) / (xMax - xMin) * (width - left - right); }
+    function sy(y) { return height - bottom - (y - yMin) / (yMax - yMin) * (height - top - bottom); }
+
+    chart.appendChild(svg("line", {x1: left, y1: sy(yMin), x2: width - right, y2: sy(yMin), stroke: "#999"}));
+    chart.appendChild(svg("line", {x1: left, y1: top, x2: left, y2: height - bottom, stroke: "#999"}));
+    [[yMin, sy(yMin)], [yMax, sy(yMax)]].forEach(function (tick) {
+      var text = svg("text", {x: left - 4, y: tick[1] + 3, "text-anchor": "end"});
+      text.textContent = number(tick[0]);
+      chart.appendChild(text);
+    });
+    [[xMin, "start"], [xMax, "end"]].forEach(function (tick) {
+      var text = svg("text", {x: sx(tick[0]), y: height - 6, "text-anchor": tick[1]});
+      text.textContent = experiment.x_labels ? experiment.x_labels[tick[0]] : number(tick[0]);
+      chart.appendChild(text);
+    });
+
+    series.forEach(function (entry) {
+      var coordinates = [];
+      entry.points.forEach(function (point) {
+        if (point[0] !== null && point[1] !== null) { coordinates.push(sx(point[0]).toFixed(1) + "," + sy(point[1]).toFixed(1)); }
+      });
+      var line = svg("polyline", {points: coordinates.join(" "), fill: "none",
+                                  stroke: COLORS[entry.index % COLORS.length], "stroke-width": 1.5});
+      var title = svg("title");
+      title.textContent = label(experiment, entry);
+      line.appendChild(title);
+      chart.appendChild(line);
+    });
+    return chart;
+  }
+
+  function drawTable(experiment, series) {
+    var table = el("table");
+    var head = el("tr");
+    head.appendChild(el("th", {}, ""));
+    experiment.fields.forEach(function (field) { head.appendChild(el("th", {"class": "key"}, field)); });
+    var columns = experiment.pivot || ["points", "mean", "min", "max"];
+    columns.forEach(function (column) {
+      head.appendChild(el("th", {}, experiment.pivot ? experiment.x + "=" + column : column));
+    });
+    table.appendChild(head);
+
+    series.forEach(function (entry) {
+      var row = el("tr");
+      var swatch = el("td", {style: "background:" + COLORS[entry.index % COLORS.length]}, "");
+      row.appendChild(swatch);
+      entry.key.forEach(function (value) { row.appendChild(el("td", {"class": "key"}, value)); });
+      var cells = experiment.pivot ? entry.cells : [entry.count, entry.mean, entry.min, entry.max];
+      cells.forEach(function (value) { row.appendChild(el("td", {}, number(value))); });
+      table.appendChild(row);
+    });
+    return table;
+  }
+
+  function render() {
+    var overview = el("table");
+    var head = el("tr");
+    ["experiment", "rows", "series", "x", "y", "mean by layout"].forEach(function (name) {
+      head.appendChild(el("th", {"class": "key"}, name));
+    });
+    overview.appendChild(head);
+
+    var container = document.getElementById("experiments");
+    container.innerHTML = "";
+
+    DATA.experiments.forEach(function (experiment) {
+      var series = [];
+      experiment.series.forEach(function (entry, index) {
+        entry.index = index;
+        if (matches(experiment, entry)) { series.push(entry); }
+      });
+
+      var means = [];
+      for (var layout in experiment.layout_means) { means.push(layout + " " + number(experiment.layout_means[layout])); }
+      var row = el("tr");
+      var link = el("a", {href: "#" + experiment.name}, experiment.name);
+      var cell = el("td", {"class": "key"});
+      cell.appendChild(link);
+      row.appendChild(cell);
+      [experiment.rows, series.length + " / " + experiment.series.length, experiment.x, experiment.y,
+       means.join(", ")].forEach(function (value) { row.appendChild(el("td", {"class": "key"}, String(value))); });
+      overview.appendChild(row);
+
+      container.appendChild(el("h2", {id: experiment.name}, experiment.name + " (" + experiment.y + " over " + experiment.x + ")"));
+      var constants = [];
+      for (var field in experiment.constants) { constants.push(field + " = " + experiment.constants[field]); }
+      if (constants.length) { container.appendChild(el("div", {"class": "note"}, constants.join(", "))); }
+      if (!series.length) {
+        container.appendChild(el("div", {"class": "note"}, "No series match the filters."));
+        return;
+      }
+      var body = el("div", {"class": "experiment"});
+      body.appendChild(drawChart(experiment, series));
+      body.appendChild(drawTable(experiment, series));
+      container.appendChild(body);
+    });
+
+    var target = document.getElementById("overview");
+    target.innerHTML = "";
+    target.appendChild(overview);
+  }
+
+  var filters = document.getElementById("filters");
+  Object.keys(DATA.filters).forEach(function (field) {
+    var select = el("select");
+    select.appendChild(el("option", {value: ""}, "all"));
+    DATA.filters[field].forEach(function (value) { select.appendChild(el("option", {value: value}, value)); });
+    select.addEventListener("change", function () { selected[field] = select.value; render(); });
+    var wrapper = el("label", {}, field + " ");
+    wrapper.appendChild(select);
+    filters.appendChild(wrapper);
+    selected[field] = "";
+  });
+
+  render();
+})();
+</script>
+</body>
+</html>
+"""
+
+def render_dashboard(dashboard):
+    # "</" would end the script element early
+    data = json.dumps(dashboard, separators=(",", ":")).replace("</", "<\\/")
+    title = dashboard["title"].replace("&", "&amp;").replace("<", "&lt;")
+    return DASHBOARD_TEMPLATE.replace("__TITLE__", title).replace("__DATA__", data)
+
+def write_dashboard(results_dir=RESULTS_DIR, output=DASHBOARD_FILE):
+    start = time.time()
+
+    dashboard = collect_dashboard(results_dir)
+    page = render_dashboard(dashboard)
+
+    temp_path = output + ".tmp"
+    fp = open(temp_path, "w")
+    fp.write(page)
+    fp.close()
+    os.rename(temp_path, output)
+
+    LOG.info("OUTPUT: %s (%d experiments, %.1f KB in %.3f s)", output,
+             len(dashboard["experiments"]), len(page) / 1024.0, time.time() - start)
+
+###################################################################################
+# MAIN
+###################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Write a static HTML dashboard of results/')
+
+    parser.add_argument("--results", help='result tree', default=RESULTS_DIR)
+    parser.add_argument("--output", help='dashboard file', default=DASHBOARD_FILE)
+
+    args = parser.parse_args()
+
+    write_dashboard(args.results, args.output)
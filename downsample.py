@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+###################################################################################
+# SERIES DOWNSAMPLING
+###################################################################################
+
+from __future__ import print_function
+import logging
+
+import numpy as np
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Vertices kept per pixel of figure width. A line cannot show more detail
+# than its width in pixels, the rest only slows rendering and bloats the PDF.
+# Zero or less keeps every point.
+POINTS_PER_PIXEL = 1.0
+
+# How a long series is reduced to its point budget.
+#   lttb   : largest-triangle-three-buckets, keeps the points that shape the
+#            line, for smooth series
+#   minmax : lowest and highest point of every bucket, keeps every spike, for
+#            noisy series
+#   none   : keep every point
+DOWNSAMPLE_METHODS = ("lttb", "minmax", "none")
+
+DOWNSAMPLE_METHOD = "lttb"
+
+###################################################################################
+# METHODS
+###################################################################################
+
+def lttb(points, threshold):
+    """ threshold of the [x, y] rows, x sorted, by largest-triangle-three-
+        buckets: the first and last row, then from every bucket in between
+        the row spanning the largest triangle with the row kept before it and
+        the mean of the next bucket.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return points
+
+    x, y = points[:, 0], points[:, 1]
+    # inner buckets [edges[i], edges[i + 1]), the last row is a bucket of its own
+    edges = np.floor(np.linspace(1, count - 1, threshold - 1)).astype(int)
+    edges = np.append(edges, count)
+
+    selected = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        mean_x = x[next_start:next_end].mean()
+        mean_y = y[next_start:next_end].mean()
+
+        areas = np.abs((x[previous] - mean_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (mean_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected.append(previous)
+
+    selected.append(count - 1)
+    return points[selected]
+
+def minmax(points, threshold):
+    """ At most threshold of the [x, y] rows, x sorted: the first and last
+        row, and the lowest and highest row of (threshold - 2) / 2 equal
+        buckets in between, in x order.
+    """
+    count = len(points)
+    buckets = (threshold - 2) // 2
+    if threshold >= count or buckets < 1:
+        return points
+
+    y = points[:, 1]
+    edges = np.floor(np.linspace(0, count, buckets + 1)).astype(int)
+
+    selected = [0, count - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        selected.append(start + int(np.argmin(y[start:end])))
+        selected.append(start + int(np.argmax(y[start:end])))
+
+    return points[np.unique(selected)]
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def get_point_budget(width, points_per_pixel=None):
+    """ Vertices a series drawn width pixels wide keeps, None for all of them.
+    """
+    if points_per_pixel is None:
+        points_per_pixel = POINTS_PER_PIXEL
+    if points_per_pixel <= 0:
+        return None
+    return max(3, int(width * points_per_pixel))
+
+def downsample(points, width, points_per_pixel=None, method=None):
+    """ [x, y] rows of a series drawn width pixels wide, reduced to its point
+        budget with the given method.
+    """
+    if method is None:
+        method = DOWNSAMPLE_METHOD
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError("Unknown downsampling method %s" % method)
+
+    threshold = get_point_budget(width, points_per_pixel)
+    points = np.asarray(points, dtype=float)
+    if method == "none" or threshold is None or len(points) <= threshold:
+        return points
+
+    reduced = lttb(points, threshold) if method == "lttb" else minmax(points, threshold)
+    LOG.debug("Downsampled %d points to %d (%s)", len(points), len(reduced), method)
+    return reduced
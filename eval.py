@@ -9,41 +9,42 @@ import os
 import subprocess
 import argparse
 import pprint
-import numpy
 import sys
 import re
 import logging
 import fnmatch
 import string
-import argparse
-import pylab
 import datetime
 import math
 import time
 import fileinput
-from lxml import etree
 import random
+import collections
 
-import numpy as np
-import matplotlib.pyplot as plot
-
-from matplotlib.font_manager import FontProperties
-from matplotlib.ticker import MaxNLocator
-from matplotlib.ticker import LogLocator
-from matplotlib.ticker import LinearLocator
 from pprint import pprint, pformat
-from matplotlib.backends.backend_pdf import PdfPages
-from matplotlib import rc
 from operator import add
-import matplotlib.font_manager as font_manager
 
 import csv
-import brewer2mpl
-import matplotlib
 
 from options import *
+from config import *
 from functools import wraps
 
+import sweep
+import runcache
+import repetition
+import counters
+import progress
+import watchdog
+import spec
+import refine
+import latency
+import topology
+import rusage
+import downsample
+import analytics
+from writers import ResultWriterPool
+
 ###################################################################################
 # LOGGING CONFIGURATION
 ###################################################################################
@@ -59,177 +60,36 @@ LOG.addHandler(LOG_handler)
 LOG.setLevel(logging.INFO)
 
 ###################################################################################
-# OUTPUT CONFIGURATION
+# CONFIGURATION
 ###################################################################################
 
-BASE_DIR = os.path.dirname(__file__)
-OPT_FONT_NAME = 'Helvetica'
-OPT_GRAPH_HEIGHT = 300
-OPT_GRAPH_WIDTH = 400
-
-# Make a list by cycling through the colors you care about
-# to match the length of your data.
-NUM_COLORS = 5
-COLOR_MAP = ( '#F58A87', '#80CA86', '#9EC9E9', '#FED113', '#D89761' )
-
-OPT_COLORS = COLOR_MAP
-
-OPT_GRID_COLOR = 'gray'
-OPT_LEGEND_SHADOW = False
-OPT_MARKERS = (['o', 's', 'v', "^", "h", "v", ">", "x", "d", "<", "|", "", "|", "_"])
-OPT_PATTERNS = ([ "////", "////", "o", "o", "\\\\" , "\\\\" , "//////", "//////", ".", "." , "\\\\\\" , "\\\\\\" ])
-
-OPT_LABEL_WEIGHT = 'bold'
-OPT_LINE_COLORS = COLOR_MAP
-OPT_LINE_WIDTH = 3.0
-OPT_MARKER_SIZE = 6.0
-
-AXIS_LINEWIDTH = 1.3
-BAR_LINEWIDTH = 1.2
-
-# SET FONT
-
-LABEL_FONT_SIZE = 14
-TICK_FONT_SIZE = 12
-TINY_FONT_SIZE = 8
-LEGEND_FONT_SIZE = 16
-
-SMALL_LABEL_FONT_SIZE = 10
-SMALL_LEGEND_FONT_SIZE = 10
-
-AXIS_LINEWIDTH = 1.3
-BAR_LINEWIDTH = 1.2
+# Parallel workers for per-configuration sweeps (see sweep.py)
+SWEEP_WORKERS = sweep.CPU_COUNT
 
-# SET FONT
+# Wipe result directories and their run journals before an eval (--force)
+FORCE_CLEAN = False
 
-LABEL_FONT_SIZE = 14
-TICK_FONT_SIZE = 12
-TINY_FONT_SIZE = 8
-LEGEND_FONT_SIZE = 16
+# Serve per-configuration sweeps through a shared work queue (--queue)
+QUEUE_DIR = None
 
-SMALL_LABEL_FONT_SIZE = 10
-SMALL_LEGEND_FONT_SIZE = 10
+# Sweep concurrency over affinity policies and thread counts (--affinity-sweep)
+CONCURRENCY_AFFINITY_SWEEP = False
 
-AXIS_LINEWIDTH = 1.3
-BAR_LINEWIDTH = 1.2
+# Run the caching sweep over every layout, for the memory chart (--memory-layouts)
+MEMORY_LAYOUTS = False
 
-# SET TYPE1 FONTS
-matplotlib.rcParams['ps.useafm'] = True
-matplotlib.rcParams['font.family'] = OPT_FONT_NAME
-matplotlib.rcParams['pdf.use14corefonts'] = True
-#matplotlib.rcParams['text.usetex'] = True
-#matplotlib.rcParams['text.latex.preamble']=[r'\usepackage{euler}']
+# Time limits and retries of every run
+WATCHDOG_POLICY = watchdog.WatchdogPolicy(TIMEOUT_FACTOR, MIN_TIMEOUT, RETRY_COUNT, RETRY_BACKOFF)
 
-LABEL_FP = FontProperties(style='normal', size=LABEL_FONT_SIZE, weight='bold')
-TICK_FP = FontProperties(style='normal', size=TICK_FONT_SIZE)
-TINY_FP = FontProperties(style='normal', size=TINY_FONT_SIZE)
-LEGEND_FP = FontProperties(style='normal', size=LEGEND_FONT_SIZE, weight='bold')
+# Record hardware counters of every run (--counters)
+COLLECT_COUNTERS = False
 
-SMALL_LABEL_FP = FontProperties(style='normal', size=SMALL_LABEL_FONT_SIZE, weight='bold')
-SMALL_LEGEND_FP = FontProperties(style='normal', size=SMALL_LEGEND_FONT_SIZE, weight='bold')
+# Repetitions of the experiments in REPEATED_EXPERIMENTS
+REPETITION_POLICY = repetition.RepetitionPolicy(WARMUP_RUNS, MIN_RUNS, MAX_RUNS, CI_TARGET)
 
-YAXIS_TICKS = 3
-YAXIS_ROUND = 1000.0
-
-###################################################################################
-# CONFIGURATION
-###################################################################################
-
-BASE_DIR = os.path.dirname(os.path.realpath(__file__))
-
-PELOTON_BUILD_DIR = BASE_DIR + "/../peloton/build"
-HYADAPT = PELOTON_BUILD_DIR + "/src/hyadapt"
-YCSB = PELOTON_BUILD_DIR + "/src/ycsb"
-PERF = "/usr/bin/perf_3.9.0-7"
-
-OUTPUT_FILE = "outputfile.summary"
-
-PROJECTIVITY_DIR = BASE_DIR + "/results/projectivity/"
-SELECTIVITY_DIR = BASE_DIR + "/results/selectivity/"
-OPERATOR_DIR = BASE_DIR + "/results/operator/"
-YCSB_DIR = BASE_DIR + "/results/ycsb/"
-HORIZONTAL_DIR = BASE_DIR + "/results/horizontal/"
-SUBSET_DIR = BASE_DIR + "/results/subset/"
-ADAPT_DIR = BASE_DIR + "/results/adapt/"
-WEIGHT_DIR = BASE_DIR + "/results/weight/"
-REORG_DIR = BASE_DIR + "/results/reorg/"
-DISTRIBUTION_DIR = BASE_DIR + "/results/distribution/"
-JOIN_DIR = BASE_DIR + "/results/join/"
-CACHING_DIR = BASE_DIR + "/results/caching/"
-HYRISE_DIR = BASE_DIR + "/results/hyrise/"
-CONCURRENCY_DIR = BASE_DIR + "/results/concurrency/"
-
-LAYOUTS = ("row", "column", "hybrid")
-OPERATORS = ("direct", "aggregate")
-REORG_LAYOUTS = ("row", "hybrid")
-HYRISE_LAYOUTS = ("row", "hybrid")
-
-SCALE_FACTOR = 1000.0
-
-SELECTIVITY = (0.2, 0.4, 0.6, 0.8, 1.0)
-PROJECTIVITY = (0.01, 0.1, 0.5)
-SUBSET_RATIOS = (0.2, 0.4, 0.6, 0.8, 1)
-ACCESS_NUM_GROUPS = (1, 2, 4, 8, 16)
-
-SUBSET_SINGLE_GROUP_EXPERIMENT = "1"
-SUBSET_MULTIPLE_GROUP_EXPERIMENT = "2"
-
-OP_PROJECTIVITY = (0.01, 0.1, 1.0)
-OP_COLUMN_COUNT = 100
-OP_SELECTIVITY = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
-
-COLUMN_COUNTS = (50, 500)
-WRITE_RATIOS = (0, 1)
-TUPLES_PER_TILEGROUP = (100, 1000, 10000, 100000)
-NUM_GROUPS = 5
-
-SCAN_RATIOS = (0, 0.5, 0.9, 1)
-THREAD_COUNTS = (1, 2, 4, 8, 16)
-
-THETAS = (0, 0.5)
-DIST_TILE_GROUP_TYPES = 3
-
-TRANSACTION_COUNT = 3
-
-CONCURRENCY_TRANSACTION_COUNT = 1000
-CONCURRENCY_SCALE_FACTOR = 100
-
-NUM_ADAPT_TESTS = 12
-REPEAT_ADAPT_TEST = 25
-ADAPT_QUERY_COUNT = NUM_ADAPT_TESTS * REPEAT_ADAPT_TEST
-
-NUM_HYRISE_TESTS = 4
-REPEAT_HYRISE_TEST = 100
-HYRISE_QUERY_COUNT = NUM_HYRISE_TESTS * REPEAT_HYRISE_TEST
-
-SAMPLE_WEIGHTS = (0.0001, 0.001, 0.01, 0.1)
-NUM_WEIGHT_TEST = 10
-REPEAT_WEIGHT_TEST = 1000
-WEIGHT_QUERY_COUNT = NUM_WEIGHT_TEST * REPEAT_WEIGHT_TEST
-
-REORG_QUERY_COUNT = 25 * 4
-DIST_QUERY_COUNT = 13
-
-PROJECTIVITY_EXPERIMENT = 1
-SELECTIVITY_EXPERIMENT = 2
-OPERATOR_EXPERIMENT = 3
-HORIZONTAL_EXPERIMENT= 4
-SUBSET_EXPERIMENT= 5
-ADAPT_EXPERIMENT = 6
-WEIGHT_EXPERIMENT = 7
-REORG_EXPERIMENT = 8
-DISTRIBUTION_EXPERIMENT = 9
-JOIN_EXPERIMENT = 10
-CACHING_EXPERIMENT = 11
-HYRISE_EXPERIMENT = 13
-CONCURRENCY_EXPERIMENT = 14
-
-YCSB_EXPERIMENT = 1
-
-YCSB_SCALE_FACTOR = 100.0
-YCSB_rRANSACTION_COUNT = 100
-
-YCSB_OPERATIONS = ["Read", "Scan", "Insert", "Delete", "Update", "RMW"]
+# Vertices per pixel of width kept of long series, and how (--points-per-pixel, --downsample)
+POINTS_PER_PIXEL = downsample.POINTS_PER_PIXEL
+DOWNSAMPLE_METHOD = downsample.DOWNSAMPLE_METHOD
 
 ###################################################################################
 # UTILS
@@ -241,1384 +101,41 @@ def chunks(l, n):
     for i in xrange(0, len(l), n):
         yield l[i:i + n]
 
-def loadDataFile(n_rows, n_cols, path):
-    file = open(path, "r")
-    reader = csv.reader(file)
-
-    data = [[0 for x in xrange(n_cols)] for y in xrange(n_rows)]
-
-    row_num = 0
-    for row in reader:
-        column_num = 0
-        for col in row:
-            data[row_num][column_num] = float(col)
-            column_num += 1
-        row_num += 1
-
-    return data
-
-def next_power_of_10(n):
-    return (10 ** math.ceil(math.log(n, 10)))
-
-def get_upper_bound(n):
-    return (math.ceil(n / YAXIS_ROUND) * YAXIS_ROUND)
-
-# # MAKE GRID
-def makeGrid(ax):
-    axes = ax.get_axes()
-    axes.yaxis.grid(True, color=OPT_GRID_COLOR)
-    for axis in ['top','bottom','left','right']:
-            ax.spines[axis].set_linewidth(AXIS_LINEWIDTH)
-    ax.set_axisbelow(True)
-
-# # SAVE GRAPH
-def saveGraph(fig, output, width, height):
-    size = fig.get_size_inches()
-    dpi = fig.get_dpi()
-    LOG.debug("Current Size Inches: %s, DPI: %d" % (str(size), dpi))
-
-    new_size = (width / float(dpi), height / float(dpi))
-    fig.set_size_inches(new_size)
-    new_size = fig.get_size_inches()
-    new_dpi = fig.get_dpi()
-    LOG.debug("New Size Inches: %s, DPI: %d" % (str(new_size), new_dpi))
-
-    pp = PdfPages(output)
-    fig.savefig(pp, format='pdf', bbox_inches='tight')
-    pp.close()
-    LOG.info("OUTPUT: %s", output)
-
-###################################################################################
-# PLOT
-###################################################################################
-
-def create_bar_legend():
-    fig = pylab.figure()
-    ax1 = fig.add_subplot(111)
-
-    figlegend = pylab.figure(figsize=(9, 0.5))
-
-    num_items = len(LAYOUTS);
-    ind = np.arange(1)
-    margin = 0.10
-    width = ((1.0 - 2 * margin) / num_items) * 2
-    data = [1]
-
-    bars = [None] * (len(LAYOUTS) + 1) * 2
-
-    # TITLE
-    idx = 0
-    bars[idx] = ax1.bar(ind + margin + ((idx) * width), data, width,
-                        color = 'w',
-                        linewidth=0)
-
-    idx = 0
-    for group in xrange(len(LAYOUTS)):
-        bars[idx + 1] = ax1.bar(ind + margin + ((idx + 1) * width), data, width,
-                              color=OPT_COLORS[idx],
-                              hatch=OPT_PATTERNS[idx * 2],
-                              linewidth=BAR_LINEWIDTH)
-
-        idx = idx + 1
-
-    TITLE = "Storage Models : "
-    LABELS = [TITLE, "NSM", "DSM", "FSM"]
-
-    # LEGEND
-    figlegend.legend(bars, LABELS, prop=LEGEND_FP,
-                     loc=1, ncol=4,
-                     mode="expand", shadow=OPT_LEGEND_SHADOW,
-                     frameon=False, borderaxespad=0.0,
-                     handleheight=1.5, handlelength=4)
-
-    figlegend.savefig('legend_bar.pdf')
-
-def create_horizontal_legend():
-    fig = pylab.figure()
-    ax1 = fig.add_subplot(111)
-
-    figlegend = pylab.figure(figsize=(12, 0.5))
-
-    num_items = len(LAYOUTS);
-    ind = np.arange(1)
-    margin = 0.10
-    width = ((1.0 - 2 * margin) / num_items) * 2
-    data = [1]
-
-    bars = [None] * (len(TUPLES_PER_TILEGROUP) + 1) * 2
-
-    # TITLE
-    idx = 0
-    bars[idx] = ax1.bar(ind + margin + ((idx) * width), data, width,
-                        color = 'w',
-                        linewidth=0)
-
-    idx = 0
-    for group in xrange(len(TUPLES_PER_TILEGROUP)):
-        bars[idx + 1] = ax1.bar(ind + margin + ((idx + 1) * width), data, width,
-                              color=OPT_COLORS[idx],
-                              linewidth=BAR_LINEWIDTH)
-
-        idx = idx + 1
-
-
-    TITLE = "Tuples Per Tile Group : "
-    LABELS = [TITLE, 100, 1000, 10000, 100000]
-
-    # LEGEND
-    figlegend.legend(bars, LABELS, prop=LEGEND_FP,
-                     loc=1, ncol=6,
-                     mode="expand", shadow=OPT_LEGEND_SHADOW,
-                     frameon=False, borderaxespad=0.0,
-                     handleheight=1.5, handlelength=4)
-
-    figlegend.savefig('legend_horizontal.pdf')
-
-def create_legend():
-    fig = pylab.figure()
-    ax1 = fig.add_subplot(111)
-
-    figlegend = pylab.figure(figsize=(9, 0.5))
-    idx = 0
-    lines = [None] * (len(LAYOUTS) + 1)
-    data = [1]
-    x_values = [1]
-
-    TITLE = "Storage Models : "
-    LABELS = [TITLE, "NSM", "DSM", "FSM"]
-
-    lines[idx], = ax1.plot(x_values, data, linewidth = 0)
-    idx = 0
-
-    for group in xrange(len(LAYOUTS)):
-        lines[idx + 1], = ax1.plot(x_values, data,
-                               color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                               marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # LEGEND
-    figlegend.legend(lines, LABELS, prop=LEGEND_FP,
-                     loc=1, ncol=4, mode="expand", shadow=OPT_LEGEND_SHADOW,
-                     frameon=False, borderaxespad=0.0, handlelength=4)
-
-    figlegend.savefig('legend.pdf')
-
-
-def create_hyrise_legend():
-    fig = pylab.figure()
-    ax1 = fig.add_subplot(111)
-
-    figlegend = pylab.figure(figsize=(6, 0.5))
-    idx = 0
-    lines = [None] * (len(LAYOUTS))
-    data = [1]
-    x_values = [1]
-
-    LABELS = ["Static Layout", "Dynamic Layout"]
-
-    for group in xrange(len(LAYOUTS) - 1):
-        lines[idx], = ax1.plot(x_values, data,
-                               color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                               marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # LEGEND
-    figlegend.legend(lines, LABELS, prop=LEGEND_FP,
-                     loc=1, ncol=4, mode="expand", shadow=OPT_LEGEND_SHADOW,
-                     frameon=False, borderaxespad=0.0, handlelength=4)
-
-    figlegend.savefig('legend_hyrise.pdf')
-
-def create_projectivity_bar_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    x_values = PROJECTIVITY
-    N = len(x_values)
-    x_labels = PROJECTIVITY
-
-    layouts = ["NSM", "DSM", "FSM"]
-
-    ind = np.arange(N)
-    margin = 0.15
-    width = ((1.0 - 2 * margin) / N)
-    bars = [None] * len(layouts) * N
-
-    print(datasets)
-
-    for group in xrange(len(datasets)):
-        # GROUP
-        latencies = []
-
-        for line in  xrange(len(datasets[group])):
-            for col in  xrange(len(datasets[group][line])):
-                if col == 1:
-                    latencies.append(datasets[group][line][col])
-
-        LOG.info("%s group_data = %s ", layouts, str(latencies))
-
-        bars[group] = ax1.bar(ind + margin + (group * width), latencies, width,
-                              color=OPT_COLORS[group],
-                              hatch=OPT_PATTERNS[group*2],
-                              linewidth=BAR_LINEWIDTH)
-
-
-    # GRID
-    axes = ax1.get_axes()
-    #axes.set_ylim(0.01, 1000000)
-    makeGrid(ax1)
-
-    # Y-AXIS
-    YAXIS_MIN = 0
-    YAXIS_MAX = 45000
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    #ax1.set_ylim([YAXIS_MIN, YAXIS_MAX])
-    #ax1.set_yscale('log', nonposy='clip', basey=2)
-
-    # X-AXIS
-    ax1.set_xlabel("Fraction of Attributes Projected", fontproperties=LABEL_FP)
-    ax1.set_xticklabels(x_labels)
-    ax1.set_xticks(ind + 0.5)
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_selectivity_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = SELECTIVITY
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(LAYOUTS);
-    ind = np.arange(N)
-    idx = 0
-
-    # GROUP
-    for group_index, group in enumerate(LAYOUTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    #YAXIS_MIN = pow(2.0, 13)
-    #YAXIS_MAX = pow(2.0, 19)
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    #ax1.set_ylim([YAXIS_MIN, YAXIS_MAX])
-    #ax1.set_yscale('log', basey=2)
-
-    # X-AXIS
-    XAXIS_MIN = 0.1
-    XAXIS_MAX = 1.1
-    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
-    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_horizontal_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = SELECTIVITY
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(TUPLES_PER_TILEGROUP);
-    ind = np.arange(N)
-    idx = 0
-
-    # GROUP
-    for group_index, group in enumerate(TUPLES_PER_TILEGROUP):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    #ax1.set_yscale('log', basey=10)
-
-    # X-AXIS
-    XAXIS_MIN = 0.1
-    XAXIS_MAX = 1.1
-    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
-    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_caching_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = SELECTIVITY
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(TUPLES_PER_TILEGROUP);
-    ind = np.arange(N)
-    idx = 0
-
-    # GROUP
-    for group_index, group in enumerate(TUPLES_PER_TILEGROUP):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1]/1000000)
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Cache Misses (M)", fontproperties=LABEL_FP)
-    #ax1.set_yscale('log', basey=10)
-
-    # X-AXIS
-    XAXIS_MIN = 0.1
-    XAXIS_MAX = 1.1
-    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
-    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_operator_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = OP_SELECTIVITY
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(LAYOUTS);
-    ind = np.arange(N)
-    idx = 0
-
-    YLIMIT = 0
-
-    # GROUP
-    for group_index, group in enumerate(LAYOUTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-        YLIMIT = max(YLIMIT, max(group_data))
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    YLIMIT = next_power_of_10(YLIMIT)
-
-    # X-AXIS
-    XAXIS_MIN = 0.05
-    XAXIS_MAX = 1.05
-    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
-    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
-    x_values = (0.2, 0.4, 0.6, 0.8, 1.0)
-    ax1.set_xticks(x_values)
-
-    # Y-AXIS
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    #ax1.set_yscale('log', basey=2)
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_subset_bar_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    x_values = SELECTIVITY
-    N = len(x_values)
-    x_labels = SELECTIVITY
-
-    ind = np.arange(N)
-    margin = 0.15
-    width = ((1.0 - 2 * margin) / N)
-    bars = [None] * len(SUBSET_RATIOS) * N
-
-    for group in xrange(len(datasets)):
-        # GROUP
-        latencies = []
-
-        for line in  xrange(len(datasets[group])):
-            for col in  xrange(len(datasets[group][line])):
-                if col == 1:
-                    latencies.append(datasets[group][line][col])
-
-        LOG.info("%s latencies = %s ", SUBSET_RATIOS[group], str(latencies))
-
-        bars[group] = ax1.bar(ind + margin + (group * width), latencies, width,
-                              color=OPT_COLORS[group],
-                              hatch=OPT_PATTERNS[group*2],
-                              linewidth=BAR_LINEWIDTH)
-
-
-    # GRID
-    axes = ax1.get_axes()
-    #axes.set_ylim(0.01, 1000000)
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-
-    # X-AXIS
-    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
-    ax1.set_xticklabels(x_labels)
-    ax1.set_xticks(ind + 0.5)
-    ax1.tick_params(axis='x', which='both', bottom='off', top='off')
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    TITLE = "Subset Ratio"
-    LABELS = SUBSET_RATIOS
-
-    # LEGEND
-    ax1.legend(bars, LABELS, prop=LEGEND_FP,
-               loc='upper left',
-               title = TITLE,
-               ncol=3, shadow=OPT_LEGEND_SHADOW,
-               frameon=False, borderaxespad=0.0,
-               handleheight=0.25, handlelength=0.75)
-
-    ax1.get_legend().get_title().set_fontproperties(LABEL_FP)
-    ax1.get_legend().get_title().set_position((-55, 0))
-
-    return (fig)
-
-def create_ycsb_bar_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    x_values = YCSB_OPERATIONS
-    N = len(x_values)
-    x_labels = YCSB_OPERATIONS
-
-    ind = np.arange(N)
-    margin = 0.15
-    width = ((1.0 - 2 * margin) / N) * 2
-    bars = [None] * len(LAYOUTS) * N
-
-    for group in xrange(len(datasets)):
-        # GROUP
-        latencies = []
-
-        for line in  xrange(len(datasets[group])):
-            for col in  xrange(len(datasets[group][line])):
-                if col == 1:
-                    latencies.append(datasets[group][line][col])
-
-        LOG.info("%s latencies = %s ", LAYOUTS[group], str(latencies))
-
-        bars[group] = ax1.bar(ind + margin + (group * width), latencies, width,
-                              color=OPT_COLORS[group],
-                              hatch=OPT_PATTERNS[group*2],
-                              linewidth=BAR_LINEWIDTH)
-
-
-    # GRID
-    axes = ax1.get_axes()
-    #axes.set_ylim(0.01, 1000000)
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-
-    # X-AXIS
-    #ax1.set_xlabel("Number of transactions", fontproperties=LABEL_FP)
-    ax1.set_xticklabels(x_labels)
-    ax1.set_xticks(ind + 0.5)
-    ax1.tick_params(axis='x', which='both', bottom='off', top='off')
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_adapt_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = list(xrange(1, ADAPT_QUERY_COUNT + 1))
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(LAYOUTS);
-    ind = np.arange(N)
-    idx = 0
-
-    ADAPT_OPT_LINE_WIDTH = 3.0
-    ADAPT_OPT_MARKER_SIZE = 5.0
-    ADAPT_OPT_MARKER_FREQUENCY = 10
-
-    LABELS = ["NSM", "DSM", "FSM"]
-
-    # GROUP
-    for group_index, group in enumerate(LAYOUTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE,
-                 markevery=ADAPT_OPT_MARKER_FREQUENCY, label=LABELS[idx])
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    YMIN = 0
-    YMAX = 2500
-    ax1.set_ylim([YMIN, YMAX])
-    #ax1.set_yscale('log', basey=10)
-
-    # X-AXIS
-    ax1.set_xlabel("Query Sequence", fontproperties=LABEL_FP)
-    major_ticks = np.arange(0, ADAPT_QUERY_COUNT + 1, REPEAT_ADAPT_TEST * 2)
-    ax1.set_xticks(major_ticks)
-
-    legend = ax1.legend(loc='upper center', prop=LABEL_FP,
-                        ncol=3,
-                        shadow=OPT_LEGEND_SHADOW,
-                        frameon=False, borderaxespad=0.0,
-                        handleheight=1.5, handlelength=2)
-
-    #for major_tick in major_ticks[1:-1]:
-    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
-
-    # LABELS
-    y_mark = 0.72
-    x_mark_count = 1.0/NUM_ADAPT_TESTS
-    x_mark_offset = x_mark_count/2 - x_mark_count/4
-    x_marks = np.arange(0, 1, x_mark_count)
-
-    ADAPT_LABELS = (["Scan", "Insert", "Scan", "Insert",
-                     "Scan", "Insert", "Scan", "Insert",
-                     "Scan", "Insert", "Scan", "Insert"])
-
-    for idx, x_mark in enumerate(x_marks):
-            ax1.text(x_mark + x_mark_offset,
-                     y_mark,
-                     ADAPT_LABELS[idx],
-                     transform=ax1.transAxes,
-                     bbox=dict(facecolor='skyblue', alpha=0.5))
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_hyrise_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = list(xrange(1, HYRISE_QUERY_COUNT + 1))
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(HYRISE_LAYOUTS);
-    ind = np.arange(N)
-    idx = 0
-
-    ADAPT_OPT_LINE_WIDTH = 3.0
-    ADAPT_OPT_MARKER_SIZE = 5.0
-    ADAPT_OPT_MARKER_FREQUENCY = 10
-
-    # GROUP
-    for group_index, group in enumerate(HYRISE_LAYOUTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE,
-                 markevery=ADAPT_OPT_MARKER_FREQUENCY, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    YAXIS_MIN = pow(2.0, 7)
-    YAXIS_MAX = pow(2.0, 12)
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylim([YAXIS_MIN, YAXIS_MAX])
-    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
-    ax1.set_yscale('log', basey=2)
-    ax1.set_yticklabels(['64', '128', '256', '512', '1024', '2048','4096'])
-
-    # X-AXIS
-    ax1.set_xlabel("Query Sequence", fontproperties=LABEL_FP)
-    major_ticks = np.arange(0, HYRISE_QUERY_COUNT + 1, REPEAT_HYRISE_TEST)
-    ax1.set_xticks(major_ticks)
-
-    #for major_tick in major_ticks[1:-1]:
-    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
-
-    # LABELS
-    y_mark = 0.85
-    x_mark_count = 1.0/NUM_HYRISE_TESTS
-    x_mark_offset = x_mark_count/2 - x_mark_count/4
-    x_marks = np.arange(0, 1, x_mark_count)
-
-    HYRISE_LABELS = (["Scan-H", "Scan-L", "Scan-H", "Scan-L"])
-
-    for idx, x_mark in enumerate(x_marks):
-            ax1.text(x_mark + x_mark_offset,
-                     y_mark,
-                     HYRISE_LABELS[idx],
-                     transform=ax1.transAxes,
-                     bbox=dict(facecolor='skyblue', alpha=0.5))
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-def create_weight_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = list(xrange(1, WEIGHT_QUERY_COUNT + 1))
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(SAMPLE_WEIGHTS);
-    ind = np.arange(N)
-    idx = 0
-    lines = [None] * (len(SAMPLE_WEIGHTS) + 1)
-
-    ADAPT_OPT_LINE_WIDTH = 3.0
-    ADAPT_OPT_MARKER_SIZE = 5.0
-
-    # GROUP
-    for group_index, group in enumerate(SAMPLE_WEIGHTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        lines[idx], = ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx],
-                               linewidth=ADAPT_OPT_LINE_WIDTH,
-                               label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    YMIN = 0
-    YMAX = COLUMN_COUNTS[1]
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Split Point", fontproperties=SMALL_LABEL_FP)
-    ax1.set_ylim((YMIN, YMAX))
-    #ax1.set_yscale('log', basey=10)
-
-    # X-AXIS
-    ax1.set_xlabel("Query Sequence", fontproperties=SMALL_LABEL_FP)
-    major_ticks = np.arange(0, WEIGHT_QUERY_COUNT + 1, REPEAT_WEIGHT_TEST * 2)
-    ax1.set_xticks(major_ticks)
-
-    #for major_tick in major_ticks[1:-1]:
-    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
-
-    TITLE = "Weight"
-    LABELS = SAMPLE_WEIGHTS
-
-    # LEGEND
-    ax1.legend(lines, LABELS, prop=SMALL_LEGEND_FP, title = TITLE,
-               loc=0, ncol=2, shadow=OPT_LEGEND_SHADOW,
-               frameon=False, borderaxespad=0.0, handlelength=2)
-
-    ax1.get_legend().get_title().set_fontproperties(SMALL_LEGEND_FP)
-    ax1.get_legend().get_title().set_position((-50, 0))
-
-    return (fig)
-
-def create_reorg_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = list(xrange(1, REORG_QUERY_COUNT + 1))
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = len(REORG_LAYOUTS);
-    ind = np.arange(N)
-    idx = 0
-    lines = [None] * (len(REORG_LAYOUTS) + 1)
-
-    ADAPT_OPT_LINE_WIDTH = 3.0
-    ADAPT_OPT_MARKER_SIZE = 5.0
-
-    # GROUP
-    for group_index, group in enumerate(REORG_LAYOUTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        lines[idx], = ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    YMIN = pow(10, 2)
-    YMAX = pow(10, 6)
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Execution time (s)", fontproperties=SMALL_LABEL_FP)
-    #ax1.set_ylim((YMIN, YMAX))
-    ax1.set_yscale('log', nonposy='clip')
-    #ax1.yaxis.set_major_locator(LogLocator(base = 10.0))
-    ax1.set_yticklabels(['10', '100', '1000', '10000', '100000'])
-    ax1.minorticks_off()
-
-    # X-AXIS
-    REORG_INTERVAL = 25
-    ax1.set_xlabel("Query Sequence", fontproperties=SMALL_LABEL_FP)
-    major_ticks = np.arange(0, REORG_QUERY_COUNT + 1, REORG_INTERVAL)
-    ax1.set_xticks(major_ticks)
-
-    #for major_tick in major_ticks[1:-1]:
-    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
-
-    TITLE = "Reorganization Type"
-    LABELS = ("Immediate", "Incremental")
-
-    # LEGEND
-    ax1.legend(lines, LABELS, prop=SMALL_LEGEND_FP, title = TITLE,
-               loc="upper left", ncol=2, shadow=OPT_LEGEND_SHADOW,
-               frameon=False, borderaxespad=0.0, handlelength=2)
-
-    ax1.get_legend().get_title().set_fontproperties(SMALL_LEGEND_FP)
-    ax1.get_legend().get_title().set_position((-40, 0))
-
-    return (fig)
-
-def create_distribution_stack_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = list(xrange(0, DIST_QUERY_COUNT))
-    N = len(x_values)
-    x_labels = x_values
-
-    num_items = DIST_TILE_GROUP_TYPES;
-    ind = np.arange(N)
-    idx = 0
-    lines = [None] * (DIST_TILE_GROUP_TYPES + 1)
-
-    ADAPT_OPT_LINE_WIDTH = 3.0
-    ADAPT_OPT_MARKER_SIZE = 5.0
-
-    # GROUP
-    for group_index, group in enumerate(datasets):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        if group_index == 0:
-            continue
-
-        lines[idx], = ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Tile Group Count ", fontproperties=SMALL_LABEL_FP)
-    #ax1.set_yscale('log', basey=10)
-
-    # X-AXIS
-    ax1.set_xlabel("Query Segment", fontproperties=SMALL_LABEL_FP)
-    major_ticks = np.arange(0, DIST_QUERY_COUNT, 1)
-    ax1.set_xticks(major_ticks)
-
-    #for major_tick in major_ticks[1:-1]:
-    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
-
-    TITLE = "Tile Group Layouts"
-    LABELS = ("FSM", "NSM", "T3", "T4", "T5")
-
-    # Clean up list
-    LABELS = LABELS[:DIST_TILE_GROUP_TYPES]
-
-    # LEGEND
-    ax1.legend(lines, LABELS, prop=SMALL_LEGEND_FP, title = TITLE,
-               loc="upper left", ncol=DIST_TILE_GROUP_TYPES,
-               shadow=OPT_LEGEND_SHADOW,
-               frameon=False, borderaxespad=0.0, handlelength=2)
-
-    ax1.get_legend().get_title().set_fontproperties(SMALL_LEGEND_FP)
-    ax1.get_legend().get_title().set_position((-15, 0))
-
-    return (fig)
-
-def create_concurrency_line_chart(datasets):
-    fig = plot.figure()
-    ax1 = fig.add_subplot(111)
-
-    # X-AXIS
-    x_values = THREAD_COUNTS
-    N = len(x_values)
-    x_labels = THREAD_COUNTS
-    num_items = len(THREAD_COUNTS);
-    ind = np.arange(N)
-    idx = 0
-
-    # GROUP
-    for group_index, group in enumerate(LAYOUTS):
-        group_data = []
-
-        # LINE
-        for line_index, line in enumerate(x_values):
-            group_data.append(datasets[group_index][line_index][1])
-
-        LOG.info("%s group_data = %s ", group, str(group_data))
-
-        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
-                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
-
-        idx = idx + 1
-
-    # GRID
-    axes = ax1.get_axes()
-    makeGrid(ax1)
-
-    # Y-AXIS
-    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
-    ax1.minorticks_off()
-    ax1.set_ylabel("Throughput", fontproperties=LABEL_FP)
-    #ax1.set_yscale('log', basey=2)
-
-    # X-AXIS
-    XAXIS_MIN = pow(2, -0.25)
-    XAXIS_MAX = pow(2, 4.25)
-    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
-    ax1.set_xlabel("Number of Threads", fontproperties=LABEL_FP)
-    ax1.set_xscale('log', basex=2)
-    ax1.set_xticklabels([0, 0, 1, 2, 4, 8, 16])
-    ax1.minorticks_off()
-
-    for label in ax1.get_yticklabels() :
-        label.set_fontproperties(TICK_FP)
-    for label in ax1.get_xticklabels() :
-        label.set_fontproperties(TICK_FP)
-
-    return (fig)
-
-###################################################################################
-# PLOT HELPERS
-###################################################################################
-
-# PROJECTIVITY -- PLOT
-def projectivity_plot():
-
-    column_count_type = 0
-    for column_count in COLUMN_COUNTS:
-        column_count_type = column_count_type + 1
-
-        for write_ratio in WRITE_RATIOS:
-
-            for operator in OPERATORS:
-                print(operator)
-                datasets = []
-
-                for layout in LAYOUTS:
-                    data_file = PROJECTIVITY_DIR + "/" + layout + "/" + operator + "/" + str(column_count) + "/" + str(write_ratio) + "/" + "projectivity.csv"
-
-                    dataset = loadDataFile(4, 2, data_file)
-                    dataset = dataset[:-1]
-                    datasets.append(dataset)
-
-                fig = create_projectivity_bar_chart(datasets)
-
-                if write_ratio == 0:
-                    write_mix = "rd"
-                else:
-                    write_mix = "rw"
+def get_repetition_policy(experiment_type):
+    if experiment_type in REPEATED_EXPERIMENTS:
+        return REPETITION_POLICY
+    return repetition.SINGLE_RUN
 
-                if column_count_type == 1:
-                    table_type = "narrow"
-                else:
-                    table_type = "wide"
+def get_counter_collector():
+    if COLLECT_COUNTERS:
+        return counters.CounterCollector(PERF, PERF_EVENTS)
+    return None
 
-                fileName = "projectivity-" + operator + "-" + table_type + "-" + write_mix + ".pdf"
-
-                saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-# SELECTIVITY -- PLOT
-def selectivity_plot():
-
-    column_count_type = 0
-    for column_count in COLUMN_COUNTS:
-        column_count_type = column_count_type + 1
-
-        for write_ratio in WRITE_RATIOS:
-
-            for operator in OPERATORS:
-                print(operator)
-                datasets = []
-
-                for layout in LAYOUTS:
-                    data_file = SELECTIVITY_DIR + "/" + layout + "/" + operator  + "/" + str(column_count) + "/" + str(write_ratio) + "/" + "selectivity.csv"
-
-                    dataset = loadDataFile(10, 2, data_file)
-                    datasets.append(dataset)
-
-                fig = create_selectivity_line_chart(datasets)
-
-                if write_ratio == 0:
-                    write_mix = "rd"
-                else:
-                    write_mix = "rw"
-
-                if column_count_type == 1:
-                    table_type = "narrow"
-                else:
-                    table_type = "wide"
-
-                fileName = "selectivity-" + operator + "-" + table_type + "-" + write_mix + ".pdf"
-
-                saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-
-# HORIZONTAL -- PLOT
-def horizontal_plot():
-
-    column_count_type = 0
-    for column_count in COLUMN_COUNTS:
-        column_count_type = column_count_type + 1
-
-        for write_ratio in WRITE_RATIOS:
-            datasets = []
-
-            for tuples_per_tg in TUPLES_PER_TILEGROUP:
-
-                data_file = HORIZONTAL_DIR + "/" + str(tuples_per_tg) + "/" + str(column_count) + "/" + str(write_ratio) + "/" + "horizontal.csv"
-
-                dataset = loadDataFile(10, 2, data_file)
-                datasets.append(dataset)
-
-            fig = create_horizontal_line_chart(datasets)
-
-            if write_ratio == 0:
-                write_mix = "rd"
-            else:
-                write_mix = "rw"
-
-            if column_count_type == 1:
-                table_type = "narrow"
-            else:
-                table_type = "wide"
-
-            fileName = "horizontal-" + table_type + "-" + write_mix + ".pdf"
-
-            saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-
-# OPERATOR -- PLOT
-def operator_plot():
-
-    column_count = OP_COLUMN_COUNT
-    for write_ratio in WRITE_RATIOS:
-
-        projectivity_type = 0
-        for projectivity in OP_PROJECTIVITY:
-            projectivity_type = projectivity_type + 1
-            print(projectivity)
-            datasets = []
-
-            for layout in LAYOUTS:
-                if projectivity == 1.0: projectivity = 1
-                data_file = OPERATOR_DIR + "/" + layout + "/" + str(projectivity) + "/" + str(column_count) + "/" + str(write_ratio) + "/" + "operator.csv"
-
-                dataset = loadDataFile(10, 2, data_file)
-                datasets.append(dataset)
-
-            fig = create_operator_line_chart(datasets)
-
-            if write_ratio == 0:
-                write_mix = "rd"
-            else:
-                write_mix = "rw"
-
-            fileName = "operator-" + str(projectivity_type) + "-" + write_mix + ".pdf"
-
-            saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-
-# YCSB -- PLOT
-def ycsb_plot():
-
-    column_count = 200
-    datasets = []
-
-    for layout in LAYOUTS:
-        data_file = YCSB_DIR + "/" + layout + "/" + str(column_count) + "/" + "ycsb.csv"
-
-        dataset = loadDataFile(6, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_ycsb_bar_chart(datasets)
-
-    fileName = "ycsb.pdf"
-
-    saveGraph(fig, fileName, width=OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-# SUBSET -- PLOT
-def subset_plot():
-
-    datasets = []
-    for subset_ratio in SUBSET_RATIOS:
-        data_file = SUBSET_DIR + "/" + SUBSET_SINGLE_GROUP_EXPERIMENT + "/" + str(subset_ratio) + "/" + "subset.csv"
-
-        dataset = loadDataFile(5, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_subset_bar_chart(datasets)
-
-    fileName = "subset-single.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-    datasets = []
-    for access_num_group in ACCESS_NUM_GROUPS:
-        data_file = SUBSET_DIR + "/" + SUBSET_MULTIPLE_GROUP_EXPERIMENT + "/" + str(access_num_group) + "/" + "subset.csv"
-
-        dataset = loadDataFile(5, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_subset_bar_chart(datasets)
-
-    fileName = "subset-multiple.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-# ADAPT -- PLOT
-def adapt_plot():
-
-    ADAPT_COLUMN_COUNT = COLUMN_COUNTS[1]
-    #ADAPT_SEED = 0
-    #random.seed(ADAPT_SEED)
-    datasets = []
-
-    for layout in LAYOUTS:
-        data_file = ADAPT_DIR + "/" + str(ADAPT_COLUMN_COUNT) + "/" + layout + "/" + "adapt.csv"
-
-        dataset = loadDataFile(ADAPT_QUERY_COUNT, 2, data_file)
-        #random.shuffle(dataset)
-        datasets.append(dataset)
-
-    fig = create_adapt_line_chart(datasets)
-
-    fileName = "adapt.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH * 2, height=OPT_GRAPH_HEIGHT/1.5)
-
-# WEIGHT -- PLOT
-def weight_plot():
-
-    datasets = []
-    for sample_weight in SAMPLE_WEIGHTS:
-        data_file = WEIGHT_DIR + "/" + str(sample_weight) + "/" + "weight.csv"
-
-        dataset = loadDataFile(WEIGHT_QUERY_COUNT, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_weight_line_chart(datasets)
-
-    fileName = "weight.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.5)
-
-# REORG -- PLOT
-def reorg_plot():
-
-    reorg_scale_factor = 1000
-    datasets = []
-
-    for layout in REORG_LAYOUTS:
-        data_file = REORG_DIR + "/" + str(reorg_scale_factor) + "/" + str(layout) + "/" + "reorg.csv"
-
-        dataset = loadDataFile(REORG_QUERY_COUNT, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_reorg_line_chart(datasets)
-
-    fileName = "reorg.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.5)
-
-# DISTRIBUTION -- PLOT
-def distribution_plot():
-
-    datasets = []
-    for tile_group_type in xrange(0, DIST_TILE_GROUP_TYPES):
-        data_file = DISTRIBUTION_DIR + "/" + str(tile_group_type) + "/" + "distribution.csv"
-
-        dataset = loadDataFile(DIST_QUERY_COUNT, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_distribution_stack_chart(datasets)
-
-    fileName = "distribution.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.5)
-
-# JOIN -- PLOT
-def join_plot():
-
-    operator = "join"
-    JOIN_COLUMN_COUNTS = [50, 200]
-
-    column_count_type = 0
-    for column_count in JOIN_COLUMN_COUNTS:
-        column_count_type = column_count_type + 1
-
-        print(operator)
-        datasets = []
-
-        for layout in LAYOUTS:
-            data_file = JOIN_DIR + "/" + layout + "/" + operator + "/" + str(column_count) + "/" + "join.csv"
-
-            dataset = loadDataFile(4, 2, data_file)
-            dataset = dataset[:-1]
-            datasets.append(dataset)
-
-        fig = create_projectivity_bar_chart(datasets)
-
-        if column_count_type == 1:
-            table_type = "narrow"
-        else:
-            table_type = "wide"
-
-        fileName = "join-" + table_type + ".pdf"
-
-        saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-# CACHING -- PLOT
-def caching_plot():
-
-    column_count_type = 0
-    for column_count in COLUMN_COUNTS:
-        column_count_type = column_count_type + 1
-
-        for write_ratio in WRITE_RATIOS:
-            datasets = []
-
-            for tuples_per_tg in TUPLES_PER_TILEGROUP:
-
-                data_file = CACHING_DIR + "/" + str(tuples_per_tg) + "/" + str(column_count) + "/" + str(write_ratio) + "/" + "caching.csv"
-
-                dataset = loadDataFile(10, 2, data_file)
-                datasets.append(dataset)
-
-            fig = create_caching_line_chart(datasets)
-
-            if write_ratio == 0:
-                write_mix = "rd"
-            else:
-                write_mix = "rw"
-
-            if column_count_type == 1:
-                table_type = "narrow"
-            else:
-                table_type = "wide"
-
-            fileName = "caching-" + table_type + "-" + write_mix + ".pdf"
-
-            saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
-
-# HYRISE -- PLOT
-def hyrise_plot():
-
-    HYRISE_COLUMN_COUNT = COLUMN_COUNTS[0]
-    datasets = []
-
-    for layout in HYRISE_LAYOUTS:
-        data_file = HYRISE_DIR + "/" + str(HYRISE_COLUMN_COUNT) + "/" + layout + "/" + "hyrise.csv"
-
-        dataset = loadDataFile(HYRISE_QUERY_COUNT, 2, data_file)
-        datasets.append(dataset)
-
-    fig = create_hyrise_line_chart(datasets)
-
-    fileName = "hyrise.pdf"
-
-    saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH * 3, height=OPT_GRAPH_HEIGHT/2.0)
-
-# CONCURRENCY -- PLOT
-def concurrency_plot():
-
-    for scan_ratio in SCAN_RATIOS:
-
-        datasets = []
-
-        for layout in LAYOUTS:
-
-            data_file = CONCURRENCY_DIR + "/" + layout + "/" + str(scan_ratio) + "/" + "concurrency.csv"
-
-            dataset = loadDataFile(10, 3, data_file)
-            datasets.append(dataset)
-
-        fig = create_concurrency_line_chart(datasets)
-
-        if scan_ratio == 0:
-            rw_prefix = "write-only"
-        elif scan_ratio == 0.5:
-            rw_prefix = "balanced"
-        elif scan_ratio == 0.9:
-            rw_prefix = "read-heavy"
-        elif scan_ratio == 1:
-            rw_prefix = "read-only"
+def read_output_file():
+    if not os.path.exists(OUTPUT_FILE):
+        return []
+    fp = open(OUTPUT_FILE)
+    lines = [line.rstrip("\n") for line in fp if line.strip()]
+    fp.close()
+    return lines
 
-        fileName = "concurrency-" + rw_prefix + ".pdf"
+def write_output_file(lines, usages=None):
+    target = open(OUTPUT_FILE, 'w')
+    for line in lines:
+        target.write(line + "\n")
+    target.close()
 
-        saveGraph(fig, fileName, width= OPT_GRAPH_WIDTH, height=OPT_GRAPH_HEIGHT/2.0)
+    # resource usage of the run each line came from
+    rusage.write_usage_file(OUTPUT_FILE, usages or [None] * len(lines))
 
+def load_plots():
+    # the plotting stack is only imported when a figure is requested
+    import plots
+    plots.FORCE_RENDER = FORCE_CLEAN
+    plots.POINTS_PER_PIXEL = POINTS_PER_PIXEL
+    plots.DOWNSAMPLE_METHOD = DOWNSAMPLE_METHOD
+    plots.FIGURE_FORMAT = FIGURE_FORMAT
+    return plots
 
 ###################################################################################
 # EVAL HELPERS
@@ -1627,7 +144,12 @@ def concurrency_plot():
 # CLEAN UP RESULT DIR
 def clean_up_dir(result_directory):
 
-    subprocess.call(['rm', '-rf', result_directory])
+    if FORCE_CLEAN:
+        subprocess.call(['rm', '-rf', result_directory])
+    else:
+        # keep the run journal, finished runs are collected again from it
+        runcache.clean_results(result_directory)
+
     if not os.path.exists(result_directory):
         os.makedirs(result_directory)
 
@@ -1635,28 +157,156 @@ def clean_up_dir(result_directory):
 def run_experiment(program,
                    scale_factor,
                    transaction_count,
-                   experiment_type):
-
-    # cleanup
-    subprocess.call(["rm -f " + OUTPUT_FILE], shell=True)
-
-    subprocess.call([program,
-                     "-e", str(experiment_type),
-                     "-k", str(scale_factor),
-                     "-t", str(transaction_count)])
+                   experiment_type,
+                   result_dir=None,
+                   arguments=(),
+                   cpus=None):
+
+    command = [program,
+               "-e", str(experiment_type),
+               "-k", str(scale_factor),
+               "-t", str(transaction_count)] + list(arguments)
+    run_key = [experiment_type, scale_factor, transaction_count]
+
+    run_command(command, experiment_type, run_key, result_dir, cpus)
+
+def run_command(command,
+                experiment_type,
+                run_key,
+                result_dir=None,
+                cpus=None,
+                estimate=None,
+                policy=None,
+                collector=None):
+
+    program = command[0]
+    if policy is None:
+        policy = get_repetition_policy(experiment_type)
+
+    if collector is None:
+        collector = get_counter_collector()
+    if collector is not None:
+        command = collector.wrap(command)
+    if cpus is not None:
+        command = sweep.pin_command(command, cpus)
+
+    # reuse a finished run of the same binary, arguments and repetitions
+    journal = None
+    if result_dir is not None:
+        journal = runcache.RunJournal(result_dir, experiment_type)
+        key = journal.get_key(command + list(policy))
+        lines = journal.get(key)
+        if lines is not None:
+            LOG.info("Skipping finished run %s", key)
+            write_output_file(lines, [journal.get_usage(key)] * len(lines))
+            run_counters = journal.get_counters(key)
+            if run_counters is not None:
+                counters.write_counters(result_dir, RUN_KEY_FIELDS, run_key,
+                                        counters.derive_counters(run_counters))
+            run_latency = journal.get_latency(key)
+            if run_latency:
+                latency.write_latency(result_dir, latency.from_entries(run_latency))
+            return
+
+    # configurations and runtime of the last finished run, for the ETA and
+    # the time limit; a run covering a whole grid is not limited before one
+    # finished, unless the caller estimates its runtime
+    expected_lines = None
+    progress_log = None
+    history = None
+    if result_dir is not None:
+        expected_lines = journal.get_line_count()
+        progress_log = progress.get_progress_path(result_dir)
+        history = journal.get_max_duration()
+
+    samples = []
+    histograms = []
+    usages = []
+    durations = []
+    run_count = [0]
+
+    def attempt():
+        # cleanup
+        subprocess.call(["rm -f " + OUTPUT_FILE + " " + counters.PERF_OUTPUT_FILE + " " +
+                         latency.LATENCY_OUTPUT_FILE], shell=True)
+
+        run_count[0] += 1
+        label = "experiment %d run %d" % (experiment_type, run_count[0])
+        tracker = progress.ProgressTracker(label, expected_lines, progress_log)
+        finished = [duration for duration in [history] + durations if duration is not None]
+        timeout = watchdog.get_timeout(WATCHDOG_POLICY, max(finished) if finished else None,
+                                       estimate)
+        start = time.time()
+        return_code, expired, usage = progress.run_monitored(command, OUTPUT_FILE, tracker, timeout)
+
+        if expired:
+            return read_output_file(), "timed out after %.0fs" % timeout
+        if return_code != 0:
+            return read_output_file(), "exited with %d" % return_code
+
+        durations.append(time.time() - start)
+        usages.append(usage)
+        if collector is not None:
+            samples.append(collector.read())
+        histograms.append(latency.parse_latency_file())
+        return read_output_file(), None
+
+    def run_once():
+        return watchdog.run_with_retry(attempt, WATCHDOG_POLICY)
+
+    try:
+        lines, runs = repetition.repeat_run(run_once, policy)
+    except watchdog.RunFailed as failure:
+        # keep what the last attempt got through
+        LOG.error("%s: %s, keeping %d partial lines", program, failure, len(failure.lines))
+        if result_dir is not None:
+            watchdog.record_failure(watchdog.get_failure_path(result_dir), command,
+                                    failure.reason, failure.attempts,
+                                    [str(value) for value in run_key])
+        write_output_file(failure.lines)
+        return
+
+    # warm-up runs are not measured
+    run_usage = rusage.merge_usage(usages[-runs:])
+    write_output_file(lines, [run_usage] * len(lines))
+
+    # the run covers every configuration of the experiment, so its counters
+    # are not per tuple
+    run_counters = counters.mean_counters(samples[-runs:])
+    if result_dir is not None and run_counters is not None:
+        counters.write_counters(result_dir, RUN_KEY_FIELDS, run_key,
+                                counters.derive_counters(run_counters))
+
+    # benchmarks reporting per-transaction latencies, pooled over the runs
+    run_latency = latency.merge_histograms(histograms[-runs:])
+    if result_dir is not None and run_latency:
+        latency.write_latency(result_dir, run_latency)
+
+    if journal is not None and lines:
+        journal.record(key, lines, run_counters, max(durations),
+                       latency.to_entries(run_latency) if run_latency else None,
+                       run_usage)
 
 
 # COLLECT STATS
 def collect_stats(result_dir,
                   result_file_name,
-                  category):
+                  category,
+                  output_file=OUTPUT_FILE,
+                  dimensions=None):
 
-    fp = open(OUTPUT_FILE)
-    lines = fp.readlines()
-    fp.close()
+    fp = open(output_file)
+    writers = ResultWriterPool()
+    results = open_results(result_dir, result_file_name)
 
-    for line in lines:
-        data = line.split()
+    # (name, value) of the dimensions the summary lines do not carry, one
+    # directory level each, in order
+    dimensions = list(dimensions or [])
+    for name, value in dimensions:
+        result_dir = result_dir + "/" + str(value)
+
+    # usage rows are read along with the summary lines
+    for data, usage in rusage.iter_usage_file(output_file, fp):
 
         # Collect info
         if category != DISTRIBUTION_EXPERIMENT:
@@ -1676,6 +326,7 @@ def collect_stats(result_dir,
             sample_weight = data[13]
             scale_factor = data[14]
             stat = data[15]
+            stat_summary = data[16:16 + len(repetition.SUMMARY_FIELDS)]
 
             if(layout == "0"):
                 layout = "row"
@@ -1724,44 +375,67 @@ def collect_stats(result_dir,
         elif category == CONCURRENCY_EXPERIMENT:
             result_directory = result_dir + "/" + layout + "/" + str(theta)
 
-        if not os.path.exists(result_directory):
-            os.makedirs(result_directory)
         file_name = result_directory + "/" + result_file_name
 
-        result_file = open(file_name, "a")
+        # STORE STATS
+        if category != DISTRIBUTION_EXPERIMENT:
+            stats = dict(zip(repetition.SUMMARY_FIELDS, stat_summary))
+            stats.update(usage or {})
+            stats.update(dimensions)
+            results.append(layout=layout, operator=operator,
+                           selectivity=selectivity, projectivity=projectivity,
+                           column_count=column_count, write_ratio=write_ratio,
+                           subset_experiment_type=subset_experiment_type,
+                           access_num_group=access_num_group, subset_ratio=subset_ratio,
+                           tuples_per_tg=tuples_per_tg, txn_itr=txn_itr, theta=theta,
+                           split_point=split_point, sample_weight=sample_weight,
+                           scale_factor=scale_factor, stat=stat, **stats)
+        else:
+            stats = dict(usage or {})
+            stats.update(dimensions)
+            results.append(txn_itr=query_itr, tile_group_type=tile_group_type,
+                           stat=tile_group_count, **stats)
 
         # WRITE OUT STATS
+        # the caching tree has no layout level, the other layouts are only stored
+        if category == CACHING_EXPERIMENT and layout != CACHING_LAYOUT:
+            continue
         if category == PROJECTIVITY_EXPERIMENT or category == JOIN_EXPERIMENT:
-            result_file.write(str(projectivity) + " , " + str(stat) + "\n")
+            writers.write(file_name, str(projectivity) + " , " + str(stat) + "\n")
         elif category == SELECTIVITY_EXPERIMENT or category == OPERATOR_EXPERIMENT or category == HORIZONTAL_EXPERIMENT or category == SUBSET_EXPERIMENT or category == CACHING_EXPERIMENT:
-            result_file.write(str(selectivity) + " , " + str(stat) + "\n")
+            writers.write(file_name, str(selectivity) + " , " + str(stat) + "\n")
         elif category == ADAPT_EXPERIMENT or category == REORG_EXPERIMENT or category == HYRISE_EXPERIMENT:
-            result_file.write(str(txn_itr) + " , " + str(stat) + "\n")
+            writers.write(file_name, str(txn_itr) + " , " + str(stat) + "\n")
         elif category == DISTRIBUTION_EXPERIMENT:
-            result_file.write(str(query_itr) + " , " + str(tile_group_count) + "\n")
+            writers.write(file_name, str(query_itr) + " , " + str(tile_group_count) + "\n")
         elif category == WEIGHT_EXPERIMENT:
-            result_file.write(str(txn_itr) + " , " + str(split_point) + "\n")
+            writers.write(file_name, str(txn_itr) + " , " + str(split_point) + "\n")
         elif category == CONCURRENCY_EXPERIMENT:
-            result_file.write(str(sample_weight) + " , " + str(stat) + "\n")
+            writers.write(file_name, str(sample_weight) + " , " + str(stat) + "\n")
 
-        result_file.close()
+    # the store goes last, so it is newer than the result files it holds
+    fp.close()
+    writers.close()
+    results.save()
 
 # COLLECT STATS
 def collect_ycsb_stats(result_dir,
-                       result_file_name):
+                       result_file_name,
+                       output_file=OUTPUT_FILE):
 
-    fp = open(OUTPUT_FILE)
-    lines = fp.readlines()
-    fp.close()
+    fp = open(output_file)
+    writers = ResultWriterPool()
+    results = open_results(result_dir, result_file_name)
 
-    for line in lines:
-        data = line.split()
+    # usage rows are read along with the summary lines
+    for data, usage in rusage.iter_usage_file(output_file, fp):
 
         # Collect info
         layout = data[0]
         operator = data[1]
         column_count = data[2]
         stat = data[3]
+        stat_summary = data[4:4 + len(repetition.SUMMARY_FIELDS)]
 
         if(layout == "0"):
             layout = "row"
@@ -1772,13 +446,18 @@ def collect_ycsb_stats(result_dir,
 
         result_directory = result_dir + "/" + layout + "/" + column_count
 
-        if not os.path.exists(result_directory):
-            os.makedirs(result_directory)
         file_name = result_directory + "/" + result_file_name
 
-        result_file = open(file_name, "a")
-        result_file.write(str(operator) + " , " + str(stat) + "\n")
-        result_file.close()
+        stats = dict(zip(repetition.SUMMARY_FIELDS, stat_summary))
+        stats.update(usage or {})
+        results.append(layout=layout, operator=operator,
+                       column_count=column_count, stat=stat, **stats)
+        writers.write(file_name, str(operator) + " , " + str(stat) + "\n")
+
+    # the store goes last, so it is newer than the result files it holds
+    fp.close()
+    writers.close()
+    results.save()
 
 ###################################################################################
 # EVAL
@@ -1792,7 +471,7 @@ def projectivity_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, PROJECTIVITY_EXPERIMENT)
+                   TRANSACTION_COUNT, PROJECTIVITY_EXPERIMENT, PROJECTIVITY_DIR)
 
     # COLLECT STATS
     collect_stats(PROJECTIVITY_DIR, "projectivity.csv", PROJECTIVITY_EXPERIMENT)
@@ -1805,7 +484,7 @@ def selectivity_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, SELECTIVITY_EXPERIMENT)
+                   TRANSACTION_COUNT, SELECTIVITY_EXPERIMENT, SELECTIVITY_DIR)
 
     # COLLECT STATS
     collect_stats(SELECTIVITY_DIR, "selectivity.csv", SELECTIVITY_EXPERIMENT)
@@ -1818,7 +497,7 @@ def operator_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, OPERATOR_EXPERIMENT)
+                   TRANSACTION_COUNT, OPERATOR_EXPERIMENT, OPERATOR_DIR)
 
     # COLLECT STATS
     collect_stats(OPERATOR_DIR, "operator.csv", OPERATOR_EXPERIMENT)
@@ -1831,7 +510,7 @@ def horizontal_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, HORIZONTAL_EXPERIMENT)
+                   TRANSACTION_COUNT, HORIZONTAL_EXPERIMENT, HORIZONTAL_DIR)
 
     # COLLECT STATS
     collect_stats(HORIZONTAL_DIR, "horizontal.csv", HORIZONTAL_EXPERIMENT)
@@ -1844,7 +523,7 @@ def ycsb_eval():
 
     # RUN EXPERIMENT
     run_experiment(YCSB, YCSB_SCALE_FACTOR,
-                   YCSB_TRANSACTION_COUNT, YCSB_EXPERIMENT)
+                   YCSB_TRANSACTION_COUNT, YCSB_EXPERIMENT, YCSB_DIR)
 
     # COLLECT STATS
     collect_ycsb_stats(YCSB_DIR, "ycsb.csv")
@@ -1857,7 +536,7 @@ def subset_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, SUBSET_EXPERIMENT)
+                   TRANSACTION_COUNT, SUBSET_EXPERIMENT, SUBSET_DIR)
 
     # COLLECT STATS
     collect_stats(SUBSET_DIR, "subset.csv", SUBSET_EXPERIMENT)
@@ -1870,7 +549,7 @@ def adapt_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, ADAPT_EXPERIMENT)
+                   TRANSACTION_COUNT, ADAPT_EXPERIMENT, ADAPT_DIR)
 
     # COLLECT STATS
     collect_stats(ADAPT_DIR, "adapt.csv", ADAPT_EXPERIMENT)
@@ -1883,7 +562,7 @@ def weight_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, WEIGHT_EXPERIMENT)
+                   TRANSACTION_COUNT, WEIGHT_EXPERIMENT, WEIGHT_DIR)
 
     # COLLECT STATS
     collect_stats(WEIGHT_DIR, "weight.csv", WEIGHT_EXPERIMENT)
@@ -1896,7 +575,7 @@ def reorg_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, REORG_EXPERIMENT)
+                   TRANSACTION_COUNT, REORG_EXPERIMENT, REORG_DIR)
 
     # COLLECT STATS
     collect_stats(REORG_DIR, "reorg.csv", REORG_EXPERIMENT)
@@ -1909,7 +588,7 @@ def distribution_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, DISTRIBUTION_EXPERIMENT)
+                   TRANSACTION_COUNT, DISTRIBUTION_EXPERIMENT, DISTRIBUTION_DIR)
 
     # COLLECT STATS
     collect_stats(DISTRIBUTION_DIR, "distribution.csv", DISTRIBUTION_EXPERIMENT)
@@ -1922,11 +601,44 @@ def join_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, JOIN_EXPERIMENT)
+                   TRANSACTION_COUNT, JOIN_EXPERIMENT, JOIN_DIR)
 
     # COLLECT STATS
     collect_stats(JOIN_DIR, "join.csv", JOIN_EXPERIMENT)
 
+# CACHING -- PARSE
+def parse_caching_job(params, out, err, work_dir):
+
+    perf_file = os.path.join(work_dir, counters.PERF_OUTPUT_FILE)
+    cache_misses = counters.CounterCollector(PERF, PERF_EVENTS).read(perf_file)["cache-misses"]
+    if cache_misses is None:
+        LOG.error("cache-misses not counted for %s", " ".join(params))
+        return []
+    cache_misses_count = counters.format_counter(cache_misses)
+
+    # build line
+    line = " ".join(params) + " " + cache_misses_count
+    print(line)
+
+    return [line]
+
+# DIRECT -- PARSE
+def parse_direct_job(params, out, err, work_dir):
+
+    # a single configuration ends with "<configuration> :: <time> ms"
+    for output_line in out.split('\n'):
+        if '::' not in output_line:
+            continue
+        duration = output_line.split('::')[1].split()[0]
+
+        # build line
+        line = " ".join(params) + " " + duration
+        print(line)
+
+        return [line]
+
+    return []
+
 # CACHING -- EVAL
 def caching_eval():
 
@@ -1938,7 +650,6 @@ def caching_eval():
 
 
     DIRECT_TEST = "1"
-    layout_mode = "2"
     operator_type = "1"
     projectivity = "0.1"
     subset_experiment_type = "0"
@@ -1953,51 +664,132 @@ def caching_eval():
     DEFAULT_TUPLES_PER_TILEGROUP = 1000
     total_tuple_count = SCALE_FACTOR * DEFAULT_TUPLES_PER_TILEGROUP
 
-    content = ""
-    for column_count in COLUMN_COUNTS:
-        for write_ratio in WRITE_RATIOS:
-            for selectivity in SELECTIVITY:
-                for tuples_per_tilegroup in TUPLES_PER_TILEGROUP:
-
-                    scale_factor = total_tuple_count / tuples_per_tilegroup
-
-                    # RUN EXPERIMENT
-                    p = subprocess.Popen([PERF, "stat",
-                                     "-e", "task-clock,cycles,instructions,cache-references,cache-misses",
-                                     HYADAPT,
-                                     "-o", str(DIRECT_TEST),
-                                     "-k", str(scale_factor),
-                                     "-t", str(TRANSACTION_COUNT),
-                                     "-c", str(column_count),
-                                     "-w", str(write_ratio),
-                                     "-s", str(selectivity),
-                                     "-g", str(tuples_per_tilegroup)],
-                                     stdout=subprocess.PIPE,
-                                     stderr=subprocess.PIPE)
-
-                    out, err = p.communicate()
-
-                    split_list = err.split('\n');
-                    cache_misses_line = split_list[7]
-                    cache_misses_line = cache_misses_line.lstrip()
-                    cache_misses_list = cache_misses_line.split(' ')
-                    cache_misses_count = cache_misses_list[0]
-                    cache_misses_count = cache_misses_count.replace(',', '')
-
-                    # build line
-                    line = layout_mode + " " + operator_type + " " + str(selectivity) + " " + projectivity + " " + str(column_count) + " " + str(write_ratio) + " " + subset_experiment_type + " " + access_num_groups + " " + subset_ratio + " " + str(tuples_per_tilegroup) + " " + query_itr + " " + theta + " " + split_point + " " + sample_weight + " " + str(SCALE_FACTOR) + " " + cache_misses_count
-                    print(line)
-
-                    content = content + line + "\n"
-
-    # write to file
-    target = open(OUTPUT_FILE, 'w')
-    target.write(content)
-    target.close()
+    # one process per configuration, so with --memory-layouts every layout
+    # gets its own peak memory; the caching charts only need CACHING_LAYOUT,
+    # HYADAPT's default
+    if MEMORY_LAYOUTS:
+        layout_modes = LAYOUT_MODES
+    else:
+        layout_modes = (CACHING_LAYOUT_MODE,)
+
+    jobs = []
+    for layout_mode in layout_modes:
+        layout_arguments = ["-l", layout_mode] if MEMORY_LAYOUTS else []
+        for column_count in COLUMN_COUNTS:
+            for write_ratio in WRITE_RATIOS:
+                for selectivity in SELECTIVITY:
+                    for tuples_per_tilegroup in TUPLES_PER_TILEGROUP:
+
+                        scale_factor = total_tuple_count / tuples_per_tilegroup
+
+                        command = [HYADAPT,
+                                   "-o", str(DIRECT_TEST),
+                                   "-k", str(scale_factor),
+                                   "-t", str(TRANSACTION_COUNT)]
+                        command += layout_arguments
+                        command += ["-c", str(column_count),
+                                    "-w", str(write_ratio),
+                                    "-s", str(selectivity),
+                                    "-g", str(tuples_per_tilegroup)]
+
+                        params = [layout_mode, operator_type, str(selectivity), projectivity, str(column_count), str(write_ratio), subset_experiment_type, access_num_groups, subset_ratio, str(tuples_per_tilegroup), query_itr, theta, split_point, sample_weight, str(SCALE_FACTOR)]
+
+                        jobs.append(sweep.SweepJob(command, parse_caching_job, params))
+
+    # RUN EXPERIMENT
+    # the cache misses come from perf, so caching always collects counters
+    journal = runcache.RunJournal(CACHING_DIR, CACHING_EXPERIMENT)
+    collector = counters.CounterCollector(PERF, PERF_EVENTS)
+    tracker = progress.ProgressTracker("caching sweep", len(jobs),
+                                       progress.get_progress_path(CACHING_DIR))
+    results, job_counters = sweep.run_sweep(jobs, OUTPUT_FILE, SWEEP_WORKERS, journal,
+                                            get_repetition_policy(CACHING_EXPERIMENT),
+                                            collector, tracker, WATCHDOG_POLICY,
+                                            watchdog.get_failure_path(CACHING_DIR),
+                                            QUEUE_DIR)
+
+    # RECORD COUNTERS
+    for job, job_counter in zip(jobs, job_counters):
+        if job_counter is not None:
+            counters.write_counters(CACHING_DIR, SUMMARY_KEY_FIELDS, job.params,
+                                    counters.derive_counters(job_counter, total_tuple_count))
 
     # COLLECT STATS
     collect_stats(CACHING_DIR, "caching.csv", CACHING_EXPERIMENT)
 
+# SPEC -- EVAL
+def spec_eval(spec_file, dry_run=False):
+
+    plan = spec.compile_spec(spec.load_spec(spec_file))
+
+    collector = spec.get_collector(plan, get_counter_collector())
+
+    if dry_run:
+        spec.print_plan(plan, REPETITION_POLICY, SWEEP_WORKERS, collector)
+        return
+
+    # parsers live in this module
+    parse = globals()[plan.parse] if plan.parse is not None else None
+    jobs = [sweep.SweepJob(job.command, parse, job.key) for job in plan.jobs]
+
+    # CLEAN UP RESULT DIR
+    clean_up_dir(plan.result_dir)
+
+    # cleanup
+    subprocess.call(["rm -f " + OUTPUT_FILE], shell=True)
+
+    if plan.affinity is not None:
+        pinned_eval(plan, collector)
+        return
+
+    # RUN EXPERIMENT
+    journal = runcache.RunJournal(plan.result_dir, plan.experiment)
+    tracker = progress.ProgressTracker(plan.name, len(jobs),
+                                       progress.get_progress_path(plan.result_dir))
+    sweep.run_sweep(jobs, OUTPUT_FILE, SWEEP_WORKERS, journal,
+                    spec.get_policy(plan, REPETITION_POLICY),
+                    collector, tracker, WATCHDOG_POLICY,
+                    watchdog.get_failure_path(plan.result_dir),
+                    QUEUE_DIR, plan.estimate)
+
+    # COLLECT STATS
+    collect_stats(plan.result_dir, plan.result_file, plan.experiment)
+
+# REFINE -- EVAL
+def refine_eval(spec_file):
+
+    spec_data = spec.load_spec(spec_file)
+    plan = spec.compile_spec(spec_data)
+
+    collector = spec.get_collector(plan, get_counter_collector())
+
+    parse = globals()[plan.parse] if plan.parse is not None else None
+    policy = spec.get_policy(plan, REPETITION_POLICY)
+
+    # CLEAN UP RESULT DIR
+    clean_up_dir(plan.result_dir)
+
+    # cleanup
+    subprocess.call(["rm -f " + OUTPUT_FILE], shell=True)
+
+    # RUN EXPERIMENT
+    journal = runcache.RunJournal(plan.result_dir, plan.experiment)
+
+    def run_jobs(plan_jobs):
+        jobs = [sweep.SweepJob(job.command, parse, job.key) for job in plan_jobs]
+        results, job_counters = sweep.run_sweep(jobs, OUTPUT_FILE, SWEEP_WORKERS, journal,
+                                                policy, collector, None, WATCHDOG_POLICY,
+                                                watchdog.get_failure_path(plan.result_dir),
+                                                QUEUE_DIR, plan.estimate)
+        return results
+
+    lines, crossovers, group_axes = refine.run_refinement(spec_data, run_jobs)
+    write_output_file(lines)
+    refine.write_crossovers(plan.result_dir, group_axes, crossovers)
+
+    # COLLECT STATS
+    collect_stats(plan.result_dir, plan.result_file, plan.experiment)
+
 # HYRISE -- EVAL
 def hyrise_eval():
 
@@ -2006,20 +798,61 @@ def hyrise_eval():
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, SCALE_FACTOR,
-                   TRANSACTION_COUNT, HYRISE_EXPERIMENT)
+                   TRANSACTION_COUNT, HYRISE_EXPERIMENT, HYRISE_DIR)
 
     # COLLECT STATS
     collect_stats(HYRISE_DIR, "hyrise.csv", HYRISE_EXPERIMENT)
 
+# PINNED -- EVAL
+def pinned_eval(plan, collector=None):
+
+    # THREAD PLACEMENT
+    cpus = topology.read_topology()
+    topology.write_topology(plan.result_dir, cpus)
+    LOG.info("Topology: %s", topology.describe_topology(cpus))
+
+    # one result directory per combination of the dimensions, in job order
+    groups = collections.OrderedDict()
+    for job in plan.jobs:
+        dimensions = tuple((name, job.params[name]) for name in plan.dimensions)
+        groups.setdefault(dimensions, []).append(job)
+
+    for dimensions, jobs in groups.items():
+        lines = []
+        usages = []
+
+        # RUN EXPERIMENT
+        # directories, placements and commands as spec.get_job_keys has them
+        for job in jobs:
+            run_key = [plan.experiment, job.params.get("scale_factor"),
+                       job.params.get("transaction_count")]
+            run_command(job.command, plan.experiment, run_key, spec.get_job_dir(plan, job),
+                        spec.get_job_cpus(plan, job, cpus), plan.estimate,
+                        spec.get_policy(plan, REPETITION_POLICY), collector)
+            run_lines = read_output_file()
+            lines.extend(run_lines)
+            usages.extend(rusage.read_usage_file(OUTPUT_FILE, len(run_lines)))
+
+        # COLLECT STATS
+        write_output_file(lines, usages)
+        collect_stats(plan.result_dir, plan.result_file, plan.experiment,
+                      dimensions=dimensions)
+
 # CONCURRENCY -- EVAL
 def concurrency_eval():
 
+    # the affinity sweep passes CONCURRENCY_THREAD_FLAG, so it stays opt-in
+    # until the hyadapt build is known to take it; --spec runs it too
+    if CONCURRENCY_AFFINITY_SWEEP:
+        spec_eval(CONCURRENCY_AFFINITY_SPEC)
+        return
+
     # CLEAN UP RESULT DIR
     clean_up_dir(CONCURRENCY_DIR)
 
     # RUN EXPERIMENT
     run_experiment(HYADAPT, CONCURRENCY_SCALE_FACTOR,
-                   CONCURRENCY_TRANSACTION_COUNT, CONCURRENCY_EXPERIMENT)
+                   CONCURRENCY_TRANSACTION_COUNT, CONCURRENCY_EXPERIMENT, CONCURRENCY_DIR)
 
     # COLLECT STATS
     collect_stats(CONCURRENCY_DIR, "concurrency.csv", CONCURRENCY_EXPERIMENT)
@@ -2058,88 +891,143 @@ if __name__ == '__main__':
     parser.add_argument("-l", "--caching_plot", help='plot caching', action='store_true')
     parser.add_argument("-m", "--hyrise_plot", help='plot hyrise', action='store_true')
     parser.add_argument("-n", "--concurrency_plot", help='plot concurrency', action='store_true')
+    parser.add_argument("--memory_plot", help='plot peak memory per layout and tile group size (row and column need -q --memory-layouts)', action='store_true')
+
+    parser.add_argument("--workers", help='parallel workers for per-configuration sweeps', type=int, default=SWEEP_WORKERS)
+    parser.add_argument("--force", help='wipe results and run journals, re-run every configuration and re-render every figure', action='store_true')
+    parser.add_argument("--plot-all", help='plot every figure on a pool of --workers processes', action='store_true')
+    parser.add_argument("--report", help='write every --plot-all figure into this one multi-page PDF, after a contents page')
+    parser.add_argument("--format", help='file format of every figure', choices=FIGURE_FORMATS, default=FIGURE_FORMAT)
+    parser.add_argument("--points-per-pixel", help='vertices kept per pixel of figure width of long series (0: all)', type=float, default=POINTS_PER_PIXEL)
+    parser.add_argument("--downsample", help='how long series are reduced to --points-per-pixel', choices=downsample.DOWNSAMPLE_METHODS, default=DOWNSAMPLE_METHOD)
+    parser.add_argument("--warmup-runs", help='discarded runs before measuring', type=int, default=WARMUP_RUNS)
+    parser.add_argument("--min-runs", help='minimum measured runs per configuration', type=int, default=MIN_RUNS)
+    parser.add_argument("--max-runs", help='maximum measured runs per configuration', type=int, default=MAX_RUNS)
+    parser.add_argument("--spec", help='eval the experiment described by this spec file', action='append')
+    parser.add_argument("--refine", help='sample --spec adaptively around crossovers (see refine.py)', action='store_true')
+    parser.add_argument("--crossovers", help='write where the layout curves cross to results/%s (see analytics.py)' % analytics.CROSSOVER_TABLE_FILE, action='store_true')
+    parser.add_argument("--dry-run", help='list the jobs and estimated cost of --spec instead of running them', action='store_true')
+    parser.add_argument("--queue", help='serve sweeps from this shared directory to --workers local and any remote workers')
+    parser.add_argument("--timeout-factor", help='stop runs taking this many times the slowest finished run (0: no limit)', type=float, default=TIMEOUT_FACTOR)
+    parser.add_argument("--retries", help='extra attempts for failed or timed-out runs', type=int, default=RETRY_COUNT)
+    parser.add_argument("--affinity-sweep", help='with -u, run once per affinity policy and thread count, pinned (needs CONCURRENCY_THREAD_FLAG)', action='store_true')
+    parser.add_argument("--memory-layouts", help='with -q, run the caching sweep over every layout for --memory_plot (3x the runs)', action='store_true')
+    parser.add_argument("--counters", help='record hardware counters of every run in counters.csv', action='store_true')
+    parser.add_argument("--ci-target", help='stop repeating once the 95%% CI is within this percent of the mean', type=float, default=CI_TARGET)
 
     args = parser.parse_args()
 
+    SWEEP_WORKERS = args.workers
+    FORCE_CLEAN = args.force
+    COLLECT_COUNTERS = args.counters
+    CONCURRENCY_AFFINITY_SWEEP = args.affinity_sweep
+    MEMORY_LAYOUTS = args.memory_layouts
+    POINTS_PER_PIXEL = args.points_per_pixel
+    DOWNSAMPLE_METHOD = args.downsample
+    FIGURE_FORMAT = args.format
+    if args.queue:
+        QUEUE_DIR = os.path.realpath(args.queue)
+    WATCHDOG_POLICY = watchdog.WatchdogPolicy(args.timeout_factor, MIN_TIMEOUT,
+                                              args.retries, RETRY_BACKOFF)
+    REPETITION_POLICY = repetition.RepetitionPolicy(args.warmup_runs, args.min_runs,
+                                                    max(args.min_runs, args.max_runs),
+                                                    args.ci_target)
+
     ## EVAL
 
     if args.projectivity:
         projectivity_eval()
 
     if args.projectivity_plot:
-        projectivity_plot();
+        load_plots().projectivity_plot();
 
     if args.selectivity:
         selectivity_eval()
 
     if args.selectivity_plot:
-        selectivity_plot();
+        load_plots().selectivity_plot();
 
     if args.operator:
         operator_eval()
 
     if args.operator_plot:
-        operator_plot();
+        load_plots().operator_plot();
 
     if args.horizontal:
         horizontal_eval()
 
     if args.horizontal_plot:
-        horizontal_plot()
+        load_plots().horizontal_plot()
 
     #if args.subset:
     #    subset_eval()
 
     #if args.subset_plot:
-    #    subset_plot()
+    #    load_plots().subset_plot()
 
     if args.adapt:
         adapt_eval()
 
     if args.adapt_plot:
-        adapt_plot()
+        load_plots().adapt_plot()
 
     if args.weight:
         weight_eval()
 
     if args.weight_plot:
-        weight_plot()
+        load_plots().weight_plot()
 
     if args.reorg:
         reorg_eval()
 
     if args.reorg_plot:
-        reorg_plot()
+        load_plots().reorg_plot()
 
     if args.distribution:
         distribution_eval()
 
     if args.distribution_plot:
-        distribution_plot()
+        load_plots().distribution_plot()
 
     if args.join:
         join_eval()
 
     if args.join_plot:
-        join_plot()
+        load_plots().join_plot()
 
     if args.caching:
         caching_eval()
 
     if args.caching_plot:
-        caching_plot()
+        load_plots().caching_plot()
 
     if args.hyrise:
         hyrise_eval()
 
     if args.hyrise_plot:
-        hyrise_plot()
+        load_plots().hyrise_plot()
 
     if args.concurrency:
         concurrency_eval()
 
     if args.concurrency_plot:
-        concurrency_plot()
+        load_plots().concurrency_plot()
+
+    if args.memory_plot:
+        load_plots().memory_plot()
+
+    if args.spec:
+        for spec_file in args.spec:
+            if args.refine and not args.dry_run:
+                refine_eval(spec_file)
+            else:
+                spec_eval(spec_file, args.dry_run)
+
+    if args.crossovers:
+        analytics.write_crossover_table()
+
+    if args.plot_all:
+        load_plots().plot_all(SWEEP_WORKERS, args.report)
 
     #create_legend()
     #create_bar_legend()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+###################################################################################
+# FIGURE CACHE
+###################################################################################
+
+from __future__ import print_function
+import os
+import sys
+import json
+import types
+import hashlib
+import inspect
+import logging
+
+import numpy as np
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Output figure -> what it was rendered from, next to the figures
+#   chart : name of the chart function
+#   code  : digest of the chart's code and the helpers and settings it uses
+#   data  : digest of the datasets read from the result store and the size
+MANIFEST_FILE_NAME = "figures.manifest"
+
+# Module-level values a chart may read, part of its code digest
+DIGEST_VALUE_TYPES = (int, float, str, bool, type(None))
+
+###################################################################################
+# DIGESTS
+###################################################################################
+
+def is_plain_value(value):
+    # settings whose repr is stable across runs
+    if isinstance(value, (tuple, list)):
+        return all(is_plain_value(item) for item in value)
+    return isinstance(value, DIGEST_VALUE_TYPES)
+
+def update_data_digest(digest, data):
+    if isinstance(data, np.ndarray):
+        digest.update(str((data.dtype.str, data.shape)).encode("utf-8"))
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, (list, tuple)):
+        digest.update(("[%d" % len(data)).encode("utf-8"))
+        for item in data:
+            update_data_digest(digest, item)
+    else:
+        digest.update(repr(data).encode("utf-8"))
+
+def get_code_names(code):
+    # names used in nested code too, e.g. comprehensions and lambdas
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names.update(get_code_names(constant))
+    return names
+
+def is_module_code(value, module_name):
+    return (isinstance(value, (types.FunctionType, type)) and
+            getattr(value, "__module__", None) == module_name)
+
+def update_code_digest(digest, code, visited):
+    """ Source of a function or class and of every function, class and
+        setting of its module it refers to, recursively: a chart goes stale
+        when a helper or a style constant it uses changes. Objects of the
+        module's classes stand for their class, fonts for their properties.
+    """
+    if code in visited:
+        return
+    visited.add(code)
+
+    try:
+        digest.update(inspect.getsource(code).encode("utf-8"))
+    except (IOError, OSError, TypeError):
+        # generated classes like namedtuples have no source
+        digest.update(repr(code).encode("utf-8"))
+        return
+
+    if isinstance(code, type):
+        functions = [value for value in vars(code).values() if isinstance(value, types.FunctionType)]
+    else:
+        functions = [code]
+
+    names = set()
+    for function in functions:
+        names.update(get_code_names(function.__code__))
+
+    module = sys.modules[code.__module__]
+    for name in sorted(names):
+        value = getattr(module, name, None)
+        if is_module_code(value, code.__module__):
+            update_code_digest(digest, value, visited)
+        elif is_module_code(type(value), code.__module__):
+            update_code_digest(digest, type(value), visited)
+        elif is_plain_value(value):
+            digest.update(("%s=%r" % (name, value)).encode("utf-8"))
+        elif hasattr(value, "get_fontconfig_pattern"):
+            digest.update(("%s=%s" % (name, value.get_fontconfig_pattern())).encode("utf-8"))
+
+def get_code_digest(function, shared=()):
+    """ Digest of a chart function and of the shared code, functions or
+        classes, every figure goes through besides it, like saving.
+    """
+    digest = hashlib.sha1()
+    visited = set()
+    update_code_digest(digest, function, visited)
+    for code in shared:
+        update_code_digest(digest, code, visited)
+    return digest.hexdigest()
+
+def get_figure_entry(job, code_digests=None, shared=()):
+    """ Manifest entry of a figure job. code_digests caches the digests of
+        chart functions shared by many figures.
+    """
+    if code_digests is None:
+        code_digests = {}
+    if job.chart not in code_digests:
+        code_digests[job.chart] = get_code_digest(job.chart, shared)
+
+    digest = hashlib.sha1()
+    update_data_digest(digest, job.datasets)
+    digest.update(("%r %r" % (job.width, job.height)).encode("utf-8"))
+
+    return {
+        "chart" : job.chart.__name__,
+        "code" : code_digests[job.chart],
+        "data" : digest.hexdigest(),
+    }
+
+def get_report_entry(jobs, shared=()):
+    """ Manifest entry of a report holding every figure of jobs, stale when
+        any of them is.
+    """
+    code_digests = {}
+    code = hashlib.sha1()
+    data = hashlib.sha1()
+    for job in jobs:
+        entry = get_figure_entry(job, code_digests, shared)
+        code.update(entry["code"].encode("utf-8"))
+        data.update((job.file_name + " " + entry["data"]).encode("utf-8"))
+
+    return {
+        "chart" : "report",
+        "code" : code.hexdigest(),
+        "data" : data.hexdigest(),
+    }
+
+###################################################################################
+# MANIFEST
+###################################################################################
+
+class FigureManifest(object):
+    """ What every output figure was last rendered from.
+
+        A figure is stale when its file is gone or its chart code, datasets
+        or size hash differently; only stale figures are rendered again.
+    """
+
+    def __init__(self, path=MANIFEST_FILE_NAME):
+        self.path = path
+        self.entries = {}
+
+        if os.path.exists(path):
+            self.load()
+
+    def load(self):
+        fp = open(self.path)
+        try:
+            self.entries = json.loads(fp.read())
+        except ValueError:
+            # torn write, render everything again
+            LOG.warning("Ignoring unreadable figure manifest %s", self.path)
+            self.entries = {}
+        fp.close()
+
+    def save(self):
+        temp_path = self.path + ".tmp"
+        fp = open(temp_path, "w")
+        fp.write(json.dumps(self.entries, indent=1, sort_keys=True))
+        fp.close()
+        os.rename(temp_path, self.path)
+
+    def get_reason(self, file_name, entry):
+        """ Why the figure has to be rendered, None when it is up to date.
+        """
+        if not os.path.exists(file_name):
+            return "missing"
+        recorded = self.entries.get(file_name)
+        if recorded is None:
+            return "not in manifest"
+        changed = [field for field in sorted(entry) if recorded.get(field) != entry[field]]
+        if changed:
+            return ", ".join(changed) + " changed"
+        return None
+
+    def record(self, file_name, entry):
+        self.entries[file_name] = entry
+
+def get_stale_jobs(jobs, manifest, force=False, shared=()):
+    """ (job, entry) of every figure that has to be rendered again; shared
+        is the code every figure goes through besides its chart.
+    """
+    code_digests = {}
+    stale = []
+    for job in jobs:
+        entry = get_figure_entry(job, code_digests, shared)
+        reason = "forced" if force else manifest.get_reason(job.file_name, entry)
+        if reason is not None:
+            LOG.debug("%s: %s", job.file_name, reason)
+            stale.append((job, entry))
+
+    LOG.info("%d of %d figures up to date", len(jobs) - len(stale), len(jobs))
+    return stale
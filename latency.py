@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+
+###################################################################################
+# LATENCY HISTOGRAMS
+###################################################################################
+
+from __future__ import print_function
+import os
+import json
+import logging
+import collections
+
+import numpy as np
+
+from config import SUMMARY_KEY_FIELDS, LATENCY_PERCENTILES
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Per-transaction latencies the benchmark writes next to the summary file, in
+# integer microseconds. Every line starts with the summary key fields of its
+# configuration, followed by either
+#   samples <latency> <latency> ...
+#   buckets <latency> <count> <latency> <count> ...
+LATENCY_OUTPUT_FILE = "outputfile.latency"
+
+SAMPLES_TAG = "samples"
+BUCKETS_TAG = "buckets"
+
+# Sub-buckets per power of two are 2 ** LATENCY_PRECISION_BITS, recorded
+# values are exact to within 2 ** -(LATENCY_PRECISION_BITS - 1)
+LATENCY_PRECISION_BITS = 8
+
+# Percentiles per configuration, one result directory per layout and theta
+LATENCY_FILE_NAME = "latency.csv"
+
+# Histograms of every configuration, for re-reading without the raw samples
+HISTOGRAM_FILE_NAME = "latency.json"
+
+# Layout codes of the summary lines, as collect_stats names them
+LAYOUT_NAMES = {"0" : "row", "1" : "column", "2" : "hybrid"}
+
+###################################################################################
+# HISTOGRAM
+###################################################################################
+
+class LatencyHistogram(object):
+    """ HDR-style histogram of non-negative integer latencies.
+
+        Values below 2 ** bits get a bucket each; above that every power of
+        two is split into 2 ** (bits - 1) buckets, so the relative error is
+        bounded across the whole range while a configuration costs a few
+        thousand counters at most, however many transactions it ran.
+    """
+
+    def __init__(self, bits=LATENCY_PRECISION_BITS):
+        self.bits = bits
+        self.sub_count = 1 << bits
+        self.half_count = 1 << (bits - 1)
+        self.counts = np.zeros(self.sub_count, dtype=np.int64)
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return int(self.counts.sum())
+
+    def get_indices(self, values):
+        values = np.maximum(np.ceil(np.asarray(values, dtype=float)), 0).astype(np.int64)
+        # bit length of every value
+        shifts = np.maximum(np.frexp(values.astype(float))[1] - self.bits, 0)
+        tops = values >> shifts
+        return np.where(shifts == 0, values,
+                        self.sub_count + (shifts - 1) * self.half_count + tops - self.half_count)
+
+    def get_highest_values(self, indices):
+        """ Largest value counted in each bucket.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        offsets = np.maximum(indices - self.sub_count, 0)
+        shifts = np.where(indices < self.sub_count, 0, offsets // self.half_count + 1)
+        tops = np.where(indices < self.sub_count, indices, offsets % self.half_count + self.half_count)
+        return ((tops + 1) << shifts) - 1
+
+    def record(self, values, counts=None):
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return
+        if counts is None:
+            counts = np.ones(values.size, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+
+        indices = self.get_indices(values)
+        if indices.max() >= len(self.counts):
+            self.counts = np.concatenate((self.counts,
+                                          np.zeros(indices.max() + 1 - len(self.counts), dtype=np.int64)))
+        np.add.at(self.counts, indices, counts)
+
+        recorded = values[counts > 0]
+        if recorded.size:
+            low, high = float(recorded.min()), float(recorded.max())
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+
+    def merge(self, other):
+        if other.bits != self.bits:
+            raise ValueError("Cannot merge histograms of %d and %d bits" % (self.bits, other.bits))
+        if len(other.counts) > len(self.counts):
+            self.counts = np.concatenate((self.counts,
+                                          np.zeros(len(other.counts) - len(self.counts), dtype=np.int64)))
+        self.counts[:len(other.counts)] += other.counts
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent):
+        """ Latency below which percent of the transactions finished, None
+            without any.
+        """
+        cumulative = np.cumsum(self.counts)
+        total = cumulative[-1]
+        if total == 0:
+            return None
+        rank = max(1, int(np.ceil(percent / 100.0 * total)))
+        index = int(np.searchsorted(cumulative, rank))
+        return float(min(self.get_highest_values(index), self.max))
+
+    def to_entry(self):
+        indices = np.nonzero(self.counts)[0]
+        return collections.OrderedDict([
+            ("bits", self.bits),
+            ("min", self.min),
+            ("max", self.max),
+            ("buckets", [[int(index), int(self.counts[index])] for index in indices]),
+        ])
+
+    @classmethod
+    def from_entry(cls, entry):
+        histogram = cls(entry["bits"])
+        if entry["buckets"]:
+            indices, counts = zip(*entry["buckets"])
+            histogram.counts = np.zeros(max(max(indices) + 1, histogram.sub_count), dtype=np.int64)
+            histogram.counts[list(indices)] = counts
+        histogram.min = entry["min"]
+        histogram.max = entry["max"]
+        return histogram
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def parse_latency_file(path=LATENCY_OUTPUT_FILE):
+    """ Histogram of every configuration in the benchmark's latency output,
+        keyed by its summary key fields.
+    """
+    histograms = collections.OrderedDict()
+    if not os.path.exists(path):
+        return histograms
+
+    key_length = len(SUMMARY_KEY_FIELDS)
+    fp = open(path)
+    for line in fp:
+        fields = line.split()
+        if len(fields) <= key_length:
+            continue
+
+        key = tuple(fields[:key_length])
+        tag = fields[key_length]
+        values = np.array(fields[key_length + 1:], dtype=float)
+
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram()
+
+        if tag == SAMPLES_TAG:
+            histogram.record(values)
+        elif tag == BUCKETS_TAG:
+            histogram.record(values[0::2], values[1::2])
+        else:
+            LOG.warning("Unknown latency line '%s' in %s", tag, path)
+    fp.close()
+
+    return histograms
+
+def merge_histograms(runs):
+    """ Pool the histograms of several runs configuration by configuration.
+    """
+    merged = collections.OrderedDict()
+    for histograms in runs:
+        for key, histogram in histograms.items():
+            if key not in merged:
+                merged[key] = LatencyHistogram(histogram.bits)
+            merged[key].merge(histogram)
+    return merged
+
+def to_entries(histograms):
+    return [[list(key), histogram.to_entry()] for key, histogram in histograms.items()]
+
+def from_entries(entries):
+    return collections.OrderedDict((tuple(key), LatencyHistogram.from_entry(entry))
+                                   for key, entry in entries)
+
+def get_params(key):
+    params = dict(zip(SUMMARY_KEY_FIELDS, key))
+    params["layout"] = LAYOUT_NAMES.get(params["layout"], params["layout"])
+    return params
+
+###################################################################################
+# RESULTS
+###################################################################################
+
+def write_latency(result_dir, histograms, path_fields=("layout", "theta"), x_field="sample_weight"):
+    """ Add the histograms to those already in result_dir, then write one
+        "x , p50 , p99 , ..." file per directory of path_fields and every
+        histogram in HISTOGRAM_FILE_NAME.
+    """
+    if not os.path.exists(result_dir):
+        os.makedirs(result_dir)
+
+    # runs of one eval report disjoint configurations
+    merged = read_latency(result_dir)
+    merged.update(histograms)
+    histograms = merged
+
+    rows = collections.OrderedDict()
+    for key, histogram in histograms.items():
+        params = get_params(key)
+        directory = os.path.join(result_dir, *[str(params[field]) for field in path_fields])
+        rows.setdefault(directory, []).append(
+            [float(params[x_field])] + [histogram.percentile(percent) for percent in LATENCY_PERCENTILES])
+
+    for directory, lines in rows.items():
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fp = open(os.path.join(directory, LATENCY_FILE_NAME), "w")
+        for line in sorted(lines):
+            fp.write(" , ".join(str(value) for value in line) + "\n")
+        fp.close()
+
+    fp = open(os.path.join(result_dir, HISTOGRAM_FILE_NAME), "w")
+    fp.write(json.dumps(to_entries(histograms)))
+    fp.close()
+
+def read_latency(result_dir):
+    """ Histograms written by write_latency, keyed by their summary key fields.
+    """
+    path = os.path.join(result_dir, HISTOGRAM_FILE_NAME)
+    if not os.path.exists(path):
+        return collections.OrderedDict()
+
+    fp = open(path)
+    entries = json.loads(fp.read())
+    fp.close()
+    return from_entries(entries)
+
+def latency_series(histograms, x_field="sample_weight", **filters):
+    """ [x, p50, p99, ...] rows of the matching configurations, sorted by x.
+        Filters compare as numbers where they can, like the result store.
+    """
+    def matches(value, expected):
+        try:
+            return float(value) == float(expected)
+        except ValueError:
+            return value == str(expected)
+
+    rows = []
+    for key, histogram in histograms.items():
+        params = get_params(key)
+        if all(matches(params[field], value) for field, value in filters.items()):
+            rows.append([float(params[x_field])] +
+                        [histogram.percentile(percent) for percent in LATENCY_PERCENTILES])
+
+    return np.array(sorted(rows), dtype=float).reshape(-1, 1 + len(LATENCY_PERCENTILES))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RESULT LOADER
+###################################################################################
+
+from __future__ import print_function
+import os
+import csv
+
+import numpy as np
+
+try:
+    xrange
+except NameError:
+    xrange = range
+
+# path -> (mtime, size, data)
+_DATA_CACHE = {}
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def loadDataFile(n_rows, n_cols, path):
+    file = open(path, "r")
+    reader = csv.reader(file)
+
+    data = [[0 for x in xrange(n_cols)] for y in xrange(n_rows)]
+
+    row_num = 0
+    for row in reader:
+        column_num = 0
+        for col in row:
+            data[row_num][column_num] = float(col)
+            column_num += 1
+        row_num += 1
+
+    return data
+
+def check_shape(path, data, n_rows=None, n_cols=None):
+    """ Raise when data does not have the expected number of rows or
+        columns, e.g. for a truncated result file.
+    """
+    if n_cols is not None and len(data) and data.shape[1] != n_cols:
+        raise ValueError("Result file %s has %d columns, expected %d" % (path, data.shape[1], n_cols))
+    if n_rows is not None and len(data) != n_rows:
+        raise ValueError("Result file %s has %d rows, expected %d" % (path, len(data), n_rows))
+
+def parse_data_file(path, n_rows=None, n_cols=None):
+    """ Parse a "x , y" result file into a 2D float array.
+        The shape comes from the file itself: one row per line and as many
+        columns as the first line has fields. Files with ragged rows raise,
+        and so do files without the n_rows rows or n_cols columns expected.
+    """
+    fp = open(path, "r")
+    text = fp.read()
+    fp.close()
+
+    first_line = text.lstrip().split("\n", 1)[0]
+    if not first_line:
+        data = np.zeros((0, n_cols or 2))
+        check_shape(path, data, n_rows, n_cols)
+        return data
+    line_cols = first_line.count(",") + 1
+
+    values = np.array(text.replace(",", " ").split(), dtype=float)
+    if values.size % line_cols != 0:
+        raise ValueError("Ragged result file %s (%d values, %d columns)" % (path, values.size, line_cols))
+
+    data = values.reshape(-1, line_cols)
+    check_shape(path, data, n_rows, n_cols)
+    return data
+
+def load_data_file(path, n_rows=None, n_cols=None):
+    """ Cached version of parse_data_file. Entries are reused until the file's
+        mtime or size changes. The returned array is shared, so it is read-only.
+    """
+    stat = os.stat(path)
+    key = os.path.realpath(path)
+
+    cached = _DATA_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        check_shape(path, cached[2], n_rows, n_cols)
+        return cached[2]
+
+    data = parse_data_file(path)
+    data.flags.writeable = False
+    _DATA_CACHE[key] = (stat.st_mtime, stat.st_size, data)
+
+    check_shape(path, data, n_rows, n_cols)
+    return data
+
+def clear_data_cache():
+    _DATA_CACHE.clear()
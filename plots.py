@@ -0,0 +1,1925 @@
+#!/usr/bin/env python
+
+###################################################################################
+# TILE GROUP PLOTS
+###################################################################################
+
+from __future__ import print_function
+import os
+import math
+import time
+import logging
+import collections
+import multiprocessing
+
+import numpy as np
+import matplotlib.pyplot as plot
+import pylab
+
+from matplotlib.font_manager import FontProperties
+from matplotlib.ticker import MaxNLocator
+from matplotlib.ticker import LogLocator
+from matplotlib.ticker import LinearLocator
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.lines import Line2D
+from matplotlib import rc
+import matplotlib.font_manager as font_manager
+
+import brewer2mpl
+import matplotlib
+
+from config import *
+import latency
+import figcache
+import downsample
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# OUTPUT CONFIGURATION
+###################################################################################
+
+BASE_DIR = os.path.dirname(__file__)
+OPT_FONT_NAME = 'Helvetica'
+OPT_GRAPH_HEIGHT = 300
+OPT_GRAPH_WIDTH = 400
+
+# Lines and collections with more vertices than this are drawn as an image
+# at RASTER_DPI in PDF and SVG output; PNG output is drawn at PNG_DPI
+RASTERIZE_VERTEX_COUNT = 2000
+RASTER_DPI = 150
+PNG_DPI = 300
+
+# Contents page of the report, A4 portrait in inches
+REPORT_TITLE = "Tile Group Experiments"
+REPORT_PAGE_SIZE = (8.27, 11.69)
+
+# Make a list by cycling through the colors you care about
+# to match the length of your data.
+NUM_COLORS = 5
+COLOR_MAP = ( '#F58A87', '#80CA86', '#9EC9E9', '#FED113', '#D89761' )
+
+OPT_COLORS = COLOR_MAP
+
+OPT_GRID_COLOR = 'gray'
+OPT_LEGEND_SHADOW = False
+OPT_MARKERS = (['o', 's', 'v', "^", "h", "v", ">", "x", "d", "<", "|", "", "|", "_"])
+OPT_PATTERNS = ([ "////", "////", "o", "o", "\\\\" , "\\\\" , "//////", "//////", ".", "." , "\\\\\\" , "\\\\\\" ])
+
+OPT_LABEL_WEIGHT = 'bold'
+OPT_LINE_COLORS = COLOR_MAP
+OPT_LINE_WIDTH = 3.0
+OPT_MARKER_SIZE = 6.0
+
+AXIS_LINEWIDTH = 1.3
+BAR_LINEWIDTH = 1.2
+
+# SET FONT
+
+LABEL_FONT_SIZE = 14
+TICK_FONT_SIZE = 12
+TINY_FONT_SIZE = 8
+LEGEND_FONT_SIZE = 16
+
+SMALL_LABEL_FONT_SIZE = 10
+SMALL_LEGEND_FONT_SIZE = 10
+
+AXIS_LINEWIDTH = 1.3
+BAR_LINEWIDTH = 1.2
+
+# SET FONT
+
+LABEL_FONT_SIZE = 14
+TICK_FONT_SIZE = 12
+TINY_FONT_SIZE = 8
+LEGEND_FONT_SIZE = 16
+
+SMALL_LABEL_FONT_SIZE = 10
+SMALL_LEGEND_FONT_SIZE = 10
+
+AXIS_LINEWIDTH = 1.3
+BAR_LINEWIDTH = 1.2
+
+# SET TYPE1 FONTS
+matplotlib.rcParams['ps.useafm'] = True
+matplotlib.rcParams['font.family'] = OPT_FONT_NAME
+matplotlib.rcParams['pdf.use14corefonts'] = True
+#matplotlib.rcParams['text.usetex'] = True
+#matplotlib.rcParams['text.latex.preamble']=[r'\usepackage{euler}']
+
+LABEL_FP = FontProperties(style='normal', size=LABEL_FONT_SIZE, weight='bold')
+TICK_FP = FontProperties(style='normal', size=TICK_FONT_SIZE)
+TINY_FP = FontProperties(style='normal', size=TINY_FONT_SIZE)
+LEGEND_FP = FontProperties(style='normal', size=LEGEND_FONT_SIZE, weight='bold')
+
+SMALL_LABEL_FP = FontProperties(style='normal', size=SMALL_LABEL_FONT_SIZE, weight='bold')
+SMALL_LEGEND_FP = FontProperties(style='normal', size=SMALL_LEGEND_FONT_SIZE, weight='bold')
+
+YAXIS_TICKS = 3
+YAXIS_ROUND = 1000.0
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def next_power_of_10(n):
+    return (10 ** math.ceil(math.log(n, 10)))
+
+def get_upper_bound(n):
+    return (math.ceil(n / YAXIS_ROUND) * YAXIS_ROUND)
+
+# # MAKE GRID
+def makeGrid(ax):
+    axes = ax.get_axes()
+    axes.yaxis.grid(True, color=OPT_GRID_COLOR)
+    for axis in ['top','bottom','left','right']:
+            ax.spines[axis].set_linewidth(AXIS_LINEWIDTH)
+    ax.set_axisbelow(True)
+
+# # COUNT VERTICES
+def countVertices(artist):
+    if isinstance(artist, Line2D):
+        return len(artist.get_xydata())
+    count = len(artist.get_offsets())
+    for path in artist.get_paths():
+        count += len(path.vertices)
+    return count
+
+# # RASTERIZE DENSE ARTISTS
+def rasterizeDenseArtists(fig):
+    for ax in fig.axes:
+        for artist in list(ax.lines) + list(ax.collections):
+            if countVertices(artist) > RASTERIZE_VERTEX_COUNT:
+                artist.set_rasterized(True)
+
+# # SET GRAPH SIZE
+def setGraphSize(fig, width, height):
+    size = fig.get_size_inches()
+    dpi = fig.get_dpi()
+    LOG.debug("Current Size Inches: %s, DPI: %d" % (str(size), dpi))
+
+    new_size = (width / float(dpi), height / float(dpi))
+    fig.set_size_inches(new_size)
+    new_size = fig.get_size_inches()
+    new_dpi = fig.get_dpi()
+    LOG.debug("New Size Inches: %s, DPI: %d" % (str(new_size), new_dpi))
+
+# # SAVE GRAPH
+def saveGraph(fig, output, width, height):
+    setGraphSize(fig, width, height)
+    rasterizeDenseArtists(fig)
+
+    output_format = os.path.splitext(output)[1][1:] or FIGURE_FORMAT
+    dpi = PNG_DPI if output_format == 'png' else RASTER_DPI
+    fig.savefig(output, format=output_format, bbox_inches='tight', dpi=dpi)
+    LOG.info("OUTPUT: %s", output)
+
+###################################################################################
+# CHART CONTEXT
+###################################################################################
+
+# Draw every chart of a process on one figure, clearing its axes in between,
+# instead of creating a figure per chart. The output files are the same either
+# way. New axes are cleared the same way on creation, so this only saves the
+# figure and pyplot bookkeeping (benchmark.py --charts).
+REUSE_FIGURES = True
+
+class ChartContext(object):
+    """ Figure and axes the charts of a process draw on, and the styles they
+        share.
+
+        With reuse the context keeps one figure and clears its axes between
+        charts; a chart that added axes or figure artists of its own gets a
+        cleared figure.
+    """
+
+    def __init__(self, reuse=None):
+        self.reuse = REUSE_FIGURES if reuse is None else reuse
+        self.fig = None
+        self.ax = None
+        self.tick_kw = None
+
+    def new_chart(self):
+        """ (fig, ax1) of the next chart, in the state of a new figure.
+        """
+        if not self.reuse or self.fig is None or not plot.fignum_exists(self.fig.number):
+            self.fig = plot.figure()
+            self.add_axes()
+        elif self.fig.axes != [self.ax] or self.fig.texts or self.fig.legends:
+            self.fig.clf()
+            self.add_axes()
+        else:
+            # cla() keeps the tick parameters and spine widths charts set
+            for axis, (major_kw, minor_kw) in zip((self.ax.xaxis, self.ax.yaxis), self.tick_kw):
+                axis._major_tick_kw = dict(major_kw)
+                axis._minor_tick_kw = dict(minor_kw)
+            self.ax.cla()
+            for spine in self.ax.spines.values():
+                spine.set_linewidth(matplotlib.rcParams['axes.linewidth'])
+        return self.fig, self.ax
+
+    def add_axes(self):
+        self.ax = self.fig.add_subplot(111)
+        # tick parameters of new axes, which tick_params() changes for later charts
+        self.tick_kw = [(dict(axis._major_tick_kw), dict(axis._minor_tick_kw))
+                        for axis in (self.ax.xaxis, self.ax.yaxis)]
+
+    def style_ticks(self, ax, fp=TICK_FP):
+        """ Sets the font of the current tick labels of ax, as the charts did
+            label by label.
+        """
+        for label in ax.get_yticklabels() + ax.get_xticklabels():
+            label.set_fontproperties(fp)
+
+    def release(self, fig):
+        """ Done with fig once it is saved. The shared figure stays open.
+        """
+        if not self.reuse or fig is not self.fig:
+            plot.close(fig)
+
+CHART_CONTEXT = ChartContext()
+
+###################################################################################
+# PLOT
+###################################################################################
+
+def create_bar_legend():
+    fig = pylab.figure()
+    ax1 = fig.add_subplot(111)
+
+    figlegend = pylab.figure(figsize=(9, 0.5))
+
+    num_items = len(LAYOUTS);
+    ind = np.arange(1)
+    margin = 0.10
+    width = ((1.0 - 2 * margin) / num_items) * 2
+    data = [1]
+
+    bars = [None] * (len(LAYOUTS) + 1) * 2
+
+    # TITLE
+    idx = 0
+    bars[idx] = ax1.bar(ind + margin + ((idx) * width), data, width,
+                        color = 'w',
+                        linewidth=0)
+
+    idx = 0
+    for group in xrange(len(LAYOUTS)):
+        bars[idx + 1] = ax1.bar(ind + margin + ((idx + 1) * width), data, width,
+                              color=OPT_COLORS[idx],
+                              hatch=OPT_PATTERNS[idx * 2],
+                              linewidth=BAR_LINEWIDTH)
+
+        idx = idx + 1
+
+    TITLE = "Storage Models : "
+    LABELS = [TITLE, "NSM", "DSM", "FSM"]
+
+    # LEGEND
+    figlegend.legend(bars, LABELS, prop=LEGEND_FP,
+                     loc=1, ncol=4,
+                     mode="expand", shadow=OPT_LEGEND_SHADOW,
+                     frameon=False, borderaxespad=0.0,
+                     handleheight=1.5, handlelength=4)
+
+    figlegend.savefig('legend_bar.pdf')
+
+def create_horizontal_legend():
+    fig = pylab.figure()
+    ax1 = fig.add_subplot(111)
+
+    figlegend = pylab.figure(figsize=(12, 0.5))
+
+    num_items = len(LAYOUTS);
+    ind = np.arange(1)
+    margin = 0.10
+    width = ((1.0 - 2 * margin) / num_items) * 2
+    data = [1]
+
+    bars = [None] * (len(TUPLES_PER_TILEGROUP) + 1) * 2
+
+    # TITLE
+    idx = 0
+    bars[idx] = ax1.bar(ind + margin + ((idx) * width), data, width,
+                        color = 'w',
+                        linewidth=0)
+
+    idx = 0
+    for group in xrange(len(TUPLES_PER_TILEGROUP)):
+        bars[idx + 1] = ax1.bar(ind + margin + ((idx + 1) * width), data, width,
+                              color=OPT_COLORS[idx],
+                              linewidth=BAR_LINEWIDTH)
+
+        idx = idx + 1
+
+
+    TITLE = "Tuples Per Tile Group : "
+    LABELS = [TITLE, 100, 1000, 10000, 100000]
+
+    # LEGEND
+    figlegend.legend(bars, LABELS, prop=LEGEND_FP,
+                     loc=1, ncol=6,
+                     mode="expand", shadow=OPT_LEGEND_SHADOW,
+                     frameon=False, borderaxespad=0.0,
+                     handleheight=1.5, handlelength=4)
+
+    figlegend.savefig('legend_horizontal.pdf')
+
+def create_legend():
+    fig = pylab.figure()
+    ax1 = fig.add_subplot(111)
+
+    figlegend = pylab.figure(figsize=(9, 0.5))
+    idx = 0
+    lines = [None] * (len(LAYOUTS) + 1)
+    data = [1]
+    x_values = [1]
+
+    TITLE = "Storage Models : "
+    LABELS = [TITLE, "NSM", "DSM", "FSM"]
+
+    lines[idx], = ax1.plot(x_values, data, linewidth = 0)
+    idx = 0
+
+    for group in xrange(len(LAYOUTS)):
+        lines[idx + 1], = ax1.plot(x_values, data,
+                               color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                               marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # LEGEND
+    figlegend.legend(lines, LABELS, prop=LEGEND_FP,
+                     loc=1, ncol=4, mode="expand", shadow=OPT_LEGEND_SHADOW,
+                     frameon=False, borderaxespad=0.0, handlelength=4)
+
+    figlegend.savefig('legend.pdf')
+
+
+def create_hyrise_legend():
+    fig = pylab.figure()
+    ax1 = fig.add_subplot(111)
+
+    figlegend = pylab.figure(figsize=(6, 0.5))
+    idx = 0
+    lines = [None] * (len(LAYOUTS))
+    data = [1]
+    x_values = [1]
+
+    LABELS = ["Static Layout", "Dynamic Layout"]
+
+    for group in xrange(len(LAYOUTS) - 1):
+        lines[idx], = ax1.plot(x_values, data,
+                               color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                               marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # LEGEND
+    figlegend.legend(lines, LABELS, prop=LEGEND_FP,
+                     loc=1, ncol=4, mode="expand", shadow=OPT_LEGEND_SHADOW,
+                     frameon=False, borderaxespad=0.0, handlelength=4)
+
+    figlegend.savefig('legend_hyrise.pdf')
+
+def create_projectivity_bar_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    x_values = PROJECTIVITY
+    N = len(x_values)
+    x_labels = PROJECTIVITY
+
+    layouts = ["NSM", "DSM", "FSM"]
+
+    ind = np.arange(N)
+    margin = 0.15
+    width = ((1.0 - 2 * margin) / N)
+    bars = [None] * len(layouts) * N
+
+    print(datasets)
+
+    for group in xrange(len(datasets)):
+        # GROUP
+        latencies = []
+
+        for line in  xrange(len(datasets[group])):
+            for col in  xrange(len(datasets[group][line])):
+                if col == 1:
+                    latencies.append(datasets[group][line][col])
+
+        LOG.info("%s group_data = %s ", layouts, str(latencies))
+
+        bars[group] = ax1.bar(ind + margin + (group * width), latencies, width,
+                              color=OPT_COLORS[group],
+                              hatch=OPT_PATTERNS[group*2],
+                              linewidth=BAR_LINEWIDTH)
+
+
+    # GRID
+    axes = ax1.get_axes()
+    #axes.set_ylim(0.01, 1000000)
+    makeGrid(ax1)
+
+    # Y-AXIS
+    YAXIS_MIN = 0
+    YAXIS_MAX = 45000
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    #ax1.set_ylim([YAXIS_MIN, YAXIS_MAX])
+    #ax1.set_yscale('log', nonposy='clip', basey=2)
+
+    # X-AXIS
+    ax1.set_xlabel("Fraction of Attributes Projected", fontproperties=LABEL_FP)
+    ax1.set_xticklabels(x_labels)
+    ax1.set_xticks(ind + 0.5)
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_selectivity_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = SELECTIVITY
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(LAYOUTS);
+    ind = np.arange(N)
+    idx = 0
+
+    # GROUP
+    for group_index, group in enumerate(LAYOUTS):
+        group_data = []
+
+        # LINE
+        for line_index, line in enumerate(x_values):
+            group_data.append(datasets[group_index][line_index][1])
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    #YAXIS_MIN = pow(2.0, 13)
+    #YAXIS_MAX = pow(2.0, 19)
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    #ax1.set_ylim([YAXIS_MIN, YAXIS_MAX])
+    #ax1.set_yscale('log', basey=2)
+
+    # X-AXIS
+    XAXIS_MIN = 0.1
+    XAXIS_MAX = 1.1
+    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
+    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_horizontal_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = SELECTIVITY
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(TUPLES_PER_TILEGROUP);
+    ind = np.arange(N)
+    idx = 0
+
+    # GROUP
+    for group_index, group in enumerate(TUPLES_PER_TILEGROUP):
+        group_data = []
+
+        # LINE
+        for line_index, line in enumerate(x_values):
+            group_data.append(datasets[group_index][line_index][1])
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    #ax1.set_yscale('log', basey=10)
+
+    # X-AXIS
+    XAXIS_MIN = 0.1
+    XAXIS_MAX = 1.1
+    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
+    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_caching_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = SELECTIVITY
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(TUPLES_PER_TILEGROUP);
+    ind = np.arange(N)
+    idx = 0
+
+    # GROUP
+    for group_index, group in enumerate(TUPLES_PER_TILEGROUP):
+        group_data = []
+
+        # LINE
+        for line_index, line in enumerate(x_values):
+            group_data.append(datasets[group_index][line_index][1]/1000000)
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Cache Misses (M)", fontproperties=LABEL_FP)
+    #ax1.set_yscale('log', basey=10)
+
+    # X-AXIS
+    XAXIS_MIN = 0.1
+    XAXIS_MAX = 1.1
+    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
+    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_operator_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = OP_SELECTIVITY
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(LAYOUTS);
+    ind = np.arange(N)
+    idx = 0
+
+    YLIMIT = 0
+
+    # GROUP
+    for group_index, group in enumerate(LAYOUTS):
+        group_data = []
+
+        # LINE
+        for line_index, line in enumerate(x_values):
+            group_data.append(datasets[group_index][line_index][1])
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+        YLIMIT = max(YLIMIT, max(group_data))
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    YLIMIT = next_power_of_10(YLIMIT)
+
+    # X-AXIS
+    XAXIS_MIN = 0.05
+    XAXIS_MAX = 1.05
+    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
+    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
+    x_values = (0.2, 0.4, 0.6, 0.8, 1.0)
+    ax1.set_xticks(x_values)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    #ax1.set_yscale('log', basey=2)
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_subset_bar_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    x_values = SELECTIVITY
+    N = len(x_values)
+    x_labels = SELECTIVITY
+
+    ind = np.arange(N)
+    margin = 0.15
+    width = ((1.0 - 2 * margin) / N)
+    bars = [None] * len(SUBSET_RATIOS) * N
+
+    for group in xrange(len(datasets)):
+        # GROUP
+        latencies = []
+
+        for line in  xrange(len(datasets[group])):
+            for col in  xrange(len(datasets[group][line])):
+                if col == 1:
+                    latencies.append(datasets[group][line][col])
+
+        LOG.info("%s latencies = %s ", SUBSET_RATIOS[group], str(latencies))
+
+        bars[group] = ax1.bar(ind + margin + (group * width), latencies, width,
+                              color=OPT_COLORS[group],
+                              hatch=OPT_PATTERNS[group*2],
+                              linewidth=BAR_LINEWIDTH)
+
+
+    # GRID
+    axes = ax1.get_axes()
+    #axes.set_ylim(0.01, 1000000)
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+
+    # X-AXIS
+    ax1.set_xlabel("Fraction of Tuples Selected", fontproperties=LABEL_FP)
+    ax1.set_xticklabels(x_labels)
+    ax1.set_xticks(ind + 0.5)
+    ax1.tick_params(axis='x', which='both', bottom='off', top='off')
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    TITLE = "Subset Ratio"
+    LABELS = SUBSET_RATIOS
+
+    # LEGEND
+    ax1.legend(bars, LABELS, prop=LEGEND_FP,
+               loc='upper left',
+               title = TITLE,
+               ncol=3, shadow=OPT_LEGEND_SHADOW,
+               frameon=False, borderaxespad=0.0,
+               handleheight=0.25, handlelength=0.75)
+
+    ax1.get_legend().get_title().set_fontproperties(LABEL_FP)
+    ax1.get_legend().get_title().set_position((-55, 0))
+
+    return (fig)
+
+def create_ycsb_bar_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    x_values = YCSB_OPERATIONS
+    N = len(x_values)
+    x_labels = YCSB_OPERATIONS
+
+    ind = np.arange(N)
+    margin = 0.15
+    width = ((1.0 - 2 * margin) / N) * 2
+    bars = [None] * len(LAYOUTS) * N
+
+    for group in xrange(len(datasets)):
+        # GROUP
+        latencies = []
+
+        for line in  xrange(len(datasets[group])):
+            for col in  xrange(len(datasets[group][line])):
+                if col == 1:
+                    latencies.append(datasets[group][line][col])
+
+        LOG.info("%s latencies = %s ", LAYOUTS[group], str(latencies))
+
+        bars[group] = ax1.bar(ind + margin + (group * width), latencies, width,
+                              color=OPT_COLORS[group],
+                              hatch=OPT_PATTERNS[group*2],
+                              linewidth=BAR_LINEWIDTH)
+
+
+    # GRID
+    axes = ax1.get_axes()
+    #axes.set_ylim(0.01, 1000000)
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+
+    # X-AXIS
+    #ax1.set_xlabel("Number of transactions", fontproperties=LABEL_FP)
+    ax1.set_xticklabels(x_labels)
+    ax1.set_xticks(ind + 0.5)
+    ax1.tick_params(axis='x', which='both', bottom='off', top='off')
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_adapt_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = list(xrange(1, ADAPT_QUERY_COUNT + 1))
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(LAYOUTS);
+    ind = np.arange(N)
+    idx = 0
+
+    ADAPT_OPT_LINE_WIDTH = 3.0
+    ADAPT_OPT_MARKER_SIZE = 5.0
+    ADAPT_OPT_MARKER_FREQUENCY = 10
+
+    LABELS = ["NSM", "DSM", "FSM"]
+
+    # GROUP
+    for group_index, group in enumerate(LAYOUTS):
+        # LINE
+        group_x = datasets[group_index][:, 0]
+        group_data = datasets[group_index][:, 1]
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(group_x, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE,
+                 markevery=get_marker_indices(group_x, ADAPT_OPT_MARKER_FREQUENCY), label=LABELS[idx])
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    YMIN = 0
+    YMAX = 2500
+    ax1.set_ylim([YMIN, YMAX])
+    #ax1.set_yscale('log', basey=10)
+
+    # X-AXIS
+    ax1.set_xlabel("Query Sequence", fontproperties=LABEL_FP)
+    major_ticks = np.arange(0, ADAPT_QUERY_COUNT + 1, REPEAT_ADAPT_TEST * 2)
+    ax1.set_xticks(major_ticks)
+
+    legend = ax1.legend(loc='upper center', prop=LABEL_FP,
+                        ncol=3,
+                        shadow=OPT_LEGEND_SHADOW,
+                        frameon=False, borderaxespad=0.0,
+                        handleheight=1.5, handlelength=2)
+
+    #for major_tick in major_ticks[1:-1]:
+    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
+
+    # LABELS
+    y_mark = 0.72
+    x_mark_count = 1.0/NUM_ADAPT_TESTS
+    x_mark_offset = x_mark_count/2 - x_mark_count/4
+    x_marks = np.arange(0, 1, x_mark_count)
+
+    ADAPT_LABELS = (["Scan", "Insert", "Scan", "Insert",
+                     "Scan", "Insert", "Scan", "Insert",
+                     "Scan", "Insert", "Scan", "Insert"])
+
+    for idx, x_mark in enumerate(x_marks):
+            ax1.text(x_mark + x_mark_offset,
+                     y_mark,
+                     ADAPT_LABELS[idx],
+                     transform=ax1.transAxes,
+                     bbox=dict(facecolor='skyblue', alpha=0.5))
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_hyrise_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = list(xrange(1, HYRISE_QUERY_COUNT + 1))
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(HYRISE_LAYOUTS);
+    ind = np.arange(N)
+    idx = 0
+
+    ADAPT_OPT_LINE_WIDTH = 3.0
+    ADAPT_OPT_MARKER_SIZE = 5.0
+    ADAPT_OPT_MARKER_FREQUENCY = 10
+
+    # GROUP
+    for group_index, group in enumerate(HYRISE_LAYOUTS):
+        # LINE
+        group_x = datasets[group_index][:, 0]
+        group_data = datasets[group_index][:, 1]
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(group_x, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE,
+                 markevery=get_marker_indices(group_x, ADAPT_OPT_MARKER_FREQUENCY), label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    YAXIS_MIN = pow(2.0, 7)
+    YAXIS_MAX = pow(2.0, 12)
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylim([YAXIS_MIN, YAXIS_MAX])
+    ax1.set_ylabel("Execution time (s)", fontproperties=LABEL_FP)
+    ax1.set_yscale('log', basey=2)
+    ax1.set_yticklabels(['64', '128', '256', '512', '1024', '2048','4096'])
+
+    # X-AXIS
+    ax1.set_xlabel("Query Sequence", fontproperties=LABEL_FP)
+    major_ticks = np.arange(0, HYRISE_QUERY_COUNT + 1, REPEAT_HYRISE_TEST)
+    ax1.set_xticks(major_ticks)
+
+    #for major_tick in major_ticks[1:-1]:
+    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
+
+    # LABELS
+    y_mark = 0.85
+    x_mark_count = 1.0/NUM_HYRISE_TESTS
+    x_mark_offset = x_mark_count/2 - x_mark_count/4
+    x_marks = np.arange(0, 1, x_mark_count)
+
+    HYRISE_LABELS = (["Scan-H", "Scan-L", "Scan-H", "Scan-L"])
+
+    for idx, x_mark in enumerate(x_marks):
+            ax1.text(x_mark + x_mark_offset,
+                     y_mark,
+                     HYRISE_LABELS[idx],
+                     transform=ax1.transAxes,
+                     bbox=dict(facecolor='skyblue', alpha=0.5))
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_weight_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = list(xrange(1, WEIGHT_QUERY_COUNT + 1))
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(SAMPLE_WEIGHTS);
+    ind = np.arange(N)
+    idx = 0
+    lines = [None] * (len(SAMPLE_WEIGHTS) + 1)
+
+    ADAPT_OPT_LINE_WIDTH = 3.0
+    ADAPT_OPT_MARKER_SIZE = 5.0
+
+    # GROUP
+    for group_index, group in enumerate(SAMPLE_WEIGHTS):
+        # LINE
+        group_x = datasets[group_index][:, 0]
+        group_data = datasets[group_index][:, 1]
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        lines[idx], = ax1.plot(group_x, group_data, color=OPT_LINE_COLORS[idx],
+                               linewidth=ADAPT_OPT_LINE_WIDTH,
+                               label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    YMIN = 0
+    YMAX = COLUMN_COUNTS[1]
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Split Point", fontproperties=SMALL_LABEL_FP)
+    ax1.set_ylim((YMIN, YMAX))
+    #ax1.set_yscale('log', basey=10)
+
+    # X-AXIS
+    ax1.set_xlabel("Query Sequence", fontproperties=SMALL_LABEL_FP)
+    major_ticks = np.arange(0, WEIGHT_QUERY_COUNT + 1, REPEAT_WEIGHT_TEST * 2)
+    ax1.set_xticks(major_ticks)
+
+    #for major_tick in major_ticks[1:-1]:
+    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
+
+    TITLE = "Weight"
+    LABELS = SAMPLE_WEIGHTS
+
+    # LEGEND
+    ax1.legend(lines, LABELS, prop=SMALL_LEGEND_FP, title = TITLE,
+               loc=0, ncol=2, shadow=OPT_LEGEND_SHADOW,
+               frameon=False, borderaxespad=0.0, handlelength=2)
+
+    ax1.get_legend().get_title().set_fontproperties(SMALL_LEGEND_FP)
+    ax1.get_legend().get_title().set_position((-50, 0))
+
+    return (fig)
+
+def create_reorg_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = list(xrange(1, REORG_QUERY_COUNT + 1))
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = len(REORG_LAYOUTS);
+    ind = np.arange(N)
+    idx = 0
+    lines = [None] * (len(REORG_LAYOUTS) + 1)
+
+    ADAPT_OPT_LINE_WIDTH = 3.0
+    ADAPT_OPT_MARKER_SIZE = 5.0
+
+    # GROUP
+    for group_index, group in enumerate(REORG_LAYOUTS):
+        group_data = []
+
+        # LINE
+        for line_index, line in enumerate(x_values):
+            group_data.append(datasets[group_index][line_index][1])
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        lines[idx], = ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    YMIN = pow(10, 2)
+    YMAX = pow(10, 6)
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Execution time (s)", fontproperties=SMALL_LABEL_FP)
+    #ax1.set_ylim((YMIN, YMAX))
+    ax1.set_yscale('log', nonposy='clip')
+    #ax1.yaxis.set_major_locator(LogLocator(base = 10.0))
+    ax1.set_yticklabels(['10', '100', '1000', '10000', '100000'])
+    ax1.minorticks_off()
+
+    # X-AXIS
+    REORG_INTERVAL = 25
+    ax1.set_xlabel("Query Sequence", fontproperties=SMALL_LABEL_FP)
+    major_ticks = np.arange(0, REORG_QUERY_COUNT + 1, REORG_INTERVAL)
+    ax1.set_xticks(major_ticks)
+
+    #for major_tick in major_ticks[1:-1]:
+    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
+
+    TITLE = "Reorganization Type"
+    LABELS = ("Immediate", "Incremental")
+
+    # LEGEND
+    ax1.legend(lines, LABELS, prop=SMALL_LEGEND_FP, title = TITLE,
+               loc="upper left", ncol=2, shadow=OPT_LEGEND_SHADOW,
+               frameon=False, borderaxespad=0.0, handlelength=2)
+
+    ax1.get_legend().get_title().set_fontproperties(SMALL_LEGEND_FP)
+    ax1.get_legend().get_title().set_position((-40, 0))
+
+    return (fig)
+
+def create_distribution_stack_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    # X-AXIS
+    x_values = list(xrange(0, DIST_QUERY_COUNT))
+    N = len(x_values)
+    x_labels = x_values
+
+    num_items = DIST_TILE_GROUP_TYPES;
+    ind = np.arange(N)
+    idx = 0
+    lines = [None] * (DIST_TILE_GROUP_TYPES + 1)
+
+    ADAPT_OPT_LINE_WIDTH = 3.0
+    ADAPT_OPT_MARKER_SIZE = 5.0
+
+    # GROUP
+    for group_index, group in enumerate(datasets):
+        group_data = []
+
+        # LINE
+        for line_index, line in enumerate(x_values):
+            group_data.append(datasets[group_index][line_index][1])
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        if group_index == 0:
+            continue
+
+        lines[idx], = ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=ADAPT_OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=ADAPT_OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Tile Group Count ", fontproperties=SMALL_LABEL_FP)
+    #ax1.set_yscale('log', basey=10)
+
+    # X-AXIS
+    ax1.set_xlabel("Query Segment", fontproperties=SMALL_LABEL_FP)
+    major_ticks = np.arange(0, DIST_QUERY_COUNT, 1)
+    ax1.set_xticks(major_ticks)
+
+    #for major_tick in major_ticks[1:-1]:
+    #    ax1.axvline(major_tick, color='0.5', linestyle='dashed', linewidth=ADAPT_OPT_LINE_WIDTH)
+
+    TITLE = "Tile Group Layouts"
+    LABELS = ("FSM", "NSM", "T3", "T4", "T5")
+
+    # Clean up list
+    LABELS = LABELS[:DIST_TILE_GROUP_TYPES]
+
+    # LEGEND
+    ax1.legend(lines, LABELS, prop=SMALL_LEGEND_FP, title = TITLE,
+               loc="upper left", ncol=DIST_TILE_GROUP_TYPES,
+               shadow=OPT_LEGEND_SHADOW,
+               frameon=False, borderaxespad=0.0, handlelength=2)
+
+    ax1.get_legend().get_title().set_fontproperties(SMALL_LEGEND_FP)
+    ax1.get_legend().get_title().set_position((-15, 0))
+
+    return (fig)
+
+def set_thread_axis(ax1, datasets):
+    # thread counts follow the topology of the machine the sweep ran on
+    x_values = sorted(set(int(x) for dataset in datasets for x in dataset[:, 0])) or list(THREAD_COUNTS)
+
+    XAXIS_MIN = x_values[0] * pow(2, -0.25)
+    XAXIS_MAX = x_values[-1] * pow(2, 0.25)
+    ax1.set_xlim([XAXIS_MIN, XAXIS_MAX])
+    ax1.set_xlabel("Number of Threads", fontproperties=LABEL_FP)
+    ax1.set_xscale('log', basex=2)
+    ax1.set_xticks(x_values)
+    ax1.set_xticklabels(x_values)
+    ax1.minorticks_off()
+
+def create_concurrency_line_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    idx = 0
+
+    # GROUP
+    for group_index, group in enumerate(LAYOUTS):
+        dataset = datasets[group_index]
+
+        # LINE
+        x_values = dataset[:, 0]
+        group_data = dataset[:, 1]
+
+        LOG.info("%s group_data = %s ", group, str(group_data))
+
+        ax1.plot(x_values, group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                 marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE, label=str(group))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Throughput", fontproperties=LABEL_FP)
+    #ax1.set_yscale('log', basey=2)
+
+    # X-AXIS
+    set_thread_axis(ax1, datasets)
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_concurrency_latency_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    idx = 0
+
+    # one line style per percentile
+    LINE_STYLES = ('-', '--', ':')
+
+    # GROUP
+    for group_index, group in enumerate(LAYOUTS):
+        dataset = datasets[group_index]
+
+        # LINE
+        for percentile_index, percentile in enumerate(LATENCY_PERCENTILES):
+            group_data = dataset[:, percentile_index + 1]
+
+            LOG.info("%s p%g group_data = %s ", group, percentile, str(group_data))
+
+            ax1.plot(dataset[:, 0], group_data, color=OPT_LINE_COLORS[idx], linewidth=OPT_LINE_WIDTH,
+                     linestyle=LINE_STYLES[percentile_index % len(LINE_STYLES)],
+                     marker=OPT_MARKERS[idx], markersize=OPT_MARKER_SIZE,
+                     label="%s p%g" % (group, percentile))
+
+        idx = idx + 1
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.set_ylabel("Latency (us)", fontproperties=LABEL_FP)
+    ax1.set_yscale('log', basey=10)
+
+    # X-AXIS
+    set_thread_axis(ax1, datasets)
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+def create_memory_bar_chart(datasets):
+    fig, ax1 = CHART_CONTEXT.new_chart()
+
+    x_values = TUPLES_PER_TILEGROUP
+    N = len(x_values)
+    x_labels = TUPLES_PER_TILEGROUP
+
+    layouts = ["NSM", "DSM", "FSM"]
+
+    ind = np.arange(N)
+    margin = 0.15
+    width = ((1.0 - 2 * margin) / len(layouts))
+    bars = [None] * len(layouts)
+
+    for group in xrange(len(datasets)):
+        # GROUP
+        peaks = []
+
+        # one bar per tile group size, missing ones stay empty
+        for x_value in x_values:
+            rows = datasets[group][datasets[group][:, 0] == x_value]
+            peaks.append(rows[0][1] / 1024.0 if len(rows) else 0)
+
+        LOG.info("%s group_data = %s ", layouts[group], str(peaks))
+
+        bars[group] = ax1.bar(ind + margin + (group * width), peaks, width,
+                              color=OPT_COLORS[group],
+                              hatch=OPT_PATTERNS[group*2],
+                              linewidth=BAR_LINEWIDTH)
+
+    # GRID
+    axes = ax1.get_axes()
+    makeGrid(ax1)
+
+    # Y-AXIS
+    ax1.yaxis.set_major_locator(LinearLocator(YAXIS_TICKS))
+    ax1.minorticks_off()
+    ax1.set_ylabel("Peak Memory (MB)", fontproperties=LABEL_FP)
+
+    # X-AXIS
+    ax1.set_xlabel("Tuples per Tile Group", fontproperties=LABEL_FP)
+    ax1.set_xticklabels(x_labels)
+    ax1.set_xticks(ind + 0.5)
+
+    CHART_CONTEXT.style_ticks(ax1)
+
+    return (fig)
+
+###################################################################################
+# PLOT HELPERS
+###################################################################################
+
+# One output figure: chart(datasets) saved to file_name at width x height
+FigureJob = collections.namedtuple('FigureJob', ['file_name', 'chart', 'datasets', 'width', 'height'])
+
+# Vertices per pixel of width and method of the long query-sequence series
+# (--points-per-pixel, --downsample), see downsample.py
+POINTS_PER_PIXEL = downsample.POINTS_PER_PIXEL
+DOWNSAMPLE_METHOD = downsample.DOWNSAMPLE_METHOD
+
+def query_series(dataset, query_count, width):
+    """ [query, y] rows of the first query_count measurements, numbered
+        from 1 in store order, reduced to what width pixels can show.
+    """
+    values = np.asarray(dataset, dtype=float).reshape(-1, 2)[:query_count, 1]
+    points = np.column_stack((np.arange(1, len(values) + 1), values))
+    return downsample.downsample(points, width, POINTS_PER_PIXEL, DOWNSAMPLE_METHOD)
+
+def get_marker_indices(x_values, frequency):
+    """ Indices of the points nearest to every frequency-th x, so markers
+        stay evenly spaced along a downsampled line.
+    """
+    if len(x_values) == 0:
+        return []
+    targets = np.arange(x_values[0], x_values[-1] + 1, frequency)
+    indices = np.minimum(np.searchsorted(x_values, targets), len(x_values) - 1)
+    return sorted(set(int(index) for index in indices))
+
+def peak_series(results, x_column, y_column, **filters):
+    """ [x, largest y] rows of the matching measurements, e.g. the peak
+        memory of every tile group size over all selectivities.
+    """
+    rows = results.select(**filters)
+    rows = rows[~np.isnan(rows[y_column])]
+    x_values = np.unique(rows[x_column])
+    return np.array([[x_value, rows[y_column][rows[x_column] == x_value].max()]
+                     for x_value in x_values], dtype=float).reshape(-1, 2)
+
+def caching_series(results, **filters):
+    """ [x, y] rows of the CACHING_LAYOUT measurements of the caching sweep.
+        Rows imported from an older caching tree carry no layout, they were
+        all measured with it.
+    """
+    rows = results.select(**filters)
+    rows = rows[(rows["layout"] == CACHING_LAYOUT) | (rows["layout"] == "")]
+    return np.column_stack((rows[results.x_column].astype(float),
+                            rows[results.y_column].astype(float)))
+
+# PROJECTIVITY -- FIGURES
+def projectivity_figures():
+
+    results = open_results(PROJECTIVITY_DIR, "projectivity.csv")
+    column_count_type = 0
+    for column_count in COLUMN_COUNTS:
+        column_count_type = column_count_type + 1
+
+        for write_ratio in WRITE_RATIOS:
+
+            for operator in OPERATORS:
+                print(operator)
+                datasets = []
+
+                for layout in LAYOUTS:
+                    dataset = results.series(layout=layout, operator=operator, column_count=column_count, write_ratio=write_ratio)
+                    dataset = dataset[:-1]
+                    datasets.append(dataset)
+
+                if write_ratio == 0:
+                    write_mix = "rd"
+                else:
+                    write_mix = "rw"
+
+                if column_count_type == 1:
+                    table_type = "narrow"
+                else:
+                    table_type = "wide"
+
+                fileName = "projectivity-" + operator + "-" + table_type + "-" + write_mix + ".pdf"
+
+                yield FigureJob(fileName, create_projectivity_bar_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+# SELECTIVITY -- FIGURES
+def selectivity_figures():
+
+    results = open_results(SELECTIVITY_DIR, "selectivity.csv")
+    column_count_type = 0
+    for column_count in COLUMN_COUNTS:
+        column_count_type = column_count_type + 1
+
+        for write_ratio in WRITE_RATIOS:
+
+            for operator in OPERATORS:
+                print(operator)
+                datasets = []
+
+                for layout in LAYOUTS:
+                    dataset = results.series(layout=layout, operator=operator, column_count=column_count, write_ratio=write_ratio)
+                    datasets.append(dataset)
+
+                if write_ratio == 0:
+                    write_mix = "rd"
+                else:
+                    write_mix = "rw"
+
+                if column_count_type == 1:
+                    table_type = "narrow"
+                else:
+                    table_type = "wide"
+
+                fileName = "selectivity-" + operator + "-" + table_type + "-" + write_mix + ".pdf"
+
+                yield FigureJob(fileName, create_selectivity_line_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+
+# HORIZONTAL -- FIGURES
+def horizontal_figures():
+
+    results = open_results(HORIZONTAL_DIR, "horizontal.csv")
+    column_count_type = 0
+    for column_count in COLUMN_COUNTS:
+        column_count_type = column_count_type + 1
+
+        for write_ratio in WRITE_RATIOS:
+            datasets = []
+
+            for tuples_per_tg in TUPLES_PER_TILEGROUP:
+
+                dataset = results.series(tuples_per_tg=tuples_per_tg, column_count=column_count, write_ratio=write_ratio)
+                datasets.append(dataset)
+
+            if write_ratio == 0:
+                write_mix = "rd"
+            else:
+                write_mix = "rw"
+
+            if column_count_type == 1:
+                table_type = "narrow"
+            else:
+                table_type = "wide"
+
+            fileName = "horizontal-" + table_type + "-" + write_mix + ".pdf"
+
+            yield FigureJob(fileName, create_horizontal_line_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+
+# OPERATOR -- FIGURES
+def operator_figures():
+
+    results = open_results(OPERATOR_DIR, "operator.csv")
+    column_count = OP_COLUMN_COUNT
+    for write_ratio in WRITE_RATIOS:
+
+        projectivity_type = 0
+        for projectivity in OP_PROJECTIVITY:
+            projectivity_type = projectivity_type + 1
+            print(projectivity)
+            datasets = []
+
+            for layout in LAYOUTS:
+                if projectivity == 1.0: projectivity = 1
+                dataset = results.series(layout=layout, projectivity=projectivity, column_count=column_count, write_ratio=write_ratio)
+                datasets.append(dataset)
+
+            if write_ratio == 0:
+                write_mix = "rd"
+            else:
+                write_mix = "rw"
+
+            fileName = "operator-" + str(projectivity_type) + "-" + write_mix + ".pdf"
+
+            yield FigureJob(fileName, create_operator_line_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+
+# YCSB -- FIGURES
+def ycsb_figures():
+
+    results = open_results(YCSB_DIR, "ycsb.csv")
+    column_count = 200
+    datasets = []
+
+    for layout in LAYOUTS:
+        dataset = results.series(layout=layout, column_count=column_count)
+        datasets.append(dataset)
+
+    fileName = "ycsb.pdf"
+
+    yield FigureJob(fileName, create_ycsb_bar_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+# SUBSET -- FIGURES
+def subset_figures():
+
+    results = open_results(SUBSET_DIR, "subset.csv")
+    datasets = []
+    for subset_ratio in SUBSET_RATIOS:
+        dataset = results.series(subset_experiment_type=SUBSET_SINGLE_GROUP_EXPERIMENT, subset_ratio=subset_ratio)
+        datasets.append(dataset)
+
+    fileName = "subset-single.pdf"
+
+    yield FigureJob(fileName, create_subset_bar_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+    datasets = []
+    for access_num_group in ACCESS_NUM_GROUPS:
+        dataset = results.series(subset_experiment_type=SUBSET_MULTIPLE_GROUP_EXPERIMENT, access_num_group=access_num_group)
+        datasets.append(dataset)
+
+    fileName = "subset-multiple.pdf"
+
+    yield FigureJob(fileName, create_subset_bar_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+# ADAPT -- FIGURES
+def adapt_figures():
+
+    results = open_results(ADAPT_DIR, "adapt.csv")
+    ADAPT_COLUMN_COUNT = COLUMN_COUNTS[1]
+    #ADAPT_SEED = 0
+    #random.seed(ADAPT_SEED)
+    datasets = []
+
+    width = OPT_GRAPH_WIDTH * 2
+
+    for layout in LAYOUTS:
+        dataset = results.series(column_count=ADAPT_COLUMN_COUNT, layout=layout)
+        #random.shuffle(dataset)
+        datasets.append(query_series(dataset, ADAPT_QUERY_COUNT, width))
+
+    fileName = "adapt.pdf"
+
+    yield FigureJob(fileName, create_adapt_line_chart, datasets, width, OPT_GRAPH_HEIGHT/1.5)
+
+# WEIGHT -- FIGURES
+def weight_figures():
+
+    results = open_results(WEIGHT_DIR, "weight.csv")
+    datasets = []
+    width = OPT_GRAPH_WIDTH
+
+    for sample_weight in SAMPLE_WEIGHTS:
+        dataset = results.series(sample_weight=sample_weight)
+        datasets.append(query_series(dataset, WEIGHT_QUERY_COUNT, width))
+
+    fileName = "weight.pdf"
+
+    yield FigureJob(fileName, create_weight_line_chart, datasets, width, OPT_GRAPH_HEIGHT/2.5)
+
+# REORG -- FIGURES
+def reorg_figures():
+
+    results = open_results(REORG_DIR, "reorg.csv")
+    reorg_scale_factor = 1000
+    datasets = []
+
+    for layout in REORG_LAYOUTS:
+        dataset = results.series(scale_factor=reorg_scale_factor, layout=layout)
+        datasets.append(dataset)
+
+    fileName = "reorg.pdf"
+
+    yield FigureJob(fileName, create_reorg_line_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.5)
+
+# DISTRIBUTION -- FIGURES
+def distribution_figures():
+
+    results = open_results(DISTRIBUTION_DIR, "distribution.csv")
+    datasets = []
+    for tile_group_type in xrange(0, DIST_TILE_GROUP_TYPES):
+        dataset = results.series(tile_group_type=tile_group_type)
+        datasets.append(dataset)
+
+    fileName = "distribution.pdf"
+
+    yield FigureJob(fileName, create_distribution_stack_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.5)
+
+# JOIN -- FIGURES
+def join_figures():
+
+    results = open_results(JOIN_DIR, "join.csv")
+    operator = "join"
+    JOIN_COLUMN_COUNTS = [50, 200]
+
+    column_count_type = 0
+    for column_count in JOIN_COLUMN_COUNTS:
+        column_count_type = column_count_type + 1
+
+        print(operator)
+        datasets = []
+
+        for layout in LAYOUTS:
+            dataset = results.series(layout=layout, operator=operator, column_count=column_count)
+            dataset = dataset[:-1]
+            datasets.append(dataset)
+
+        if column_count_type == 1:
+            table_type = "narrow"
+        else:
+            table_type = "wide"
+
+        fileName = "join-" + table_type + ".pdf"
+
+        yield FigureJob(fileName, create_projectivity_bar_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+# CACHING -- FIGURES
+def caching_figures():
+
+    results = open_results(CACHING_DIR, "caching.csv")
+    column_count_type = 0
+    for column_count in COLUMN_COUNTS:
+        column_count_type = column_count_type + 1
+
+        for write_ratio in WRITE_RATIOS:
+            datasets = []
+
+            for tuples_per_tg in TUPLES_PER_TILEGROUP:
+
+                dataset = caching_series(results, tuples_per_tg=tuples_per_tg, column_count=column_count, write_ratio=write_ratio)
+                datasets.append(dataset)
+
+            if write_ratio == 0:
+                write_mix = "rd"
+            else:
+                write_mix = "rw"
+
+            if column_count_type == 1:
+                table_type = "narrow"
+            else:
+                table_type = "wide"
+
+            fileName = "caching-" + table_type + "-" + write_mix + ".pdf"
+
+            yield FigureJob(fileName, create_caching_line_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+# MEMORY -- FIGURES
+def memory_figures():
+
+    # the caching sweep runs one process per configuration, so every
+    # measurement has its own peak RSS; it covers every layout with
+    # --memory-layouts, only CACHING_LAYOUT otherwise
+    results = open_results(CACHING_DIR, "caching.csv")
+    column_count_type = 0
+    for column_count in COLUMN_COUNTS:
+        column_count_type = column_count_type + 1
+
+        for write_ratio in WRITE_RATIOS:
+            datasets = []
+
+            for layout in LAYOUTS:
+
+                dataset = peak_series(results, "tuples_per_tg", "max_rss_kb", layout=layout,
+                                      column_count=column_count, write_ratio=write_ratio)
+                datasets.append(dataset)
+
+            if not any(len(dataset) for dataset in datasets):
+                continue
+
+            if write_ratio == 0:
+                write_mix = "rd"
+            else:
+                write_mix = "rw"
+
+            if column_count_type == 1:
+                table_type = "narrow"
+            else:
+                table_type = "wide"
+
+            fileName = "memory-" + table_type + "-" + write_mix + ".pdf"
+
+            yield FigureJob(fileName, create_memory_bar_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+# HYRISE -- FIGURES
+def hyrise_figures():
+
+    results = open_results(HYRISE_DIR, "hyrise.csv")
+    HYRISE_COLUMN_COUNT = COLUMN_COUNTS[0]
+    datasets = []
+
+    width = OPT_GRAPH_WIDTH * 3
+
+    for layout in HYRISE_LAYOUTS:
+        dataset = results.series(column_count=HYRISE_COLUMN_COUNT, layout=layout)
+        datasets.append(query_series(dataset, HYRISE_QUERY_COUNT, width))
+
+    fileName = "hyrise.pdf"
+
+    yield FigureJob(fileName, create_hyrise_line_chart, datasets, width, OPT_GRAPH_HEIGHT/2.0)
+
+# CONCURRENCY -- FIGURES
+def concurrency_figures():
+
+    results = open_results(CONCURRENCY_DIR, "concurrency.csv")
+
+    # one set of figures per affinity policy; sweeps without one have ""
+    for affinity in sorted(set(results.frozen()["affinity"].tolist())):
+        for job in concurrency_affinity_figures(results, affinity):
+            yield job
+
+def concurrency_affinity_figures(results, affinity):
+
+    if affinity:
+        histograms = latency.read_latency(CONCURRENCY_DIR + affinity)
+        affinity_prefix = affinity + "-"
+    else:
+        histograms = latency.read_latency(CONCURRENCY_DIR)
+        affinity_prefix = ""
+
+    for scan_ratio in SCAN_RATIOS:
+
+        datasets = []
+
+        for layout in LAYOUTS:
+
+            dataset = results.series(layout=layout, theta=scan_ratio, affinity=affinity)
+            datasets.append(dataset)
+
+        if scan_ratio == 0:
+            rw_prefix = "write-only"
+        elif scan_ratio == 0.5:
+            rw_prefix = "balanced"
+        elif scan_ratio == 0.9:
+            rw_prefix = "read-heavy"
+        elif scan_ratio == 1:
+            rw_prefix = "read-only"
+
+        fileName = "concurrency-" + affinity_prefix + rw_prefix + ".pdf"
+
+        yield FigureJob(fileName, create_concurrency_line_chart, datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+        # tail latencies, when the benchmark reported them
+        latency_datasets = []
+        for layout in LAYOUTS:
+            dataset = latency.latency_series(histograms, layout=layout, theta=scan_ratio)
+            latency_datasets.append(dataset)
+
+        if any(len(dataset) for dataset in latency_datasets):
+            fileName = "concurrency-latency-" + affinity_prefix + rw_prefix + ".pdf"
+
+            yield FigureJob(fileName, create_concurrency_latency_chart, latency_datasets, OPT_GRAPH_WIDTH, OPT_GRAPH_HEIGHT/2.0)
+
+###################################################################################
+# RENDER
+###################################################################################
+
+# Render figures even when the manifest has them up to date (--force)
+FORCE_RENDER = False
+
+# Figure sets rendered by --plot-all
+PLOT_ALL_FIGURES = (projectivity_figures, selectivity_figures, operator_figures,
+                    horizontal_figures, adapt_figures, weight_figures,
+                    reorg_figures, distribution_figures, join_figures,
+                    caching_figures, hyrise_figures, concurrency_figures,
+                    memory_figures)
+
+# OUTPUT JOB
+def get_output_job(job):
+    """ The job writing its figure in FIGURE_FORMAT.
+    """
+    return job._replace(file_name=os.path.splitext(job.file_name)[0] + "." + FIGURE_FORMAT)
+
+# RENDER FIGURE
+def render_figure(job):
+    start = time.time()
+
+    fig = job.chart(job.datasets)
+    saveGraph(fig, job.file_name, width=job.width, height=job.height)
+    CHART_CONTEXT.release(fig)
+
+    return (job.file_name, time.time() - start)
+
+# Code every figure goes through besides its chart, part of its code digest:
+# the output format, saving and rasterizing with their DPI settings, the chart
+# context's styles and the downsampling of long series
+RENDER_CODE = (get_output_job, render_figure, ChartContext, query_series,
+               downsample.downsample)
+
+# RENDER FIGURES
+def render_figures(jobs):
+    manifest = figcache.FigureManifest()
+    jobs = [get_output_job(job) for job in jobs]
+    for job, entry in figcache.get_stale_jobs(jobs, manifest, FORCE_RENDER, RENDER_CODE):
+        render_figure(job)
+        manifest.record(job.file_name, entry)
+        manifest.save()
+
+def _init_plot_worker():
+    # every worker keeps its matplotlib state for all the figures it renders
+    plot.switch_backend('Agg')
+
+# PLOT ALL
+def plot_all(workers, report_file=None):
+
+    start = time.time()
+
+    if report_file:
+        sections = [(figures.__name__[:-len("_figures")], list(figures()))
+                    for figures in PLOT_ALL_FIGURES]
+        render_report(sections, report_file)
+        return
+
+    jobs = []
+    for figures in PLOT_ALL_FIGURES:
+        jobs.extend(get_output_job(job) for job in figures())
+
+    manifest = figcache.FigureManifest()
+    stale = figcache.get_stale_jobs(jobs, manifest, FORCE_RENDER, RENDER_CODE)
+    entries = dict((job.file_name, entry) for job, entry in stale)
+    jobs = [job for job, entry in stale]
+
+    workers = max(1, min(workers, len(jobs) or 1))
+    LOG.info("Rendering %d figures on %d workers", len(jobs), workers)
+
+    timings = []
+    try:
+        if workers == 1:
+            for job in jobs:
+                timings.append(render_figure(job))
+        else:
+            pool = multiprocessing.Pool(workers, initializer=_init_plot_worker)
+            try:
+                for timing in pool.imap_unordered(render_figure, jobs, chunksize=1):
+                    timings.append(timing)
+                pool.close()
+            except:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
+    finally:
+        # figures rendered before a failure stay up to date
+        for file_name, duration in timings:
+            manifest.record(file_name, entries[file_name])
+        manifest.save()
+
+    for file_name, duration in sorted(timings, key=lambda timing: -timing[1]):
+        LOG.info("%-40s %8.3f s", file_name, duration)
+    LOG.info("Rendered %d figures in %.3f s (%.3f s of render time)",
+             len(timings), time.time() - start, sum(timing[1] for timing in timings))
+
+###################################################################################
+# REPORT
+###################################################################################
+
+# CONTENTS PAGE
+def create_contents_page(sections):
+    """ Every figure set and the page each of its figures is on; the
+        figures start on page 2.
+    """
+    rows = []
+    page = 2
+    for section, jobs in sections:
+        rows.append((section, None))
+        for job in jobs:
+            rows.append((os.path.splitext(job.file_name)[0], page))
+            page += 1
+
+    fig = plot.figure(figsize=REPORT_PAGE_SIZE)
+    fig.text(0.1, 0.95, REPORT_TITLE, fontproperties=LEGEND_FP)
+
+    # shrink the lines to fit every figure on the page
+    line_height = min(0.025, 0.85 / max(len(rows), 1))
+    font_size = min(TICK_FONT_SIZE, line_height * REPORT_PAGE_SIZE[1] * 72 * 0.8)
+    section_fp = FontProperties(style='normal', size=font_size, weight='bold')
+    entry_fp = FontProperties(style='normal', size=font_size)
+
+    y = 0.9
+    for label, page in rows:
+        if page is None:
+            fig.text(0.1, y, label, fontproperties=section_fp)
+        else:
+            fig.text(0.15, y, label, fontproperties=entry_fp)
+            fig.text(0.9, y, str(page), fontproperties=entry_fp, horizontalalignment='right')
+        y -= line_height
+
+    return (fig)
+
+# RENDER REPORT
+def render_report(sections, report_file):
+    """ Every figure of the (name, jobs) sections in one multi-page PDF,
+        after a contents page. Fonts are embedded once for all of them.
+    """
+    jobs = [job for section, section_jobs in sections for job in section_jobs]
+
+    manifest = figcache.FigureManifest()
+    entry = figcache.get_report_entry(jobs, RENDER_CODE + (render_report, create_contents_page))
+    reason = "forced" if FORCE_RENDER else manifest.get_reason(report_file, entry)
+    if reason is None:
+        LOG.info("%s up to date", report_file)
+        return
+    LOG.info("Rendering %d figures into %s (%s)", len(jobs), report_file, reason)
+
+    start = time.time()
+    pp = PdfPages(report_file)
+    try:
+        fig = create_contents_page(sections)
+        pp.savefig(fig)
+        plot.close(fig)
+
+        for job in jobs:
+            fig = job.chart(job.datasets)
+            setGraphSize(fig, job.width, job.height)
+            rasterizeDenseArtists(fig)
+            pp.savefig(fig, bbox_inches='tight', dpi=RASTER_DPI)
+            CHART_CONTEXT.release(fig)
+    finally:
+        pp.close()
+
+    # a report torn by a failure is rendered again next time
+    manifest.record(report_file, entry)
+    manifest.save()
+
+    LOG.info("OUTPUT: %s (%d pages in %.3f s)", report_file, len(jobs) + 1, time.time() - start)
+
+# PROJECTIVITY -- PLOT
+def projectivity_plot():
+    render_figures(projectivity_figures())
+
+# SELECTIVITY -- PLOT
+def selectivity_plot():
+    render_figures(selectivity_figures())
+
+# HORIZONTAL -- PLOT
+def horizontal_plot():
+    render_figures(horizontal_figures())
+
+# OPERATOR -- PLOT
+def operator_plot():
+    render_figures(operator_figures())
+
+# YCSB -- PLOT
+def ycsb_plot():
+    render_figures(ycsb_figures())
+
+# SUBSET -- PLOT
+def subset_plot():
+    render_figures(subset_figures())
+
+# ADAPT -- PLOT
+def adapt_plot():
+    render_figures(adapt_figures())
+
+# WEIGHT -- PLOT
+def weight_plot():
+    render_figures(weight_figures())
+
+# REORG -- PLOT
+def reorg_plot():
+    render_figures(reorg_figures())
+
+# DISTRIBUTION -- PLOT
+def distribution_plot():
+    render_figures(distribution_figures())
+
+# JOIN -- PLOT
+def join_plot():
+    render_figures(join_figures())
+
+# CACHING -- PLOT
+def caching_plot():
+    render_figures(caching_figures())
+
+# HYRISE -- PLOT
+def hyrise_plot():
+    render_figures(hyrise_figures())
+
+# CONCURRENCY -- PLOT
+def concurrency_plot():
+    render_figures(concurrency_figures())
+
+# MEMORY -- PLOT
+def memory_plot():
+    render_figures(memory_figures())
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+###################################################################################
+# PROGRESS
+###################################################################################
+
+from __future__ import print_function
+import os
+import sys
+import time
+import json
+import logging
+import threading
+import subprocess
+import collections
+
+import watchdog
+import rusage
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Machine-readable progress, one JSON line per finished configuration
+PROGRESS_FILE_NAME = "progress.log"
+
+# Configurations the rolling duration is averaged over
+PROGRESS_WINDOW = 20
+
+# Seconds between status lines on the console
+PROGRESS_INTERVAL = 10.0
+
+# Seconds between polls of a running benchmark
+PROGRESS_POLL_INTERVAL = 0.5
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def format_duration(seconds):
+    if seconds is None:
+        return "?"
+    seconds = int(round(seconds))
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return "%dh%02dm" % (hours, minutes)
+    if minutes:
+        return "%dm%02ds" % (minutes, seconds)
+    return "%ds" % seconds
+
+def get_progress_path(result_dir):
+    return os.path.join(result_dir, PROGRESS_FILE_NAME)
+
+###################################################################################
+# TRACKER
+###################################################################################
+
+class ProgressTracker(object):
+    """ Completed vs. total configurations of one run, with rolling
+        per-configuration durations and an ETA.
+
+        Every step is appended to the progress log; the console gets a status
+        line at most every PROGRESS_INTERVAL seconds. Without a known total
+        only the count and durations are reported.
+    """
+
+    def __init__(self, label, total=None, log_path=None):
+        self.label = label
+        self.total = total
+        self.log_path = log_path
+        self.completed = 0
+        self.durations = collections.deque(maxlen=PROGRESS_WINDOW)
+        self.start = time.time()
+        self.last = self.start
+        self.last_report = self.start
+
+    def get_rolling_duration(self):
+        if not self.durations:
+            return None
+        return sum(self.durations) / len(self.durations)
+
+    def get_eta(self):
+        rolling = self.get_rolling_duration()
+        if self.total is None or rolling is None:
+            return None
+        return rolling * max(0, self.total - self.completed)
+
+    def skip(self, count):
+        """ Count configurations that were not run, without timing them.
+        """
+        self.completed += count
+        self.last = time.time()
+
+    def update(self, completed=None, output=None):
+        """ Record progress up to completed configurations (default: one more).
+        """
+        if completed is None:
+            completed = self.completed + 1
+        if completed <= self.completed:
+            return
+
+        now = time.time()
+        # configurations finishing in one poll share its duration
+        duration = (now - self.last) / (completed - self.completed)
+        for itr in range(completed - self.completed):
+            self.durations.append(duration)
+
+        self.completed = completed
+        self.last = now
+        if self.total is not None and completed > self.total:
+            # the estimated total was wrong, stop predicting
+            self.total = None
+
+        self.write_log(now, duration, output)
+        if now - self.last_report >= PROGRESS_INTERVAL or self.completed == self.total:
+            self.report()
+            self.last_report = now
+
+    def write_log(self, now, duration, output=None):
+        if self.log_path is None:
+            return
+
+        directory = os.path.dirname(self.log_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        entry = collections.OrderedDict([
+            ("time", now),
+            ("label", self.label),
+            ("completed", self.completed),
+            ("total", self.total),
+            ("duration", duration),
+            ("rolling_duration", self.get_rolling_duration()),
+            ("elapsed", now - self.start),
+            ("eta", self.get_eta()),
+        ])
+        if output:
+            entry["output"] = output
+
+        fp = open(self.log_path, "a")
+        fp.write(json.dumps(entry) + "\n")
+        fp.close()
+
+    def report(self):
+        if self.total:
+            done = "%d/%d (%.0f%%)" % (self.completed, self.total,
+                                       100.0 * self.completed / self.total)
+        else:
+            done = "%d" % self.completed
+        rolling = self.get_rolling_duration()
+        LOG.info("%s: %s configurations, %s per configuration, elapsed %s, ETA %s",
+                 self.label, done,
+                 "%.2fs" % rolling if rolling is not None else "?",
+                 format_duration(time.time() - self.start),
+                 format_duration(self.get_eta()))
+
+    def finish(self):
+        LOG.info("%s: %d configurations in %s", self.label, self.completed,
+                 format_duration(time.time() - self.start))
+
+###################################################################################
+# MONITOR
+###################################################################################
+
+class SummaryTail(object):
+    """ Counts the complete lines of a summary file the benchmark is still
+        appending to, reading only what was added since the last poll.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.count = 0
+
+    def poll(self):
+        if not os.path.exists(self.path):
+            return self.count
+
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            # rewritten from scratch
+            self.offset = 0
+            self.count = 0
+        if size == self.offset:
+            return self.count
+
+        fp = open(self.path, "rb")
+        fp.seek(self.offset)
+        chunk = fp.read(size - self.offset)
+        fp.close()
+
+        # only complete lines count, a partial one is read again next time
+        end = chunk.rfind(b"\n") + 1
+        self.count += sum(1 for line in chunk[:end].split(b"\n") if line.strip())
+        self.offset += end
+        return self.count
+
+def _forward_output(stream, last_output):
+    for line in iter(stream.readline, ""):
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        if line.strip():
+            last_output[0] = line.strip()
+    stream.close()
+
+def run_monitored(command, summary_file, tracker, timeout=None):
+    """ Run command, echoing its output, and report every line it adds to
+        summary_file as a finished configuration. A run exceeding timeout
+        seconds is stopped. Returns the exit code, whether it timed out and
+        its resource usage.
+    """
+    p = subprocess.Popen(command,
+                         stdout=subprocess.PIPE,
+                         stderr=subprocess.STDOUT,
+                         universal_newlines=True,
+                         preexec_fn=watchdog.new_process_group)
+
+    last_output = [None]
+    reader = threading.Thread(target=_forward_output, args=(p.stdout, last_output))
+    reader.daemon = True
+    reader.start()
+
+    tail = SummaryTail(summary_file)
+    usage = None
+    with watchdog.Watchdog(p, timeout) as guard:
+        while p.returncode is None:
+            time.sleep(PROGRESS_POLL_INTERVAL)
+            usage = rusage.wait_process(p, block=False)
+            tracker.update(tail.poll(), last_output[0])
+
+    reader.join()
+    tracker.update(tail.poll(), last_output[0])
+    tracker.finish()
+
+    return p.returncode, guard.expired, usage
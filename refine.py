@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+
+###################################################################################
+# ADAPTIVE REFINEMENT
+###################################################################################
+
+from __future__ import print_function
+import os
+import logging
+import itertools
+import collections
+
+import numpy as np
+
+import spec as specs
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# The "refine" section of a spec.
+#   axis      : continuous axis that is refined, e.g. selectivity
+#   series    : axis whose curves are compared, e.g. layout
+#   budget    : benchmark invocations on top of the coarse grid
+#   batch     : new points per round, run in parallel
+#   min_width : intervals narrower than this are not split again
+#   curvature : bend, relative to the curves' range, worth refining
+REFINE_DEFAULTS = {
+    "budget" : 24,
+    "batch" : 2,
+    "min_width" : 0.01,
+    "curvature" : 0.1,
+}
+
+# Digits new axis values are rounded to
+REFINE_DIGITS = 6
+
+CROSSOVER_FILE_NAME = "crossovers.csv"
+
+# Where two series cross within one group of the other axes.
+#   low, high : the sampled points bracketing the crossing
+Crossover = collections.namedtuple('Crossover', ['group', 'first', 'second', 'x', 'low', 'high'])
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def get_settings(spec):
+    if not spec.get("refine"):
+        raise ValueError("%s: no refine section" % spec["name"])
+
+    settings = dict(REFINE_DEFAULTS)
+    settings.update(spec["refine"])
+    for field in ("axis", "series"):
+        if settings.get(field) not in spec["axes"]:
+            raise ValueError("%s: refine %s must be one of the axes" % (spec["name"], field))
+    if spec["key"] is None:
+        raise ValueError("%s: refining needs a key to find the stat" % spec["name"])
+
+    return settings
+
+def get_stat(lines, key_length):
+    """ Stat of a job's summary line, the field right after its key.
+    """
+    if not lines:
+        return None
+    fields = lines[0].split()
+    if len(fields) <= key_length:
+        return None
+    return float(fields[key_length])
+
+def get_curves(points, series_values):
+    """ x values sampled for every series, and the stat of each series there.
+    """
+    xs = sorted(x for x in set(x for series, x in points)
+                if all(points.get((series, x)) is not None for series in series_values))
+    curves = collections.OrderedDict((series, np.array([points[(series, x)] for x in xs]))
+                                     for series in series_values)
+    return np.array(xs, dtype=float), curves
+
+def find_crossovers(group, xs, curves):
+    """ Crossings of every pair of series, linearly interpolated between the
+        bracketing samples.
+    """
+    crossovers = []
+    for first, second in itertools.combinations(curves.keys(), 2):
+        difference = curves[first] - curves[second]
+        for index in range(len(xs) - 1):
+            left, right = difference[index], difference[index + 1]
+            if left == 0:
+                crossovers.append(Crossover(group, first, second, xs[index], xs[index], xs[index]))
+            elif left * right < 0:
+                x = xs[index] + (xs[index + 1] - xs[index]) * left / (left - right)
+                crossovers.append(Crossover(group, first, second, x, xs[index], xs[index + 1]))
+        if len(xs) and difference[-1] == 0:
+            crossovers.append(Crossover(group, first, second, xs[-1], xs[-1], xs[-1]))
+    return crossovers
+
+def score_intervals(xs, curves, min_width, curvature):
+    """ (score, midpoint) of every interval worth splitting. Intervals with a
+        crossing come first, then those around strongly bent curves.
+    """
+    if len(xs) < 2:
+        return []
+
+    widths = np.diff(xs)
+    scores = np.zeros(len(widths))
+
+    span = max(np.ptp(curve) for curve in curves.values()) or 1.0
+
+    for first, second in itertools.combinations(curves.keys(), 2):
+        difference = curves[first] - curves[second]
+        crossing = (difference[:-1] * difference[1:] < 0)
+        scores[crossing] = np.maximum(scores[crossing], 1.0 + widths[crossing])
+
+    if len(xs) > 2:
+        for curve in curves.values():
+            # distance of every inner point from the chord of its neighbours
+            weight = (xs[1:-1] - xs[:-2]) / (xs[2:] - xs[:-2])
+            chord = curve[:-2] + (curve[2:] - curve[:-2]) * weight
+            bend = np.abs(curve[1:-1] - chord) / span
+            bend[bend < curvature] = 0
+            scores[:-1] = np.maximum(scores[:-1], bend * widths[:-1])
+            scores[1:] = np.maximum(scores[1:], bend * widths[1:])
+
+    splittable = (scores > 0) & (widths >= 2 * min_width)
+    midpoints = np.round((xs[:-1] + xs[1:]) / 2, REFINE_DIGITS)
+    return [(scores[index], midpoints[index]) for index in np.nonzero(splittable)[0]]
+
+def write_crossovers(result_dir, group_axes, crossovers):
+    if not os.path.exists(result_dir):
+        os.makedirs(result_dir)
+
+    fp = open(os.path.join(result_dir, CROSSOVER_FILE_NAME), "w")
+    fp.write(" , ".join(list(group_axes) + ["first", "second", "x", "low", "high"]) + "\n")
+    for crossover in crossovers:
+        fields = [str(value) for value in crossover.group]
+        fields += [str(crossover.first), str(crossover.second)]
+        fields += ["%g" % value for value in (crossover.x, crossover.low, crossover.high)]
+        fp.write(" , ".join(fields) + "\n")
+    fp.close()
+
+###################################################################################
+# REFINE
+###################################################################################
+
+def run_refinement(spec, run_jobs):
+    """ Run the spec's coarse grid, then keep splitting the intervals around
+        crossings and bends of the refined axis until the budget is spent.
+
+        run_jobs(plan_jobs) runs a batch of PlanJobs and returns their summary
+        lines. Returns every job's lines, sorted like the coarse grid, the
+        crossovers found and the names of the group axes.
+    """
+    settings = get_settings(spec)
+    axis, series = settings["axis"], settings["series"]
+
+    axes = specs.get_axes(spec)
+    group_axes = [name for name in axes if name not in (axis, series)]
+    groups = list(itertools.product(*[axes[name] for name in group_axes]))
+    namespace = specs.get_config_namespace()
+    key_length = len(spec["key"])
+
+    # group -> (series, x) -> stat
+    points = dict((group, {}) for group in groups)
+    lines = {}
+
+    def run(targets):
+        jobs = []
+        for group, x in targets:
+            for series_value in axes[series]:
+                values = dict(zip(group_axes, group))
+                values[series] = series_value
+                values[axis] = x
+                job = specs.compile_job(spec, [(name, values[name]) for name in axes], namespace)
+                jobs.append((group, series_value, x, job))
+
+        results = run_jobs([job for group, series_value, x, job in jobs])
+        for (group, series_value, x, job), job_lines in zip(jobs, results):
+            points[group][(series_value, x)] = get_stat(job_lines, key_length)
+            lines[tuple(job.params[name] for name in axes)] = job_lines
+
+    # coarse grid
+    run([(group, x) for group in groups for x in axes[axis]])
+
+    budget = settings["budget"] // max(1, len(axes[series]))
+    rounds = 0
+    while budget > 0:
+        candidates = []
+        for group in groups:
+            xs, curves = get_curves(points[group], axes[series])
+            sampled = set(xs.tolist())
+            candidates.extend((score, group, x) for score, x in
+                              score_intervals(xs, curves, settings["min_width"],
+                                              settings["curvature"])
+                              if x not in sampled)
+        if not candidates:
+            break
+
+        candidates.sort(key=lambda candidate: -candidate[0])
+        chosen = candidates[:min(settings["batch"], budget)]
+        run([(group, x) for score, group, x in chosen])
+        budget -= len(chosen)
+        rounds += 1
+
+    crossovers = []
+    for group in groups:
+        xs, curves = get_curves(points[group], axes[series])
+        crossovers.extend(find_crossovers(group, xs, curves))
+
+    for crossover in crossovers:
+        LOG.info("%s: %s/%s cross at %s = %.4g (between %g and %g)",
+                 " ".join(str(value) for value in crossover.group) or spec["name"],
+                 crossover.first, crossover.second, axis, crossover.x,
+                 crossover.low, crossover.high)
+    LOG.info("%d invocations in %d refinement rounds, %d crossovers",
+             len(lines), rounds, len(crossovers))
+
+    # group, then series, then x, as a fixed grid would have them
+    order = list(axes.keys())
+    def sort_key(params):
+        return tuple(params[order.index(name)] for name in group_axes + [series, axis])
+
+    sorted_lines = []
+    for params in sorted(lines, key=sort_key):
+        sorted_lines.extend(lines[params])
+
+    return sorted_lines, crossovers, group_axes
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+
+###################################################################################
+# REGRESSION DETECTOR
+###################################################################################
+
+from __future__ import print_function
+import os
+import sys
+import math
+import logging
+import argparse
+import collections
+
+import numpy as np
+
+from loader import load_data_file
+from repetition import get_t_value
+from config import STORE_LAYOUTS, concurrency_path_fields
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+RESULTS_DIR = BASE_DIR + "/results/"
+SNAPSHOT_DIR = BASE_DIR + "/snapshot/"
+
+# Result files collect_stats writes; sidecars like counters.csv, latency.csv
+# or crossovers.csv are not results
+RESULT_FILE_NAMES = frozenset(STORE_LAYOUTS)
+
+# Percent change of a series' geometric mean that counts as a change
+REGRESSION_THRESHOLD = 5.0
+
+# Series with fewer aligned points are judged by the threshold alone
+SIGNIFICANCE_MIN_POINTS = 3
+
+# +1 : higher is better (throughput)
+# -1 : lower is better (execution time, cache misses)
+#  0 : not a performance metric, changes are reported but never gate
+METRIC_DIRECTIONS = {
+    "concurrency" : 1,
+    "weight" : 0,
+    "distribution" : 0,
+}
+DEFAULT_DIRECTION = -1
+
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+NEW = "new"
+MISSING = "missing"
+
+# One aligned result file.
+#   change       : percent change of the geometric mean, current vs. snapshot
+#   worst_change : percent change of the point that moved most in the bad direction
+#   t_stat       : paired t statistic of the per-point log ratios
+Comparison = collections.namedtuple('Comparison',
+                                    ['experiment', 'series', 'points', 'change',
+                                     'worst_change', 't_stat', 'status'])
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def find_result_files(root):
+    """ Result files below root, as sorted paths relative to it.
+    """
+    paths = []
+    for directory, dir_names, file_names in os.walk(root):
+        for file_name in file_names:
+            if file_name in RESULT_FILE_NAMES:
+                paths.append(os.path.relpath(os.path.join(directory, file_name), root))
+    return sorted(paths)
+
+def get_experiment(series):
+    return series.split(os.sep)[0]
+
+def has_affinity_level(series):
+    """ Whether a concurrency series comes from the affinity sweep, which
+        adds a policy level above the layout.
+    """
+    components = series.split(os.sep)[1:-1]
+    return get_experiment(series) == "concurrency" and "affinity" in concurrency_path_fields(components)
+
+def align_series(baseline, current):
+    """ y values of the points present in both files, matched on x.
+    """
+    if baseline.shape == current.shape and np.array_equal(baseline[:, 0], current[:, 0]):
+        return baseline[:, 1], current[:, 1]
+
+    common, baseline_ids, current_ids = np.intersect1d(baseline[:, 0], current[:, 0],
+                                                       return_indices=True)
+    return baseline[baseline_ids, 1], current[current_ids, 1]
+
+def is_significant(log_ratios):
+    """ Paired t-test of the log ratios against no change.
+    """
+    count = len(log_ratios)
+    mean = log_ratios.mean()
+    if count < SIGNIFICANCE_MIN_POINTS:
+        return True, float('nan')
+
+    std = log_ratios.std(ddof=1)
+    # a uniform shift only differs by rounding
+    if std <= 1e-9 * abs(mean):
+        return mean != 0, float('inf') if mean != 0 else 0.0
+
+    t_stat = mean / (std / math.sqrt(count))
+    return abs(t_stat) >= get_t_value(count - 1), t_stat
+
+def compare_series(baseline_y, current_y, direction, threshold=REGRESSION_THRESHOLD):
+    """ (change, worst_change, t_stat, status) of one aligned series.
+        Points that are zero on either side have no ratio and are skipped.
+    """
+    valid = (baseline_y > 0) & (current_y > 0)
+    if not valid.any():
+        if np.array_equal(baseline_y, current_y):
+            return 0.0, 0.0, float('nan'), UNCHANGED
+        return float('nan'), float('nan'), float('nan'), CHANGED
+
+    log_ratios = np.log(current_y[valid] / baseline_y[valid])
+    change = math.expm1(log_ratios.mean()) * 100
+    significant, t_stat = is_significant(log_ratios)
+
+    if direction == 0:
+        worst = log_ratios[np.argmax(np.abs(log_ratios))]
+    else:
+        worst = log_ratios[np.argmin(direction * log_ratios)]
+    worst_change = math.expm1(worst) * 100
+
+    if abs(change) < threshold or not significant:
+        status = UNCHANGED
+    elif direction == 0:
+        status = CHANGED
+    elif direction * change < 0:
+        status = REGRESSION
+    else:
+        status = IMPROVEMENT
+
+    return change, worst_change, t_stat, status
+
+def get_severity(comparison):
+    """ Sort key: regressions first, worst first, then improvements and changes.
+    """
+    order = (REGRESSION, IMPROVEMENT, CHANGED, NEW, MISSING, UNCHANGED)
+    change = comparison.change
+    magnitude = abs(change) if not math.isnan(change) else 0.0
+    return (order.index(comparison.status), -magnitude, comparison.series)
+
+###################################################################################
+# COMPARE
+###################################################################################
+
+def compare_trees(results_dir=RESULTS_DIR, snapshot_dir=SNAPSHOT_DIR,
+                  threshold=REGRESSION_THRESHOLD, experiments=None):
+    """ Compare every result file with its snapshot counterpart.
+        Returns the comparisons ranked by severity.
+    """
+    current_files = set(find_result_files(results_dir))
+    baseline_files = set(find_result_files(snapshot_dir))
+
+    # series of the concurrency affinity sweep have no counterpart among
+    # those of the single -e 14 run: the runs differ, so they are not mapped
+    # onto each other and only show up as new and missing
+    if (any(has_affinity_level(series) for series in current_files) !=
+            any(has_affinity_level(series) for series in baseline_files)):
+        LOG.warning("Only one tree has concurrency results of the affinity sweep, "
+                    "they cannot be compared; snapshot a tree of the same kind")
+
+    comparisons = []
+    for series in sorted(current_files | baseline_files):
+        experiment = get_experiment(series)
+        if experiments and experiment not in experiments:
+            continue
+
+        nan = float('nan')
+        if series not in baseline_files:
+            comparisons.append(Comparison(experiment, series, 0, nan, nan, nan, NEW))
+            continue
+        if series not in current_files:
+            comparisons.append(Comparison(experiment, series, 0, nan, nan, nan, MISSING))
+            continue
+
+        try:
+            baseline = load_data_file(os.path.join(snapshot_dir, series), n_cols=2)
+            current = load_data_file(os.path.join(results_dir, series), n_cols=2)
+        except ValueError as error:
+            LOG.warning("Skipping %s: %s", series, error)
+            continue
+
+        if len(baseline) == 0 or len(current) == 0:
+            continue
+
+        baseline_y, current_y = align_series(baseline, current)
+        if len(baseline_y) == 0:
+            comparisons.append(Comparison(experiment, series, 0, nan, nan, nan, CHANGED))
+            continue
+
+        direction = METRIC_DIRECTIONS.get(experiment, DEFAULT_DIRECTION)
+        change, worst_change, t_stat, status = compare_series(baseline_y, current_y,
+                                                              direction, threshold)
+        comparisons.append(Comparison(experiment, series, len(baseline_y),
+                                      change, worst_change, t_stat, status))
+
+    return sorted(comparisons, key=get_severity)
+
+def format_percent(value):
+    if math.isnan(value):
+        return "-"
+    return "%+.1f%%" % value
+
+def print_report(comparisons, show_all=False):
+    rows = [comparison for comparison in comparisons
+            if show_all or comparison.status != UNCHANGED]
+
+    if rows:
+        print("%-12s %-12s %-48s %6s %9s %9s %7s" % ("status", "experiment", "series",
+                                                    "points", "change", "worst", "t"))
+        for row in rows:
+            t_stat = "-" if math.isnan(row.t_stat) else "%.2f" % row.t_stat
+            print("%-12s %-12s %-48s %6d %9s %9s %7s" % (row.status, row.experiment, row.series,
+                                                        row.points, format_percent(row.change),
+                                                        format_percent(row.worst_change), t_stat))
+        print()
+
+    # per-experiment summary
+    summary = collections.OrderedDict()
+    for comparison in sorted(comparisons, key=lambda comparison: comparison.experiment):
+        counts = summary.setdefault(comparison.experiment, collections.Counter())
+        counts[comparison.status] += 1
+
+    for experiment, counts in summary.items():
+        print("%-12s %3d regressions %3d improvements %3d changed %3d unchanged" % (
+            experiment, counts[REGRESSION], counts[IMPROVEMENT],
+            counts[CHANGED] + counts[NEW] + counts[MISSING], counts[UNCHANGED]))
+
+###################################################################################
+# MAIN
+###################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Compare results/ against snapshot/')
+
+    parser.add_argument("--results", help='current result tree', default=RESULTS_DIR)
+    parser.add_argument("--snapshot", help='baseline result tree', default=SNAPSHOT_DIR)
+    parser.add_argument("--threshold", help='percent change that counts as a regression', type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--experiment", help='only compare these experiments', action='append')
+    parser.add_argument("--all", help='also list unchanged series', action='store_true')
+
+    args = parser.parse_args()
+
+    comparisons = compare_trees(args.results, args.snapshot, args.threshold, args.experiment)
+    print_report(comparisons, args.all)
+
+    regressions = [comparison for comparison in comparisons if comparison.status == REGRESSION]
+    if regressions:
+        LOG.error("%d regressed series", len(regressions))
+        sys.exit(1)
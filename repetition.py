@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+###################################################################################
+# REPETITION ENGINE
+###################################################################################
+
+from __future__ import print_function
+import math
+import logging
+import collections
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# How often a run is repeated.
+#   warmup_runs : runs whose results are thrown away
+#   min_runs    : measured runs before stopping is considered
+#   max_runs    : measured runs after which we always stop
+#   ci_target   : stop once every 95% confidence interval half-width is
+#                 within this percentage of its mean
+RepetitionPolicy = collections.namedtuple('RepetitionPolicy',
+                                          ['warmup_runs', 'min_runs', 'max_runs', 'ci_target'])
+
+SINGLE_RUN = RepetitionPolicy(0, 1, 1, 0.0)
+
+# Tukey fences: samples further than this many IQRs outside the quartiles
+OUTLIER_IQR_FACTOR = 1.5
+OUTLIER_MIN_SAMPLES = 4
+
+# Two-sided 95% Student t quantiles by degrees of freedom
+T_95 = {1 : 12.706, 2 : 4.303, 3 : 3.182, 4 : 2.776, 5 : 2.571,
+        6 : 2.447, 7 : 2.365, 8 : 2.306, 9 : 2.262, 10 : 2.228,
+        11 : 2.201, 12 : 2.179, 13 : 2.160, 14 : 2.145, 15 : 2.131,
+        16 : 2.120, 17 : 2.110, 18 : 2.101, 19 : 2.093, 20 : 2.086,
+        25 : 2.060, 30 : 2.042}
+T_95_LIMIT = 1.960
+
+# Summary fields appended to every repeated line, after the mean
+SUMMARY_FIELDS = ("stat_median", "stat_std", "stat_ci_low", "stat_ci_high", "repetitions")
+
+Summary = collections.namedtuple('Summary',
+                                 ['mean', 'median', 'std', 'ci_low', 'ci_high', 'repetitions'])
+
+###################################################################################
+# STATISTICS
+###################################################################################
+
+def get_t_value(degrees):
+    if degrees <= 0:
+        return float('inf')
+    for limit in sorted(T_95):
+        if degrees <= limit:
+            return T_95[limit]
+    return T_95_LIMIT
+
+def get_median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+def get_quantile(values, fraction):
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    lower = int(math.floor(position))
+    upper = int(math.ceil(position))
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def reject_outliers(values):
+    if len(values) < OUTLIER_MIN_SAMPLES:
+        return list(values)
+
+    q1 = get_quantile(values, 0.25)
+    q3 = get_quantile(values, 0.75)
+    fence = OUTLIER_IQR_FACTOR * (q3 - q1)
+    kept = [value for value in values if q1 - fence <= value <= q3 + fence]
+    return kept or list(values)
+
+def summarize(values):
+    """ Mean, median, standard deviation and 95% confidence interval of the
+        samples left after outlier rejection.
+    """
+    values = reject_outliers(values)
+    count = len(values)
+    mean = sum(values) / float(count)
+
+    if count > 1:
+        std = math.sqrt(sum((value - mean) ** 2 for value in values) / (count - 1))
+        half_width = get_t_value(count - 1) * std / math.sqrt(count)
+    else:
+        std = 0.0
+        half_width = float('inf')
+
+    return Summary(mean, get_median(values), std,
+                   mean - half_width, mean + half_width, count)
+
+def is_stable(summary, policy):
+    if summary.repetitions < 2:
+        return False
+    half_width = (summary.ci_high - summary.ci_low) / 2.0
+    if summary.mean == 0:
+        return half_width == 0
+    return half_width / abs(summary.mean) * 100.0 <= policy.ci_target
+
+def format_stat(value):
+    if math.isinf(value) or math.isnan(value):
+        return "nan"
+    return ("%.6f" % value).rstrip("0").rstrip(".")
+
+###################################################################################
+# REPEAT
+###################################################################################
+
+def repeat_run(run_once, policy=SINGLE_RUN):
+    """ Call run_once() until the policy is satisfied and return one summary
+        line per configuration plus the number of measured runs.
+
+        run_once returns summary lines whose last field is the stat; all the
+        other fields identify the configuration. The returned lines carry the
+        mean as stat, followed by the SUMMARY_FIELDS.
+    """
+    if policy.max_runs <= 1 and policy.warmup_runs == 0:
+        return list(run_once()), 1
+
+    for itr in range(policy.warmup_runs):
+        run_once()
+
+    samples = collections.OrderedDict()
+    runs = 0
+    while True:
+        for line in run_once():
+            fields = line.split()
+            if fields:
+                samples.setdefault(tuple(fields[:-1]), []).append(float(fields[-1]))
+        runs += 1
+
+        if runs >= policy.max_runs:
+            break
+        if runs >= policy.min_runs:
+            summaries = [summarize(values) for values in samples.values()]
+            if all(is_stable(summary, policy) for summary in summaries):
+                break
+
+    unstable = 0
+    lines = []
+    for key, values in samples.items():
+        summary = summarize(values)
+        if not is_stable(summary, policy):
+            unstable += 1
+        stats = [format_stat(value) for value in summary[:-1]] + [str(summary.repetitions)]
+        lines.append(" ".join(list(key) + stats))
+
+    LOG.info("%d measured runs, %d of %d configurations above the %.1f%% CI target",
+             runs, unstable, len(samples), policy.ci_target)
+
+    return lines, runs
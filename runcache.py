@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RUN CACHE
+###################################################################################
+
+from __future__ import print_function
+import os
+import json
+import hashlib
+import collections
+import logging
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Lives inside each result directory and survives everything but --force
+JOURNAL_FILE_NAME = "run.journal"
+
+HASH_BLOCK_SIZE = 1 << 20
+
+# (path, mtime, size) -> digest
+_FILE_DIGESTS = {}
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def get_file_digest(path):
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_mtime, stat.st_size)
+
+    digest = _FILE_DIGESTS.get(key)
+    if digest is None:
+        sha = hashlib.sha1()
+        fp = open(path, "rb")
+        block = fp.read(HASH_BLOCK_SIZE)
+        while block:
+            sha.update(block)
+            block = fp.read(HASH_BLOCK_SIZE)
+        fp.close()
+        digest = sha.hexdigest()
+        _FILE_DIGESTS[key] = digest
+
+    return digest
+
+def get_run_key(experiment_type, command):
+    """ Content address of one benchmark run: the experiment type, every
+        argument and the contents of every file the command refers to
+        (the benchmark binary, perf, ...).
+    """
+    sha = hashlib.sha1()
+    sha.update(str(experiment_type).encode("utf-8"))
+    for arg in command:
+        arg = str(arg)
+        sha.update(b"\0")
+        if os.path.isfile(arg):
+            sha.update(get_file_digest(arg).encode("utf-8"))
+        else:
+            sha.update(arg.encode("utf-8"))
+    return sha.hexdigest()
+
+def clean_results(result_directory):
+    """ Remove collected results but keep the run journals they are rebuilt
+        from, also those of sub-experiments in subdirectories.
+    """
+    if not os.path.isdir(result_directory):
+        return
+
+    for entry in os.listdir(result_directory):
+        if entry == JOURNAL_FILE_NAME:
+            continue
+        path = os.path.join(result_directory, entry)
+        if os.path.isdir(path) and not os.path.islink(path):
+            clean_results(path)
+            if not os.listdir(path):
+                os.rmdir(path)
+        else:
+            os.remove(path)
+
+###################################################################################
+# JOURNAL
+###################################################################################
+
+class RunJournal(object):
+    """ Append-only record of the finished runs of one experiment.
+
+        Every finished run is written as one JSON line holding its key and
+        summary lines, and synced before the next run starts, so an interrupted
+        sweep resumes from the last completed configuration.
+    """
+
+    def __init__(self, result_dir, experiment_type):
+        self.path = os.path.join(result_dir, JOURNAL_FILE_NAME)
+        self.experiment_type = experiment_type
+        self.entries = {}
+
+        if os.path.exists(self.path):
+            self.load()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self):
+        fp = open(self.path)
+        for line in fp:
+            try:
+                entry = json.loads(line, object_pairs_hook=collections.OrderedDict)
+            except ValueError:
+                # torn write of an interrupted run
+                continue
+            self.entries[entry["key"]] = entry
+        fp.close()
+
+        if self.entries:
+            LOG.info("Resuming %s: %d runs already finished", self.path, len(self.entries))
+
+    def get_key(self, command):
+        return get_run_key(self.experiment_type, command)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry["lines"]
+
+    def get_line_count(self):
+        """ Summary lines of the largest finished run, None before the first.
+        """
+        if not self.entries:
+            return None
+        return max(len(entry["lines"]) for entry in self.entries.values())
+
+    def get_durations(self):
+        """ Seconds taken by every finished run that recorded it.
+        """
+        return [entry["duration"] for entry in self.entries.values()
+                if entry.get("duration") is not None]
+
+    def get_max_duration(self):
+        """ Seconds taken by the slowest finished run, None before the first.
+        """
+        durations = self.get_durations()
+        if not durations:
+            return None
+        return max(durations)
+
+    def get_counters(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry.get("counters")
+
+    def get_latency(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry.get("latency")
+
+    def get_usage(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry.get("usage")
+
+    def record(self, key, lines, counters=None, duration=None, latency=None, usage=None):
+        directory = os.path.dirname(self.path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        entry = {"key" : key, "lines" : list(lines)}
+        if counters is not None:
+            entry["counters"] = counters
+        if duration is not None:
+            entry["duration"] = duration
+        if latency is not None:
+            entry["latency"] = latency
+        if usage is not None:
+            entry["usage"] = usage
+
+        fp = open(self.path, "a")
+        fp.write(json.dumps(entry) + "\n")
+        fp.flush()
+        os.fsync(fp.fileno())
+        fp.close()
+
+        self.entries[key] = entry
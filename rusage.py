@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RESOURCE USAGE
+###################################################################################
+
+from __future__ import print_function
+import os
+import errno
+import logging
+import collections
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Resource usage of a benchmark invocation, as wait4 reports it for the
+# child and the descendants it waited for
+#   max_rss_kb           : peak resident set size
+#   user_time            : seconds in user mode
+#   system_time          : seconds in the kernel
+#   voluntary_switches   : context switches while blocked
+#   involuntary_switches : context switches on preemption
+#   major_faults         : page faults that needed I/O
+#   minor_faults         : page faults served from memory
+USAGE_FIELDS = ("max_rss_kb", "user_time", "system_time",
+                "voluntary_switches", "involuntary_switches",
+                "major_faults", "minor_faults")
+
+# Fields that are peaks, not totals: repetitions keep the largest
+PEAK_USAGE_FIELDS = ("max_rss_kb",)
+
+# Usage file extension: one row per summary line, next to the summary file
+USAGE_EXTENSION = ".rusage"
+
+MISSING_USAGE = "-"
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def get_usage(rusage):
+    return collections.OrderedDict([
+        ("max_rss_kb", float(rusage.ru_maxrss)),
+        ("user_time", rusage.ru_utime),
+        ("system_time", rusage.ru_stime),
+        ("voluntary_switches", float(rusage.ru_nvcsw)),
+        ("involuntary_switches", float(rusage.ru_nivcsw)),
+        ("major_faults", float(rusage.ru_majflt)),
+        ("minor_faults", float(rusage.ru_minflt)),
+    ])
+
+def wait_process(process, block=True):
+    """ Reap process with wait4 instead of Popen.wait/poll, setting its
+        returncode the same way. Returns its usage, None while it is still
+        running or when something else reaped it first.
+    """
+    if process.returncode is not None:
+        return None
+
+    try:
+        pid, status, rusage = os.wait4(process.pid, 0 if block else os.WNOHANG)
+    except OSError as error:
+        if error.errno != errno.ECHILD:
+            raise
+        # reaped elsewhere, the usage is gone
+        process.wait()
+        return None
+
+    if pid == 0:
+        return None
+
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+    return get_usage(rusage)
+
+def merge_usage(samples):
+    """ Usage of repeated runs: the largest peak, the mean of the rest.
+    """
+    samples = [sample for sample in samples if sample is not None]
+    if not samples:
+        return None
+
+    usage = collections.OrderedDict()
+    for field in USAGE_FIELDS:
+        values = [sample[field] for sample in samples]
+        if field in PEAK_USAGE_FIELDS:
+            usage[field] = max(values)
+        else:
+            usage[field] = sum(values) / len(values)
+    return usage
+
+def format_usage(usage):
+    if usage is None:
+        return " ".join([MISSING_USAGE] * len(USAGE_FIELDS))
+    return " ".join("%.6g" % usage[field] for field in USAGE_FIELDS)
+
+###################################################################################
+# USAGE FILE
+###################################################################################
+
+def get_usage_path(output_file):
+    return os.path.splitext(output_file)[0] + USAGE_EXTENSION
+
+def write_usage_file(output_file, usages):
+    """ Usage of every summary line in output_file, line by line.
+    """
+    fp = open(get_usage_path(output_file), "w")
+    for usage in usages:
+        fp.write(format_usage(usage) + "\n")
+    fp.close()
+
+def parse_usage(fields):
+    if MISSING_USAGE in fields:
+        return None
+    return collections.OrderedDict(zip(USAGE_FIELDS, [float(field) for field in fields]))
+
+def read_usage_file(output_file, line_count=None):
+    """ Usage of every summary line in output_file, None for lines without
+        one. Without a usage file, or one that does not match the summary
+        file line for line, every line gets None.
+    """
+    path = get_usage_path(output_file)
+    usages = []
+    if os.path.exists(path):
+        fp = open(path)
+        for line in fp:
+            fields = line.split()
+            if fields:
+                usages.append(parse_usage(fields))
+        fp.close()
+
+    if line_count is not None and len(usages) != line_count:
+        if usages:
+            LOG.warning("%s has %d rows for %d summary lines, ignoring it",
+                        path, len(usages), line_count)
+        return [None] * line_count
+    return usages
+
+def iter_usage_file(output_file, lines):
+    """ (fields, usage) of every non-empty line of lines, the summary lines
+        of output_file as they are read, paired with the rows of its usage
+        file one at a time. Lines past the end of the usage file, or all of
+        them without one, get None.
+    """
+    path = get_usage_path(output_file)
+    fp = open(path) if os.path.exists(path) else None
+    rows = (row.split() for row in fp) if fp is not None else iter(())
+    rows = (fields for fields in rows if fields)
+
+    line_count = 0
+    usage_count = 0
+    try:
+        for line in lines:
+            data = line.split()
+            if not data:
+                continue
+            line_count += 1
+
+            fields = next(rows, None)
+            if fields is None:
+                yield data, None
+                continue
+            usage_count += 1
+            yield data, parse_usage(fields)
+
+        usage_count += sum(1 for fields in rows)
+    finally:
+        if fp is not None:
+            fp.close()
+
+    if fp is not None and usage_count != line_count:
+        LOG.warning("%s has %d rows for %d summary lines", path, usage_count, line_count)
@@ -0,0 +1,370 @@
+#!/usr/bin/env python
+
+###################################################################################
+# EXPERIMENT SPECS
+###################################################################################
+
+from __future__ import print_function
+import os
+import json
+import glob
+import hashlib
+import logging
+import argparse
+import itertools
+import collections
+
+import config
+import runcache
+import repetition
+import topology
+import counters
+import sweep
+from progress import format_duration
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+SPEC_DIR = config.BASE_DIR + "/specs/"
+
+# An experiment spec (JSON, or YAML with PyYAML installed):
+#   name        : experiment name, part of every job id
+#   experiment  : experiment type passed to the binary and collect_stats
+#   binary      : path to the benchmark
+#                 (any value may name a config.py setting instead, e.g. HYADAPT)
+#   arguments   : argv templates, formatted with the job's parameters
+#   axes        : parameter -> values, one job per point of their cross product;
+#                 TOPOLOGY_THREAD_COUNTS stands for the thread counts of this
+#                 machine (see topology.py)
+#   constants   : parameters shared by every job
+#   derived     : parameter -> expression over the parameters and config.py
+#   key         : summary line fields of a job, for the parser (optional)
+#   parse       : eval.py parser of a job's output (optional, default: the
+#                 summary file the binary writes)
+#   result_dir  : relative to the repository, or absolute
+#   result_file : file collect_stats writes, e.g. caching.csv
+#   repeated    : repeat jobs according to the repetition policy
+#   counters    : always record hardware counters
+#   estimate    : seconds per job run, until the journal knows better
+#   refine      : adaptive sampling of one axis (see refine.py)
+#   dimensions  : axes the summary lines do not carry, one result directory
+#                 level and store column each, in this order
+#   affinity    : axis holding a thread placement (see topology.py); jobs run
+#                 one at a time, pinned to the CPUs the placement gives their
+#                 "threads" parameter
+SPEC_DEFAULTS = {
+    "arguments" : [],
+    "axes" : {},
+    "constants" : {},
+    "derived" : {},
+    "key" : None,
+    "parse" : None,
+    "repeated" : False,
+    "counters" : False,
+    "estimate" : None,
+    "refine" : None,
+    "dimensions" : [],
+    "affinity" : None,
+}
+
+SPEC_REQUIRED = ("name", "experiment", "binary", "result_dir", "result_file")
+
+SPEC_EXTENSIONS = (".json", ".yaml", ".yml")
+
+JOB_ID_LENGTH = 12
+
+TOPOLOGY_THREAD_COUNTS = "TOPOLOGY_THREAD_COUNTS"
+
+# One job of a plan.
+#   job_id  : stable identity, from the spec name and the job's parameters
+#   params  : parameter -> value
+#   command : argv of the benchmark run
+#   key     : summary line fields handed to the parser
+PlanJob = collections.namedtuple('PlanJob', ['job_id', 'params', 'command', 'key'])
+
+RunPlan = collections.namedtuple('RunPlan', ['name', 'experiment', 'result_dir', 'result_file',
+                                             'parse', 'repeated', 'counters', 'estimate', 'jobs',
+                                             'dimensions', 'affinity'])
+
+# Cost of a plan, in seconds.
+#   cached        : jobs already in the run journal
+#   low, high     : wall-clock bounds for the remaining jobs
+#   known         : whether every remaining job had a duration to go by
+#   workers       : jobs running at once
+CostEstimate = collections.namedtuple('CostEstimate', ['jobs', 'cached', 'low', 'high', 'known',
+                                                       'workers'])
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def resolve(value):
+    """ Names of config.py settings stand for their value.
+    """
+    if isinstance(value, string_types) and value.isupper() and hasattr(config, value):
+        return getattr(config, value)
+    return value
+
+def get_config_namespace():
+    return dict((name, getattr(config, name)) for name in dir(config) if name.isupper())
+
+def get_job_id(name, params):
+    identity = json.dumps([name, [[key, str(value)] for key, value in params.items()]])
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()[:JOB_ID_LENGTH]
+
+def find_specs(spec_dir=SPEC_DIR):
+    paths = []
+    for extension in SPEC_EXTENSIONS:
+        paths.extend(glob.glob(os.path.join(spec_dir, "*" + extension)))
+    return sorted(paths)
+
+###################################################################################
+# LOAD
+###################################################################################
+
+def load_spec(path):
+    fp = open(path)
+    text = fp.read()
+    fp.close()
+
+    if path.endswith(".json"):
+        spec = json.loads(text, object_pairs_hook=collections.OrderedDict)
+    else:
+        if yaml is None:
+            raise ValueError("%s: reading YAML specs needs PyYAML" % path)
+        spec = yaml.safe_load(text)
+
+    missing = [field for field in SPEC_REQUIRED if field not in spec]
+    if missing:
+        raise ValueError("%s: missing %s" % (path, ", ".join(missing)))
+
+    unknown = [field for field in spec if field not in SPEC_REQUIRED and field not in SPEC_DEFAULTS]
+    if unknown:
+        raise ValueError("%s: unknown %s" % (path, ", ".join(unknown)))
+
+    merged = collections.OrderedDict(SPEC_DEFAULTS)
+    merged.update(spec)
+
+    for name in list(merged["dimensions"]) + [merged["affinity"]]:
+        if name is not None and name not in merged["axes"]:
+            raise ValueError("%s: dimension %s must be one of the axes" % (path, name))
+    if merged["affinity"] is not None and "threads" not in merged["axes"]:
+        raise ValueError("%s: affinity needs a threads axis" % path)
+
+    return merged
+
+###################################################################################
+# COMPILE
+###################################################################################
+
+def resolve_axis(values):
+    if values == TOPOLOGY_THREAD_COUNTS:
+        return topology.get_thread_counts(topology.read_topology())
+    return list(resolve(values))
+
+def get_axes(spec):
+    return collections.OrderedDict((name, resolve_axis(values))
+                                   for name, values in spec["axes"].items())
+
+def compile_job(spec, axis_values, namespace=None):
+    """ The job of one point, given a value for every axis.
+    """
+    if namespace is None:
+        namespace = get_config_namespace()
+
+    params = collections.OrderedDict((name, resolve(value))
+                                     for name, value in spec["constants"].items())
+    params.update(axis_values)
+
+    job_id = get_job_id(spec["name"], params)
+
+    for name, expression in spec["derived"].items():
+        scope = dict(namespace)
+        scope.update(params)
+        params[name] = eval(expression, {"__builtins__" : {}}, scope)
+
+    fields = dict(params, experiment=resolve(spec["experiment"]))
+    command = [resolve(spec["binary"])] + [str(argument).format(**fields)
+                                           for argument in spec["arguments"]]
+
+    if spec["key"] is not None:
+        key = [str(field).format(**fields) for field in spec["key"]]
+    else:
+        key = ["%s=%s" % (name, value) for name, value in params.items()]
+
+    return PlanJob(job_id, params, command, key)
+
+def compile_spec(spec):
+    """ The run plan of a spec: one job per point of the axes' cross product,
+        in axis order.
+    """
+    namespace = get_config_namespace()
+    experiment = resolve(spec["experiment"])
+    axes = get_axes(spec)
+
+    jobs = [compile_job(spec, zip(axes.keys(), values), namespace)
+            for values in itertools.product(*axes.values())]
+
+    ids = set(job.job_id for job in jobs)
+    if len(ids) != len(jobs):
+        raise ValueError("%s: axes produce duplicate jobs" % spec["name"])
+
+    return RunPlan(spec["name"], experiment,
+                   os.path.join(config.BASE_DIR, resolve(spec["result_dir"])),
+                   spec["result_file"], spec["parse"], spec["repeated"],
+                   spec["counters"], spec["estimate"], jobs,
+                   list(spec["dimensions"]), spec["affinity"])
+
+###################################################################################
+# COST
+###################################################################################
+
+def get_policy(plan, policy):
+    return policy if plan.repeated else repetition.SINGLE_RUN
+
+def get_collector(plan, collector=None):
+    """ Counter collector of the plan's runs: the one given, or perf for
+        specs that always record counters.
+    """
+    if collector is None and plan.counters:
+        return counters.CounterCollector(config.PERF, config.PERF_EVENTS)
+    return collector
+
+def get_job_dir(plan, job):
+    """ Result directory journaling the job. Pinned plans run every
+        combination of their dimensions in a directory of its own.
+    """
+    if plan.affinity is None:
+        return plan.result_dir
+    return os.path.join(plan.result_dir, *[str(job.params[name]) for name in plan.dimensions]) + "/"
+
+def get_job_cpus(plan, job, cpus):
+    """ CPUs a job of a pinned plan runs on, given the machine's topology.
+    """
+    if plan.affinity is None:
+        return None
+    return topology.get_affinity_cpus(cpus, job.params[plan.affinity], job.params["threads"])
+
+def get_job_keys(plan, policy, collector=None, cpus=None):
+    """ (journal, key) of the plan's jobs, the run journal entries run_sweep
+        and pinned_eval look up: commands run under perf given a collector,
+        and through taskset for pinned plans, which journal in their job
+        directories.
+    """
+    policy = get_policy(plan, policy)
+    if plan.affinity is not None and cpus is None:
+        cpus = topology.read_topology()
+
+    journals = collections.OrderedDict()
+    keys = []
+    for job in plan.jobs:
+        job_dir = get_job_dir(plan, job)
+        if job_dir not in journals:
+            journals[job_dir] = runcache.RunJournal(job_dir, plan.experiment)
+        journal = journals[job_dir]
+
+        command = list(job.command)
+        if collector is not None:
+            command = collector.wrap(command)
+        if plan.affinity is not None:
+            command = sweep.pin_command(command, get_job_cpus(plan, job, cpus))
+        keys.append((journal, journal.get_key(command + list(policy))))
+    return keys
+
+def estimate_cost(plan, policy, workers=1, collector=None, keys=None):
+    """ Wall-clock bounds of the jobs not in the journal yet, from the mean
+        duration of the experiment's finished runs or the spec's estimate.
+        Pinned plans run their jobs one at a time.
+    """
+    if keys is None:
+        keys = get_job_keys(plan, policy, collector)
+    cached = sum(1 for journal, key in keys if key in journal)
+    remaining = len(keys) - cached
+
+    journals = []
+    for journal, key in keys:
+        if journal not in journals:
+            journals.append(journal)
+    durations = [duration for journal in journals for duration in journal.get_durations()]
+    if durations:
+        per_run = sum(durations) / len(durations)
+    else:
+        per_run = plan.estimate
+
+    if plan.affinity is not None:
+        workers = 1
+    workers = max(1, min(workers, remaining or 1))
+
+    if per_run is None:
+        return CostEstimate(len(keys), cached, None, None, remaining == 0, workers)
+
+    policy = get_policy(plan, policy)
+    low_runs = policy.warmup_runs + min(policy.min_runs, policy.max_runs)
+    high_runs = policy.warmup_runs + policy.max_runs
+
+    return CostEstimate(len(keys), cached,
+                        per_run * low_runs * remaining / workers,
+                        per_run * high_runs * remaining / workers,
+                        True, workers)
+
+def print_plan(plan, policy, workers=1, collector=None):
+    """ Dry run: every job of the plan and what running it would cost.
+    """
+    collector = get_collector(plan, collector)
+    keys = get_job_keys(plan, policy, collector)
+
+    print("%s (experiment %s) -> %s" % (plan.name, plan.experiment,
+                                        os.path.join(plan.result_dir, plan.result_file)))
+    for job, (journal, key) in zip(plan.jobs, keys):
+        state = "cached" if key in journal else "run"
+        print("  %s %-6s %s" % (job.job_id, state, " ".join(job.command)))
+
+    cost = estimate_cost(plan, policy, workers, collector, keys)
+    if cost.known:
+        print("%d jobs, %d cached, estimated %s - %s on %d workers" % (
+            cost.jobs, cost.cached, format_duration(cost.low), format_duration(cost.high), cost.workers))
+    else:
+        print("%d jobs, %d cached, no estimate (no finished runs)" % (cost.jobs, cost.cached))
+
+###################################################################################
+# MAIN
+###################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='List the run plan of experiment specs')
+
+    parser.add_argument("specs", help='spec files (default: every spec in specs/)', nargs='*')
+    parser.add_argument("--workers", help='workers the estimate assumes', type=int, default=1)
+
+    args = parser.parse_args()
+
+    policy = repetition.RepetitionPolicy(config.WARMUP_RUNS, config.MIN_RUNS,
+                                         config.MAX_RUNS, config.CI_TARGET)
+    for path in args.specs or find_specs():
+        print_plan(compile_spec(load_spec(path)), policy, args.workers)
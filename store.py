@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RESULT STORE
+###################################################################################
+
+from __future__ import print_function
+import os
+import math
+
+import numpy as np
+
+from loader import load_data_file
+from rusage import USAGE_FIELDS
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Typed columns shared by every experiment. Values an experiment does not
+# report are stored as "" / -1 / NaN.
+STORE_COLUMNS = (
+    ("layout", "U8"),
+    ("operator", "U12"),
+    ("selectivity", "f8"),
+    ("projectivity", "f8"),
+    ("column_count", "i8"),
+    ("write_ratio", "f8"),
+    ("subset_experiment_type", "i8"),
+    ("access_num_group", "i8"),
+    ("subset_ratio", "f8"),
+    ("tuples_per_tg", "i8"),
+    ("txn_itr", "i8"),
+    ("theta", "f8"),
+    ("split_point", "f8"),
+    ("sample_weight", "f8"),
+    ("scale_factor", "f8"),
+    ("tile_group_type", "i8"),
+    ("affinity", "U8"),
+    ("stat", "f8"),
+    ("stat_median", "f8"),
+    ("stat_std", "f8"),
+    ("stat_ci_low", "f8"),
+    ("stat_ci_high", "f8"),
+    ("repetitions", "i8"),
+) + tuple((name, "f8") for name in USAGE_FIELDS)
+
+STORE_DTYPE = np.dtype([(name, kind) for name, kind in STORE_COLUMNS])
+
+STORE_COLUMN_KINDS = dict((name, np.dtype(kind).kind) for name, kind in STORE_COLUMNS)
+
+# Columns describing the measurement itself (see repetition.py)
+STAT_COLUMNS = ("stat", "stat_median", "stat_std", "stat_ci_low", "stat_ci_high", "repetitions")
+
+# Resource usage of the run a measurement came from (see rusage.py)
+USAGE_COLUMNS = USAGE_FIELDS
+
+# Columns that identify a measurement
+INDEX_COLUMNS = tuple(name for name, kind in STORE_COLUMNS
+                      if name not in STAT_COLUMNS and name not in USAGE_COLUMNS)
+
+STORE_EXTENSION = ".npz"
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def convert_value(name, value):
+    kind = STORE_COLUMN_KINDS[name]
+    if value is None:
+        if kind == "U":
+            return ""
+        elif kind == "i":
+            return -1
+        return float("nan")
+
+    if kind == "U":
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+    elif kind == "i":
+        return int(float(value))
+    return float(value)
+
+def get_store_path(result_dir, result_file_name):
+    return os.path.join(result_dir, os.path.splitext(result_file_name)[0] + STORE_EXTENSION)
+
+def _index_key(values):
+    # NaN never compares equal, so it would never hit the index
+    return tuple(None if isinstance(value, float) and math.isnan(value) else value
+                 for value in values)
+
+###################################################################################
+# STORE
+###################################################################################
+
+class ResultStore(object):
+    """ Columnar results of one experiment, kept in a single .npz file.
+
+        Rows are appended in collection order and saved as one typed array per
+        column. Queries filter the columns with vectorized masks; exact lookups
+        on the full parameter tuple go through a hash index.
+    """
+
+    def __init__(self, path, x_column="selectivity", y_column="stat"):
+        self.path = path
+        self.x_column = x_column
+        self.y_column = y_column
+        self.data = np.zeros(0, dtype=STORE_DTYPE)
+        self.pending = []
+        self._index = None
+
+        if os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        return len(self.data) + len(self.pending)
+
+    def load(self):
+        archive = np.load(self.path, allow_pickle=False)
+        try:
+            data = np.zeros(len(archive["stat"]), dtype=STORE_DTYPE)
+            for name, kind in STORE_COLUMNS:
+                if name in archive.files:
+                    data[name] = archive[name]
+                else:
+                    data[name] = convert_value(name, None)
+        finally:
+            archive.close()
+
+        self.data = data
+        self.pending = []
+        self._index = None
+
+    def save(self):
+        data = self.frozen()
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # np.savez adds the extension itself
+        temp_path = self.path + ".tmp"
+        np.savez(temp_path, **dict((name, data[name]) for name in STORE_DTYPE.names))
+        os.rename(temp_path + STORE_EXTENSION, self.path)
+
+    def clear(self):
+        self.data = np.zeros(0, dtype=STORE_DTYPE)
+        self.pending = []
+        self._index = None
+
+    def append(self, **values):
+        self.pending.append(tuple(convert_value(name, values.get(name))
+                                  for name, kind in STORE_COLUMNS))
+
+    def frozen(self):
+        if self.pending:
+            rows = np.array(self.pending, dtype=STORE_DTYPE)
+            self.data = np.concatenate((self.data, rows))
+            self.pending = []
+            self._index = None
+        return self.data
+
+    def index(self):
+        if self._index is None:
+            data = self.frozen()
+            index = {}
+            columns = [data[name].tolist() for name in INDEX_COLUMNS]
+            for row_id, values in enumerate(zip(*columns)):
+                index.setdefault(_index_key(values), []).append(row_id)
+            self._index = index
+        return self._index
+
+    def lookup(self, **params):
+        """ Rows whose full parameter tuple matches params exactly.
+        """
+        key = _index_key(tuple(convert_value(name, params.get(name)) for name in INDEX_COLUMNS))
+        return self.frozen()[self.index().get(key, [])]
+
+    def select(self, **filters):
+        """ Rows matching every column=value filter, in collection order.
+        """
+        data = self.frozen()
+        mask = np.ones(len(data), dtype=bool)
+        for name, value in filters.items():
+            mask &= (data[name] == convert_value(name, value))
+        return data[mask]
+
+    def series(self, x_column=None, y_column=None, **filters):
+        """ [x, y] rows of the matching measurements, shaped like a result file.
+        """
+        rows = self.select(**filters)
+        x_column = x_column or self.x_column
+        y_column = y_column or self.y_column
+        return np.column_stack((rows[x_column].astype(float),
+                                rows[y_column].astype(float)))
+
+###################################################################################
+# IMPORT
+###################################################################################
+
+def import_results_tree(store, result_dir, result_file_name, path_fields):
+    """ Fill the store from a results/<exp>/... tree of "x , y" files.
+        path_fields names the column of every directory below result_dir, or is
+        a function from the directory components to those names.
+    """
+    for directory, dir_names, file_names in sorted(os.walk(result_dir)):
+        if result_file_name not in file_names:
+            continue
+
+        relative_dir = os.path.relpath(directory, result_dir)
+        components = [component for component in relative_dir.split(os.sep)
+                      if component and component != "."]
+
+        fields = path_fields(components) if callable(path_fields) else path_fields
+        if len(fields) != len(components):
+            continue
+
+        params = dict(zip(fields, components))
+        data = load_data_file(os.path.join(directory, result_file_name), n_cols=2)
+        for x_value, y_value in data:
+            params[store.x_column] = x_value
+            params[store.y_column] = y_value
+            store.append(**params)
+
+    return store
+
+def is_stale(store_path, result_dir, result_file_name):
+    """ Whether a result file below result_dir changed after the store was
+        saved.
+    """
+    saved = os.path.getmtime(store_path)
+    for directory, dir_names, file_names in os.walk(result_dir):
+        if result_file_name in file_names:
+            if os.path.getmtime(os.path.join(directory, result_file_name)) > saved:
+                return True
+    return False
+
+def open_store(result_dir, result_file_name, path_fields, x_column, y_column):
+    """ The experiment's store, imported from its result files on first use
+        and again once any of them is newer than the store. collect_stats
+        saves the store after the result files, so only files rewritten
+        some other way trigger the import.
+    """
+    store = ResultStore(get_store_path(result_dir, result_file_name), x_column, y_column)
+
+    if not os.path.isdir(result_dir):
+        return store
+
+    if not os.path.exists(store.path) or is_stale(store.path, result_dir, result_file_name):
+        store.clear()
+        import_results_tree(store, result_dir, result_file_name, path_fields)
+        store.save()
+
+    return store
@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+
+###################################################################################
+# SWEEP EXECUTOR
+###################################################################################
+
+from __future__ import print_function
+import os
+import time
+import shutil
+import logging
+import tempfile
+import subprocess
+import collections
+import multiprocessing
+
+import counters
+import rusage
+import repetition
+import watchdog
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+TASKSET = "/usr/bin/taskset"
+
+CPU_COUNT = multiprocessing.cpu_count()
+
+# One configuration of a sweep.
+#   command : argv of the benchmark run (without any pinning prefix)
+#   parse   : module-level function (params, out, err, work_dir) -> list of summary lines
+#   params  : whatever parse needs to build the summary lines
+SweepJob = collections.namedtuple('SweepJob', ['command', 'parse', 'params'])
+
+# Output of a run, in the worker's work directory
+STDOUT_FILE_NAME = "stdout.log"
+STDERR_FILE_NAME = "stderr.log"
+
+# Per-process worker state, set up by _init_worker
+_WORKER = {}
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def get_worker_cpus(slot, workers, cpu_count=CPU_COUNT):
+    """ Cores owned by the given worker slot. Every worker gets its own
+        contiguous block; extra cores go to the first slots.
+    """
+    workers = max(1, min(workers, cpu_count))
+    slot = slot % workers
+    per_worker = cpu_count // workers
+    extra = cpu_count % workers
+    start = slot * per_worker + min(slot, extra)
+    end = start + per_worker + (1 if slot < extra else 0)
+    return list(range(start, end))
+
+def pin_command(command, cpus):
+    if not cpus or not os.path.exists(TASKSET):
+        return list(command)
+    cpu_list = ",".join(str(cpu) for cpu in cpus)
+    return [TASKSET, "-c", cpu_list] + list(command)
+
+def read_file(path):
+    fp = open(path)
+    text = fp.read()
+    fp.close()
+    return text
+
+def read_summary(params, out, err, work_dir, output_file):
+    """ Default parser: the lines the benchmark wrote into its summary file.
+    """
+    summary_file = os.path.join(work_dir, output_file)
+    if not os.path.exists(summary_file):
+        LOG.warning("No summary file in %s", work_dir)
+        return []
+
+    fp = open(summary_file)
+    lines = [line.rstrip("\n") for line in fp if line.strip()]
+    fp.close()
+    return lines
+
+###################################################################################
+# WORKER
+###################################################################################
+
+def _init_worker(slot_counter, work_root, workers, slowest=None):
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+
+    setup_worker(slot, work_root, workers)
+    _WORKER['slowest'] = slowest
+
+def setup_worker(slot, work_root, workers):
+    """ Give this process its own work directory and cores.
+    """
+    work_dir = os.path.join(work_root, "worker-" + str(slot))
+    if not os.path.exists(work_dir):
+        os.makedirs(work_dir)
+
+    _WORKER['slot'] = slot
+    _WORKER['work_dir'] = work_dir
+    _WORKER['cpus'] = get_worker_cpus(slot, workers)
+
+def _run_once(job, output_file, collector, timeout):
+    work_dir = _WORKER['work_dir']
+    perf_file = os.path.join(work_dir, counters.PERF_OUTPUT_FILE)
+    out_file = os.path.join(work_dir, STDOUT_FILE_NAME)
+    err_file = os.path.join(work_dir, STDERR_FILE_NAME)
+
+    # cleanup
+    for stale_file in (os.path.join(work_dir, output_file), perf_file):
+        if os.path.exists(stale_file):
+            os.remove(stale_file)
+
+    command = job.command
+    if collector is not None:
+        command = collector.wrap(command)
+    command = pin_command(command, _WORKER['cpus'])
+    LOG.debug("worker %d: %s", _WORKER['slot'], " ".join(command))
+
+    # output goes to files, so the child can be reaped with wait4 for its usage
+    out_fp = open(out_file, "w")
+    err_fp = open(err_file, "w")
+    try:
+        p = subprocess.Popen(command,
+                             cwd=work_dir,
+                             stdout=out_fp,
+                             stderr=err_fp,
+                             universal_newlines=True,
+                             preexec_fn=watchdog.new_process_group)
+        with watchdog.Watchdog(p, timeout) as guard:
+            usage = rusage.wait_process(p)
+    finally:
+        out_fp.close()
+        err_fp.close()
+
+    if guard.expired:
+        return [], None, None, "timed out after %.0fs" % timeout
+    if p.returncode != 0:
+        return [], None, None, "exited with %d" % p.returncode
+
+    job_counters = None
+    if collector is not None:
+        job_counters = collector.read(perf_file)
+
+    out = read_file(out_file)
+    err = read_file(err_file)
+    if job.parse is None:
+        return read_summary(job.params, out, err, work_dir, output_file), job_counters, usage, None
+    return job.parse(job.params, out, err, work_dir), job_counters, usage, None
+
+def get_run_timeout(guard, timeout):
+    """ Time limit of the next run: derived from the slowest run of the sweep
+        so far once there is one, the task's own limit before that.
+    """
+    slowest = _WORKER.get('slowest')
+    if slowest is None or slowest.value <= 0:
+        return timeout
+    return watchdog.get_timeout(guard, slowest.value)
+
+def record_duration(duration):
+    slowest = _WORKER.get('slowest')
+    if slowest is None:
+        return
+    with slowest.get_lock():
+        slowest.value = max(slowest.value, duration)
+
+def _run_job(task):
+    index, job, output_file, policy, collector, guard, timeout = task
+    samples = []
+    usages = []
+    durations = []
+
+    def attempt():
+        start = time.time()
+        lines, job_counters, usage, failure = _run_once(job, output_file, collector,
+                                                        get_run_timeout(guard, timeout))
+        if failure is None:
+            samples.append(job_counters)
+            usages.append(usage)
+            durations.append(time.time() - start)
+            record_duration(durations[-1])
+        return lines, failure
+
+    def run_once():
+        return watchdog.run_with_retry(attempt, guard)
+
+    try:
+        lines, runs = repetition.repeat_run(run_once, policy)
+    except watchdog.RunFailed as failure:
+        return index, None, None, None, None, (failure.reason, failure.attempts)
+
+    # warm-up runs are not measured
+    return (index, lines, counters.mean_counters(samples[-runs:]),
+            rusage.merge_usage(usages[-runs:]), max(durations), None)
+
+###################################################################################
+# SWEEP
+###################################################################################
+
+def run_sweep(jobs, output_file, workers=CPU_COUNT, journal=None,
+              policy=repetition.SINGLE_RUN, collector=None, tracker=None,
+              guard=watchdog.NO_RETRY, failure_log=None, queue_dir=None, estimate=None):
+    """ Run every job on a pool of pinned workers and write the summary lines
+        into output_file in job order, ready for collect_stats.
+        Each job is repeated according to the policy and, given a counter
+        collector, run under perf; jobs already finished in the run journal
+        are not run again. Returns the lines and the counters of every job;
+        the resource usage of every line goes next to output_file.
+        A progress tracker, given one, counts every finished job.
+        Runs are stopped and retried according to the watchdog policy guard,
+        limited by the slowest run of the journal and of the sweep so far, or
+        by estimate, seconds per run, before any run finished; jobs that
+        still fail are left out and recorded in failure_log.
+        Given a queue_dir, the jobs are served through a work queue instead,
+        to the local workers and any other machine sharing the directory.
+    """
+    jobs = list(jobs)
+    results = [None] * len(jobs)
+    job_counters = [None] * len(jobs)
+    job_usage = [None] * len(jobs)
+    keys = [None] * len(jobs)
+
+    for index, job in enumerate(jobs):
+        command = list(job.command)
+        if collector is not None:
+            command = collector.wrap(command)
+        if journal is not None:
+            keys[index] = journal.get_key(command + list(policy))
+            results[index] = journal.get(keys[index])
+            job_counters[index] = journal.get_counters(keys[index])
+            job_usage[index] = journal.get_usage(keys[index])
+
+    if tracker is not None:
+        tracker.total = len(jobs)
+        tracker.skip(sum(1 for lines in results if lines is not None))
+
+    history = journal.get_max_duration() if journal is not None else None
+    timeout = watchdog.get_sweep_timeout(guard, history, estimate)
+    # slowest run so far, shared with the workers
+    slowest = multiprocessing.Value('d', history or 0.0)
+
+    output_name = os.path.basename(output_file)
+    tasks = [(index, job, output_name, policy, collector, guard, timeout)
+             for index, job in enumerate(jobs) if results[index] is None]
+    # queue workers may share cores, e.g. to try the queue on one machine
+    local_workers = min(workers, len(tasks))
+    workers = max(1, min(workers, CPU_COUNT, len(tasks) or 1))
+    work_root = tempfile.mkdtemp(prefix="sweep-")
+
+    LOG.info("Running %d of %d configurations on %d workers",
+             len(tasks), len(jobs), workers)
+
+    slot_counter = multiprocessing.Value('i', 0)
+
+    lost = []
+
+    def finish(index, lines, counters_mean, usage, duration, failure):
+        if tracker is not None:
+            tracker.update()
+
+        if failure is not None:
+            reason, attempts = failure
+            params = jobs[index].params
+            if not isinstance(params, (list, tuple)):
+                params = [params]
+            params = [str(value) for value in params]
+
+            LOG.error("Lost configuration %s: %s after %d attempts",
+                      " ".join(params), reason, attempts)
+            results[index] = []
+            lost.append(index)
+            if failure_log is not None:
+                watchdog.record_failure(failure_log, jobs[index].command, reason,
+                                        attempts, params)
+            return
+
+        results[index] = lines
+        job_counters[index] = counters_mean
+        job_usage[index] = usage
+        if journal is not None:
+            journal.record(keys[index], lines, counters_mean, duration, usage=usage)
+
+    try:
+        if queue_dir is not None:
+            # imported here, the queue workers import this module themselves
+            import workqueue
+            workqueue.run_queued(tasks, queue_dir, local_workers, finish)
+        elif workers == 1:
+            _init_worker(slot_counter, work_root, workers, slowest)
+            for task in tasks:
+                finish(*_run_job(task))
+        else:
+            pool = multiprocessing.Pool(workers,
+                                        initializer=_init_worker,
+                                        initargs=(slot_counter, work_root, workers, slowest))
+            try:
+                # record runs as they finish, merge them in job order below
+                for result in pool.imap_unordered(_run_job, tasks):
+                    finish(*result)
+                pool.close()
+            except:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
+    finally:
+        _WORKER.clear()
+        shutil.rmtree(work_root, ignore_errors=True)
+
+    if tracker is not None:
+        tracker.finish()
+    if lost and failure_log is not None:
+        watchdog.log_failures(failure_log)
+
+    # write to file
+    target = open(output_file, 'w')
+    for lines in results:
+        for line in lines:
+            target.write(line + "\n")
+    target.close()
+
+    rusage.write_usage_file(output_file, [usage for lines, usage in zip(results, job_usage)
+                                          for line in lines])
+
+    return results, job_counters
@@ -0,0 +1,60 @@
+from __future__ import print_function
+
+import counters
+
+PERF_OUTPUT = """# started on Mon Jan  1 00:00:00 2018
+
+2000,,cycles:u,1000000,100.00,,
+3000,,instructions:u,1000000,100.00,1.50,insn per cycle
+<not counted>,,cache-misses:u,0,0.00,,
+<not supported>,,LLC-load-misses,0,100.00,,
+"""
+
+def test_parse_perf_output():
+    parsed = counters.parse_perf_output(PERF_OUTPUT)
+    assert list(parsed.keys()) == ["cycles", "instructions", "cache-misses", "LLC-load-misses"]
+    assert parsed["cycles"] == 2000
+    assert parsed["instructions"] == 3000
+    assert parsed["cache-misses"] is None
+    assert parsed["LLC-load-misses"] is None
+
+def test_collector_wraps_and_reads(tmpdir):
+    collector = counters.CounterCollector("/usr/bin/perf", ["cycles", "cache-misses"])
+    output_file = str(tmpdir.join(counters.PERF_OUTPUT_FILE))
+    assert collector.wrap(["./hyadapt", "-e", "1"], output_file) == \
+        ["/usr/bin/perf", "stat", "-x", ",", "-o", output_file,
+         "-e", "cycles,cache-misses", "./hyadapt", "-e", "1"]
+
+    # no output, e.g. perf failed to start
+    assert list(collector.read(output_file).values()) == [None, None]
+
+    tmpdir.join(counters.PERF_OUTPUT_FILE).write(PERF_OUTPUT)
+    assert list(collector.read(output_file).items()) == [("cycles", 2000), ("cache-misses", None)]
+
+def test_mean_counters_skips_uncounted_runs():
+    samples = [{"cycles" : 10.0, "cache-misses" : None},
+               None,
+               {"cycles" : 20.0, "cache-misses" : 4.0}]
+    means = counters.mean_counters(samples)
+    assert means["cycles"] == 15.0
+    assert means["cache-misses"] == 4.0
+    assert counters.mean_counters([None, {}]) is None
+
+def test_derive_counters():
+    derived = counters.derive_counters({"cycles" : 2000.0, "instructions" : 3000.0,
+                                        "cache-misses" : 50.0}, tuple_count=100)
+    assert derived["ipc"] == 1.5
+    assert derived["cache-misses-per-tuple"] == 0.5
+
+    # without a tuple count there are no per-tuple columns
+    derived = counters.derive_counters({"cycles" : None, "cache-misses" : 50.0})
+    assert derived["ipc"] is None
+    assert "cache-misses-per-tuple" not in derived
+
+def test_write_counters(tmpdir):
+    result_dir = str(tmpdir.join("caching"))
+    counters.write_counters(result_dir, ("layout",), ("row",), {"cycles" : 2000.0})
+    counters.write_counters(result_dir, ("layout",), ("column",), {"cycles" : 0.25})
+    fp = open(str(tmpdir.join("caching", counters.COUNTERS_FILE_NAME)))
+    assert fp.read() == "layout , cycles\nrow , 2000\ncolumn , 0.250000\n"
+    fp.close()
@@ -0,0 +1,52 @@
+from __future__ import print_function
+
+import numpy as np
+import pytest
+
+import downsample
+
+def make_series(count):
+    x = np.arange(count, dtype=float)
+    y = np.sin(x / 50.0) * 100
+    # one spike a pixel-wide line must not lose
+    y[count // 3] = 1000
+    return np.column_stack((x, y))
+
+def test_lttb_keeps_ends_and_budget():
+    points = make_series(10000)
+    reduced = downsample.lttb(points, 200)
+    assert len(reduced) == 200
+    assert reduced[0].tolist() == points[0].tolist()
+    assert reduced[-1].tolist() == points[-1].tolist()
+    assert np.all(np.diff(reduced[:, 0]) > 0)
+    assert reduced[:, 1].max() == 1000
+
+def test_minmax_keeps_extremes():
+    points = make_series(10000)
+    reduced = downsample.minmax(points, 200)
+    assert len(reduced) <= 200
+    assert reduced[0].tolist() == points[0].tolist()
+    assert reduced[-1].tolist() == points[-1].tolist()
+    assert np.all(np.diff(reduced[:, 0]) > 0)
+    assert reduced[:, 1].max() == points[:, 1].max()
+    assert reduced[:, 1].min() == points[:, 1].min()
+
+def test_short_series_are_kept():
+    points = make_series(50)
+    assert downsample.lttb(points, 100) is points
+    assert downsample.minmax(points, 100) is points
+    assert downsample.downsample(points, 100).tolist() == points.tolist()
+
+def test_point_budget():
+    assert downsample.get_point_budget(400) == 400
+    assert downsample.get_point_budget(400, points_per_pixel=0.5) == 200
+    assert downsample.get_point_budget(1) == 3
+    assert downsample.get_point_budget(400, points_per_pixel=0) is None
+
+def test_downsample_methods():
+    points = make_series(10000)
+    assert len(downsample.downsample(points, 300, method="lttb")) == 300
+    assert len(downsample.downsample(points, 300, method="minmax")) <= 300
+    assert len(downsample.downsample(points, 300, method="none")) == 10000
+    with pytest.raises(ValueError):
+        downsample.downsample(points, 300, method="average")
@@ -0,0 +1,70 @@
+from __future__ import print_function
+
+import sys
+import collections
+
+import numpy as np
+
+import figcache
+
+FigureJob = collections.namedtuple('FigureJob', ['file_name', 'chart', 'datasets', 'width', 'height'])
+
+CHART_MODULE = """
+LINE_WIDTH = %(line_width)s
+
+def get_style():
+    return dict(linewidth=LINE_WIDTH)
+
+def create_chart(datasets):
+    return [get_style() for dataset in datasets]
+
+def save_chart(fig):
+    return fig
+"""
+
+def import_charts(tmpdir, name, line_width=2.0):
+    tmpdir.join(name + ".py").write(CHART_MODULE % dict(line_width=line_width))
+    sys.path.insert(0, str(tmpdir))
+    try:
+        return __import__(name)
+    finally:
+        sys.path.remove(str(tmpdir))
+
+def test_code_digest_follows_helpers_and_settings(tmpdir):
+    first = import_charts(tmpdir, "charts_first")
+    same = import_charts(tmpdir, "charts_same")
+    wider = import_charts(tmpdir, "charts_wider", line_width=3.0)
+
+    digest = figcache.get_code_digest(first.create_chart)
+    assert figcache.get_code_digest(same.create_chart) == digest
+    # a setting read by a helper used in a comprehension
+    assert figcache.get_code_digest(wider.create_chart) != digest
+    # shared code every figure goes through
+    assert figcache.get_code_digest(first.create_chart, shared=(first.save_chart,)) != digest
+
+def test_data_digest():
+    job = FigureJob("a.pdf", test_data_digest, [np.array([[0.1, 1.0]])], 4, 2)
+    entry = figcache.get_figure_entry(job)
+    assert entry["chart"] == "test_data_digest"
+    assert figcache.get_figure_entry(job._replace(datasets=[np.array([[0.1, 2.0]])]))["data"] != entry["data"]
+    assert figcache.get_figure_entry(job._replace(width=5))["data"] != entry["data"]
+
+def test_stale_jobs(tmpdir):
+    charts = import_charts(tmpdir, "charts_stale")
+    file_name = str(tmpdir.join("chart.pdf"))
+    job = FigureJob(file_name, charts.create_chart, [np.array([[0.1, 1.0]])], 4, 2)
+    manifest = figcache.FigureManifest(str(tmpdir.join(figcache.MANIFEST_FILE_NAME)))
+
+    ((stale_job, entry),) = figcache.get_stale_jobs([job], manifest)
+    assert manifest.get_reason(file_name, entry) == "missing"
+
+    tmpdir.join("chart.pdf").write("")
+    manifest.record(file_name, entry)
+    manifest.save()
+
+    manifest = figcache.FigureManifest(manifest.path)
+    assert figcache.get_stale_jobs([job], manifest) == []
+    assert len(figcache.get_stale_jobs([job], manifest, force=True)) == 1
+    changed = job._replace(datasets=[np.array([[0.1, 2.0]])])
+    ((stale_job, entry),) = figcache.get_stale_jobs([changed], manifest)
+    assert manifest.get_reason(file_name, entry) == "data changed"
@@ -0,0 +1,81 @@
+from __future__ import print_function
+
+import os
+
+import numpy as np
+
+import latency
+from config import SUMMARY_KEY_FIELDS, LATENCY_PERCENTILES
+
+def make_key(layout, theta, sample_weight):
+    params = dict((field, "0") for field in SUMMARY_KEY_FIELDS)
+    params.update(layout=layout, theta=theta, sample_weight=sample_weight)
+    return tuple(params[field] for field in SUMMARY_KEY_FIELDS)
+
+def test_small_latencies_are_exact():
+    histogram = latency.LatencyHistogram()
+    histogram.record(np.arange(1, 101))
+    assert len(histogram) == 100
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(99) == 99
+    assert histogram.percentile(100) == 100
+
+def test_percentiles_within_precision():
+    values = np.random.RandomState(0).lognormal(8, 2, 20000).astype(int)
+    histogram = latency.LatencyHistogram()
+    histogram.record(values)
+
+    error = 2.0 ** -(latency.LATENCY_PRECISION_BITS - 1)
+    for percent in (50.0, 99.0, 99.9):
+        exact = np.sort(values)[int(np.ceil(percent / 100.0 * len(values))) - 1]
+        assert abs(histogram.percentile(percent) - exact) <= exact * error
+    assert histogram.percentile(100) == values.max()
+
+def test_empty_histogram():
+    assert latency.LatencyHistogram().percentile(50) is None
+
+def test_buckets_and_merge():
+    first = latency.LatencyHistogram()
+    first.record([10, 1000], [3, 1])
+    second = latency.LatencyHistogram()
+    second.record([5000])
+
+    first.merge(second)
+    assert len(first) == 5
+    assert (first.min, first.max) == (10, 5000)
+    assert first.percentile(50) == 10
+
+def test_entry_round_trip():
+    histogram = latency.LatencyHistogram()
+    histogram.record([3, 300, 300000])
+    copy = latency.LatencyHistogram.from_entry(histogram.to_entry())
+    for percent in LATENCY_PERCENTILES:
+        assert copy.percentile(percent) == histogram.percentile(percent)
+
+def test_parse_latency_file(tmpdir):
+    key = make_key("2", "0.5", "10")
+    path = tmpdir.join(latency.LATENCY_OUTPUT_FILE)
+    path.write(" ".join(key) + " samples 10 20 30\n" +
+               " ".join(key) + " buckets 40 2\n")
+    histograms = latency.parse_latency_file(str(path))
+    assert list(histograms.keys()) == [key]
+    assert len(histograms[key]) == 5
+    assert latency.parse_latency_file(str(tmpdir.join("missing"))) == {}
+
+def test_write_and_read_latency(tmpdir):
+    result_dir = str(tmpdir.join("concurrency"))
+    histograms = {}
+    for sample_weight, value in (("10", 100), ("100", 200)):
+        histogram = latency.LatencyHistogram()
+        histogram.record([value])
+        histograms[make_key("2", "0.5", sample_weight)] = histogram
+
+    latency.write_latency(result_dir, histograms)
+    fp = open(os.path.join(result_dir, "hybrid", "0.5", latency.LATENCY_FILE_NAME))
+    assert fp.read() == "10.0 , 100.0 , 100.0 , 100.0\n100.0 , 200.0 , 200.0 , 200.0\n"
+    fp.close()
+
+    read = latency.read_latency(result_dir)
+    assert latency.latency_series(read, layout="hybrid", theta=0.5).tolist() == \
+        [[10, 100, 100, 100], [100, 200, 200, 200]]
+    assert latency.latency_series(read, layout="row").shape == (0, 1 + len(LATENCY_PERCENTILES))
@@ -0,0 +1,47 @@
+from __future__ import print_function
+
+import pytest
+
+import loader
+
+def write_result(tmpdir, text):
+    path = tmpdir.join("result.csv")
+    path.write(text)
+    return str(path)
+
+def test_parse_result_file(tmpdir):
+    path = write_result(tmpdir, "0.1 , 12.5\n0.5 , 20\n1 , 31.25\n")
+    data = loader.parse_data_file(path, n_rows=3, n_cols=2)
+    assert data.tolist() == [[0.1, 12.5], [0.5, 20.0], [1.0, 31.25]]
+
+def test_parse_empty_file(tmpdir):
+    path = write_result(tmpdir, "")
+    assert loader.parse_data_file(path).shape == (0, 2)
+    with pytest.raises(ValueError):
+        loader.parse_data_file(path, n_rows=3)
+
+def test_parse_ragged_file_raises(tmpdir):
+    path = write_result(tmpdir, "0.1 , 12.5\n0.5 ,\n")
+    with pytest.raises(ValueError):
+        loader.parse_data_file(path)
+
+def test_parse_checks_expected_shape(tmpdir):
+    path = write_result(tmpdir, "0.1 , 12.5\n0.5 , 20\n")
+    with pytest.raises(ValueError):
+        loader.parse_data_file(path, n_rows=3)
+    with pytest.raises(ValueError):
+        loader.parse_data_file(path, n_cols=3)
+
+def test_load_reuses_cache_until_file_changes(tmpdir):
+    loader.clear_data_cache()
+    path = write_result(tmpdir, "1 , 2\n")
+    data = loader.load_data_file(path)
+    assert loader.load_data_file(path) is data
+    assert not data.flags.writeable
+
+    # a cached array is checked against the expected shape too
+    with pytest.raises(ValueError):
+        loader.load_data_file(path, n_rows=2)
+
+    write_result(tmpdir, "1 , 2\n3 , 4\n")
+    assert loader.load_data_file(path, n_rows=2).tolist() == [[1, 2], [3, 4]]
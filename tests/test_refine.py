@@ -0,0 +1,96 @@
+from __future__ import print_function
+
+import json
+import collections
+
+import numpy as np
+import pytest
+
+import refine
+import spec as specs
+
+def test_find_crossovers():
+    xs = np.array([0.0, 0.5, 1.0])
+    curves = collections.OrderedDict([(0, np.array([10.0, 20.0, 30.0])),
+                                      (1, np.array([25.0, 25.0, 25.0]))])
+    crossovers = refine.find_crossovers(("100",), xs, curves)
+    assert len(crossovers) == 1
+    crossover = crossovers[0]
+    assert (crossover.first, crossover.second) == (0, 1)
+    assert crossover.x == pytest.approx(0.75)
+    assert (crossover.low, crossover.high) == (0.5, 1.0)
+
+def test_find_crossover_on_sample():
+    xs = np.array([0.0, 0.5, 1.0])
+    curves = collections.OrderedDict([(0, np.array([10.0, 20.0, 30.0])),
+                                      (1, np.array([15.0, 20.0, 25.0]))])
+    crossovers = refine.find_crossovers((), xs, curves)
+    assert [(crossover.x, crossover.low, crossover.high) for crossover in crossovers] == \
+        [(0.5, 0.5, 0.5)]
+
+def test_score_intervals_prefers_crossings():
+    xs = np.array([0.0, 0.5, 1.0])
+    curves = collections.OrderedDict([(0, np.array([10.0, 20.0, 30.0])),
+                                      (1, np.array([25.0, 25.0, 25.0]))])
+    scored = refine.score_intervals(xs, curves, min_width=0.01, curvature=0.1)
+    assert [midpoint for score, midpoint in scored] == [0.75]
+
+    # too narrow to split again
+    assert refine.score_intervals(xs, curves, min_width=0.5, curvature=0.1) == []
+
+def test_get_curves_skips_unsampled_points():
+    points = {(0, 0.0) : 1.0, (1, 0.0) : 2.0, (0, 0.5) : 3.0, (1, 0.5) : None, (0, 1.0) : 5.0}
+    xs, curves = refine.get_curves(points, [0, 1])
+    assert xs.tolist() == [0.0]
+    assert curves[0].tolist() == [1.0]
+
+def test_get_stat():
+    assert refine.get_stat(["0 0.5 12.5"], 2) == 12.5
+    assert refine.get_stat([], 2) is None
+    assert refine.get_stat(["0 0.5"], 2) is None
+
+def make_spec(tmpdir, refine_settings):
+    entry = {
+        "name" : "crossing",
+        "experiment" : 1,
+        "binary" : "./hyadapt",
+        "arguments" : ["-l", "{layout}", "-s", "{selectivity}"],
+        "axes" : {"layout" : [0, 1], "selectivity" : [0.0, 0.5, 1.0]},
+        "key" : ["{layout}", "{selectivity}"],
+        "refine" : refine_settings,
+        "result_dir" : str(tmpdir),
+        "result_file" : "crossing.csv",
+    }
+    path = tmpdir.join("crossing.json")
+    path.write(json.dumps(entry))
+    return specs.load_spec(str(path))
+
+def test_get_settings(tmpdir):
+    settings = refine.get_settings(make_spec(tmpdir, {"axis" : "selectivity", "series" : "layout"}))
+    assert settings["budget"] == refine.REFINE_DEFAULTS["budget"]
+    with pytest.raises(ValueError):
+        refine.get_settings(make_spec(tmpdir, {"axis" : "projectivity", "series" : "layout"}))
+
+def test_refinement_narrows_crossover(tmpdir):
+    spec = make_spec(tmpdir, {"axis" : "selectivity", "series" : "layout", "budget" : 8})
+
+    # layout 0 grows with the selectivity and crosses layout 1 at 0.3
+    def run_jobs(jobs):
+        lines = []
+        for job in jobs:
+            layout, selectivity = job.params["layout"], job.params["selectivity"]
+            stat = 10 + 50 * selectivity if layout == 0 else 25
+            lines.append(["%s %s %s" % (layout, selectivity, stat)])
+        return lines
+
+    lines, crossovers, group_axes = refine.run_refinement(spec, run_jobs)
+    assert group_axes == []
+    # the coarse grid plus the budget
+    assert len(lines) == 6 + 8
+    assert len(crossovers) == 1
+    assert crossovers[0].x == pytest.approx(0.3)
+    assert crossovers[0].high - crossovers[0].low < 0.5
+
+    # sorted by series, then by the refined axis
+    keys = [tuple(float(field) for field in line.split()[:2]) for line in lines]
+    assert keys == sorted(keys)
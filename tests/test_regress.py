@@ -0,0 +1,73 @@
+from __future__ import print_function
+
+import os
+
+import numpy as np
+
+import regress
+
+def write_result(root, series, rows):
+    path = os.path.join(root, series)
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    fp = open(path, "w")
+    for x, y in rows:
+        fp.write("%s , %s\n" % (x, y))
+    fp.close()
+
+def test_compare_series():
+    baseline = np.array([10.0, 20.0, 30.0, 40.0])
+    # slower execution time everywhere
+    change, worst, t_stat, status = regress.compare_series(baseline, baseline * 1.2, -1)
+    assert round(change, 6) == 20
+    assert status == regress.REGRESSION
+    # faster, and higher throughput is better
+    assert regress.compare_series(baseline, baseline * 0.8, -1)[3] == regress.IMPROVEMENT
+    assert regress.compare_series(baseline, baseline * 1.2, 1)[3] == regress.IMPROVEMENT
+    # below the threshold
+    assert regress.compare_series(baseline, baseline * 1.01, -1)[3] == regress.UNCHANGED
+    # not a performance metric
+    assert regress.compare_series(baseline, baseline * 1.2, 0)[3] == regress.CHANGED
+
+def test_noise_is_not_significant():
+    baseline = np.array([10.0, 10.0, 10.0, 10.0])
+    current = np.array([13.0, 8.0, 12.0, 8.5])
+    assert regress.compare_series(baseline, current, -1)[3] == regress.UNCHANGED
+
+def test_align_series():
+    baseline = np.array([[0.1, 1.0], [0.5, 2.0], [1.0, 3.0]])
+    current = np.array([[0.1, 4.0], [1.0, 6.0]])
+    baseline_y, current_y = regress.align_series(baseline, current)
+    assert baseline_y.tolist() == [1.0, 3.0]
+    assert current_y.tolist() == [4.0, 6.0]
+
+def test_find_result_files_skips_sidecars(tmpdir):
+    root = str(tmpdir)
+    write_result(root, os.path.join("caching", "1000", "caching.csv"), [(0.1, 1)])
+    write_result(root, os.path.join("caching", "1000", "counters.csv"), [(0.1, 1)])
+    write_result(root, os.path.join("ycsb", "latency.csv"), [(0.1, 1)])
+    assert regress.find_result_files(root) == [os.path.join("caching", "1000", "caching.csv")]
+
+def test_affinity_level():
+    assert regress.has_affinity_level(os.path.join("concurrency", "compact", "row", "0.5",
+                                                   "concurrency.csv"))
+    assert not regress.has_affinity_level(os.path.join("concurrency", "row", "0.5",
+                                                       "concurrency.csv"))
+
+def test_compare_trees(tmpdir):
+    results_dir, snapshot_dir = str(tmpdir.join("results")), str(tmpdir.join("snapshot"))
+    rows = [(0.1, 10), (0.5, 20), (1.0, 30)]
+    slow = os.path.join("selectivity", "row", "1", "100", "0", "selectivity.csv")
+    same = os.path.join("selectivity", "column", "1", "100", "0", "selectivity.csv")
+    new = os.path.join("selectivity", "hybrid", "1", "100", "0", "selectivity.csv")
+
+    for series in (slow, same):
+        write_result(snapshot_dir, series, rows)
+    write_result(results_dir, slow, [(x, y * 1.5) for x, y in rows])
+    write_result(results_dir, same, rows)
+    write_result(results_dir, new, rows)
+
+    comparisons = regress.compare_trees(results_dir, snapshot_dir)
+    assert [(comparison.series, comparison.status) for comparison in comparisons] == [
+        (slow, regress.REGRESSION), (new, regress.NEW), (same, regress.UNCHANGED)]
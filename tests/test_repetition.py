@@ -0,0 +1,60 @@
+from __future__ import print_function
+
+import pytest
+
+import repetition
+
+def test_median_and_quantile():
+    assert repetition.get_median([3, 1, 2]) == 2
+    assert repetition.get_median([4, 1, 3, 2]) == 2.5
+    assert repetition.get_quantile([1, 2, 3, 4, 5], 0.25) == 2
+    assert repetition.get_quantile([1, 2], 0.5) == 1.5
+
+def test_t_value():
+    assert repetition.get_t_value(1) == 12.706
+    # between table entries the next larger one is used
+    assert repetition.get_t_value(22) == 2.060
+    assert repetition.get_t_value(1000) == repetition.T_95_LIMIT
+
+def test_reject_outliers():
+    assert repetition.reject_outliers([10, 11, 10, 12, 100]) == [10, 11, 10, 12]
+    # too few samples to tell
+    assert repetition.reject_outliers([10, 100]) == [10, 100]
+
+def test_summarize():
+    summary = repetition.summarize([10.0, 12.0, 14.0])
+    assert summary.mean == 12.0
+    assert summary.median == 12.0
+    assert summary.std == 2.0
+    assert summary.ci_high - summary.mean == pytest.approx(4.303 * 2.0 / 3 ** 0.5)
+    assert summary.repetitions == 3
+
+def test_single_sample_is_never_stable():
+    policy = repetition.RepetitionPolicy(0, 1, 5, 100.0)
+    assert not repetition.is_stable(repetition.summarize([5.0]), policy)
+    assert repetition.is_stable(repetition.summarize([5.0, 5.0]), policy)
+
+def make_run_once(stats):
+    stats = iter(stats)
+    def run_once():
+        return ["row 0.1 %s" % next(stats)]
+    return run_once
+
+def test_repeat_single_run_keeps_lines():
+    lines, runs = repetition.repeat_run(make_run_once(["12.5"]))
+    assert lines == ["row 0.1 12.5"]
+    assert runs == 1
+
+def test_repeat_stops_once_stable():
+    policy = repetition.RepetitionPolicy(1, 2, 10, 5.0)
+    # the warmup run is thrown away
+    lines, runs = repetition.repeat_run(make_run_once(["99", "10", "10", "50"]), policy)
+    assert runs == 2
+    assert lines == ["row 0.1 10 10 0 10 10 2"]
+
+def test_repeat_stops_at_max_runs():
+    policy = repetition.RepetitionPolicy(0, 2, 3, 1.0)
+    lines, runs = repetition.repeat_run(make_run_once(["10", "20", "30", "40"]), policy)
+    assert runs == 3
+    assert lines[0].split()[:3] == ["row", "0.1", "20"]
+    assert lines[0].split()[-1] == "3"
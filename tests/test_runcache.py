@@ -0,0 +1,56 @@
+from __future__ import print_function
+
+import os
+
+import runcache
+
+def test_run_key_depends_on_arguments_and_type():
+    key = runcache.get_run_key(1, ["./hyadapt", "-k", "1000"])
+    assert key == runcache.get_run_key(1, ["./hyadapt", "-k", "1000"])
+    assert key != runcache.get_run_key(1, ["./hyadapt", "-k", "2000"])
+    assert key != runcache.get_run_key(2, ["./hyadapt", "-k", "1000"])
+
+def test_run_key_follows_file_contents(tmpdir):
+    binary = tmpdir.join("hyadapt")
+    binary.write("v1")
+    key = runcache.get_run_key(1, [str(binary)])
+
+    binary.write("version 2")
+    assert runcache.get_run_key(1, [str(binary)]) != key
+
+def test_journal_resumes_and_skips_torn_lines(tmpdir):
+    journal = runcache.RunJournal(str(tmpdir), 1)
+    key = journal.get_key(["./hyadapt"])
+    journal.record(key, ["row 0.1 12.5"], duration=2.0, usage={"maxrss_kb" : 10})
+    journal.record("other", ["row 0.5 20"], duration=4.0)
+
+    fp = open(journal.path, "a")
+    fp.write('{"key" : "torn", "li')
+    fp.close()
+
+    journal = runcache.RunJournal(str(tmpdir), 1)
+    assert len(journal) == 2
+    assert key in journal
+    assert journal.get(key) == ["row 0.1 12.5"]
+    assert journal.get("missing") is None
+    assert journal.get_usage(key) == {"maxrss_kb" : 10}
+    assert journal.get_counters(key) is None
+    assert journal.get_max_duration() == 4.0
+    assert journal.get_line_count() == 1
+
+def test_empty_journal(tmpdir):
+    journal = runcache.RunJournal(str(tmpdir), 1)
+    assert journal.get_line_count() is None
+    assert journal.get_max_duration() is None
+
+def test_clean_results_keeps_journals(tmpdir):
+    result_dir = tmpdir.mkdir("projectivity")
+    result_dir.join(runcache.JOURNAL_FILE_NAME).write("")
+    result_dir.join("projectivity.csv").write("")
+    sub_dir = result_dir.mkdir("row")
+    sub_dir.join(runcache.JOURNAL_FILE_NAME).write("")
+    result_dir.mkdir("column").join("projectivity.csv").write("")
+
+    runcache.clean_results(str(result_dir))
+    assert sorted(os.listdir(str(result_dir))) == sorted([runcache.JOURNAL_FILE_NAME, "row"])
+    assert os.listdir(str(sub_dir)) == [runcache.JOURNAL_FILE_NAME]
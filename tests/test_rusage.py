@@ -0,0 +1,51 @@
+from __future__ import print_function
+
+import sys
+import subprocess
+
+import rusage
+
+def make_usage(max_rss_kb, user_time):
+    usage = dict((field, 1.0) for field in rusage.USAGE_FIELDS)
+    usage.update(max_rss_kb=max_rss_kb, user_time=user_time)
+    return usage
+
+def test_merge_usage_keeps_peaks():
+    usage = rusage.merge_usage([make_usage(100, 1.0), None, make_usage(300, 3.0)])
+    assert usage["max_rss_kb"] == 300
+    assert usage["user_time"] == 2.0
+    assert rusage.merge_usage([None]) is None
+
+def test_usage_file_round_trip(tmpdir):
+    output_file = str(tmpdir.join("outputfile.summary"))
+    rusage.write_usage_file(output_file, [make_usage(100, 0.5), None])
+
+    usages = rusage.read_usage_file(output_file, line_count=2)
+    assert usages[0]["max_rss_kb"] == 100
+    assert usages[0]["user_time"] == 0.5
+    assert usages[1] is None
+
+    # rows that do not match the summary lines are ignored
+    assert rusage.read_usage_file(output_file, line_count=3) == [None, None, None]
+
+def test_iter_usage_file(tmpdir):
+    output_file = str(tmpdir.join("outputfile.summary"))
+    rusage.write_usage_file(output_file, [make_usage(100, 0.5)])
+
+    rows = list(rusage.iter_usage_file(output_file, ["row 0.1 12.5\n", "\n", "row 0.5 20\n"]))
+    assert [data for data, usage in rows] == [["row", "0.1", "12.5"], ["row", "0.5", "20"]]
+    assert rows[0][1]["max_rss_kb"] == 100
+    # past the end of the usage file
+    assert rows[1][1] is None
+
+    # without a usage file
+    missing = str(tmpdir.join("missing.summary"))
+    assert list(rusage.iter_usage_file(missing, ["row 0.1 12.5"])) == [(["row", "0.1", "12.5"], None)]
+
+def test_wait_process():
+    process = subprocess.Popen([sys.executable, "-c", "import sys; sys.exit(3)"])
+    usage = rusage.wait_process(process)
+    assert process.returncode == 3
+    assert usage["max_rss_kb"] > 0
+    # already reaped
+    assert rusage.wait_process(process) is None
@@ -0,0 +1,97 @@
+from __future__ import print_function
+
+import os
+import json
+
+import pytest
+
+import counters
+import repetition
+import runcache
+import spec as specs
+import topology
+
+POLICY = repetition.RepetitionPolicy(1, 3, 5, 5.0)
+
+# one socket, two cores
+CPUS = [topology.CpuInfo(0, 0, 0, 0), topology.CpuInfo(1, 0, 1, 0)]
+
+def write_spec(tmpdir, **fields):
+    entry = {
+        "name" : "scan",
+        "experiment" : 1,
+        "binary" : "./hyadapt",
+        "arguments" : ["-l", "{layout}", "-s", "{selectivity}", "-k", "{scale_factor}"],
+        "constants" : {"scale_factor" : 10},
+        "axes" : {"layout" : [0, 1], "selectivity" : [0.1, 0.5, 1.0]},
+        "repeated" : True,
+        "result_dir" : str(tmpdir.join("scan")) + "/",
+        "result_file" : "scan.csv",
+        "estimate" : 10,
+    }
+    entry.update(fields)
+    path = tmpdir.join("scan.json")
+    path.write(json.dumps(entry))
+    return str(path)
+
+def test_load_spec_checks_fields(tmpdir):
+    with pytest.raises(ValueError):
+        specs.load_spec(write_spec(tmpdir, binary=None, repeat=True))
+    with pytest.raises(ValueError):
+        specs.load_spec(write_spec(tmpdir, dimensions=["threads"]))
+    spec = specs.load_spec(write_spec(tmpdir))
+    assert spec["derived"] == {}
+
+def test_compile_spec(tmpdir):
+    plan = specs.compile_spec(specs.load_spec(write_spec(tmpdir)))
+    assert len(plan.jobs) == 6
+    assert plan.jobs[0].command == ["./hyadapt", "-l", "0", "-s", "0.1", "-k", "10"]
+    assert plan.result_dir == str(tmpdir.join("scan")) + "/"
+
+    # job ids are stable across compilations
+    again = specs.compile_spec(specs.load_spec(write_spec(tmpdir)))
+    assert [job.job_id for job in again.jobs] == [job.job_id for job in plan.jobs]
+
+def test_compile_spec_rejects_duplicate_jobs(tmpdir):
+    with pytest.raises(ValueError):
+        specs.compile_spec(specs.load_spec(write_spec(tmpdir, axes={"layout" : [0, 0]},
+                                                             arguments=["-l", "{layout}"])))
+
+def test_job_keys_match_runs(tmpdir):
+    plan = specs.compile_spec(specs.load_spec(write_spec(tmpdir)))
+    collector = counters.CounterCollector("/usr/bin/perf", ["cycles"])
+    keys = specs.get_job_keys(plan, POLICY, collector)
+
+    command = collector.wrap(plan.jobs[0].command) + list(POLICY)
+    journal, key = keys[0]
+    assert key == runcache.get_run_key(plan.experiment, command)
+    assert journal.path == os.path.join(plan.result_dir, runcache.JOURNAL_FILE_NAME)
+
+def test_estimate_cost(tmpdir):
+    plan = specs.compile_spec(specs.load_spec(write_spec(tmpdir)))
+    cost = specs.estimate_cost(plan, POLICY, workers=2)
+    assert (cost.jobs, cost.cached, cost.workers) == (6, 0, 2)
+    # warmup plus min_runs or max_runs of 10 seconds, 3 jobs per worker
+    assert (cost.low, cost.high) == (120, 180)
+
+    journal, key = specs.get_job_keys(plan, POLICY)[0]
+    journal.record(key, ["0 0.1 12.5"], duration=20.0)
+    cost = specs.estimate_cost(plan, POLICY, workers=2)
+    assert cost.cached == 1
+    assert (cost.low, cost.high) == (200, 300)
+
+def test_pinned_plan(tmpdir):
+    spec = specs.load_spec(write_spec(tmpdir, axes={"affinity" : ["compact", "scatter"],
+                                                    "threads" : [1, 2]},
+                                      arguments=["-b", "{threads}"],
+                                      dimensions=["affinity"], affinity="affinity"))
+    plan = specs.compile_spec(spec)
+    keys = specs.get_job_keys(plan, POLICY, cpus=CPUS)
+
+    job_dirs = [os.path.dirname(journal.path) for journal, key in keys]
+    assert job_dirs == [str(tmpdir.join("scan", policy)) for policy in
+                        ("compact", "compact", "scatter", "scatter")]
+    assert specs.get_job_cpus(plan, plan.jobs[1], CPUS) == [0, 1]
+
+    # pinned jobs run one at a time
+    assert specs.estimate_cost(plan, POLICY, workers=4, keys=keys).workers == 1
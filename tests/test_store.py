@@ -0,0 +1,73 @@
+from __future__ import print_function
+
+import os
+import math
+
+import store
+
+def make_store(tmpdir):
+    result_store = store.ResultStore(str(tmpdir.join("projectivity.npz")), "selectivity", "stat")
+    result_store.append(layout="row", operator="direct", projectivity=0.1, selectivity=0.2, stat=10)
+    result_store.append(layout="row", operator="direct", projectivity=0.1, selectivity=0.5, stat=20)
+    result_store.append(layout="column", operator="direct", projectivity=0.1, selectivity=0.2, stat=5)
+    return result_store
+
+def write_result(path, text):
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    fp = open(path, "w")
+    fp.write(text)
+    fp.close()
+
+def test_convert_value_defaults():
+    assert store.convert_value("layout", None) == ""
+    assert store.convert_value("column_count", None) == -1
+    assert math.isnan(store.convert_value("stat", None))
+    # directory components are strings
+    assert store.convert_value("column_count", "100") == 100
+    assert store.convert_value("layout", 2.0) == "2"
+
+def test_select_and_series(tmpdir):
+    result_store = make_store(tmpdir)
+    assert len(result_store) == 3
+    assert len(result_store.select(layout="row")) == 2
+    assert result_store.series(layout="row", projectivity="0.1").tolist() == [[0.2, 10], [0.5, 20]]
+
+def test_lookup_matches_full_parameter_tuple(tmpdir):
+    result_store = make_store(tmpdir)
+    rows = result_store.lookup(layout="column", operator="direct", projectivity=0.1, selectivity=0.2)
+    assert rows["stat"].tolist() == [5]
+    # unset columns are part of the tuple, NaN included
+    assert len(result_store.lookup(layout="column", selectivity=0.2)) == 0
+
+def test_save_and_load(tmpdir):
+    result_store = make_store(tmpdir)
+    result_store.save()
+    loaded = store.ResultStore(result_store.path, "selectivity", "stat")
+    assert len(loaded) == 3
+    for name in ("layout", "selectivity", "column_count", "stat"):
+        assert loaded.frozen()[name].tolist() == result_store.frozen()[name].tolist()
+    assert math.isnan(loaded.frozen()["theta"][0])
+
+def test_open_store_imports_and_rebuilds(tmpdir):
+    result_dir = str(tmpdir.join("projectivity"))
+    result_path = os.path.join(result_dir, "row", "0.1", "projectivity.csv")
+    write_result(result_path, "0.2 , 10\n0.5 , 20\n")
+    write_result(os.path.join(result_dir, "row", "unexpected", "deeper", "projectivity.csv"), "1 , 1\n")
+
+    result_store = store.open_store(result_dir, "projectivity.csv", ("layout", "projectivity"),
+                                    "selectivity", "stat")
+    assert result_store.series(layout="row").tolist() == [[0.2, 10], [0.5, 20]]
+    assert os.path.exists(result_store.path)
+    assert not store.is_stale(result_store.path, result_dir, "projectivity.csv")
+
+    # a result file written after the store was saved
+    write_result(result_path, "0.2 , 10\n0.5 , 20\n0.8 , 30\n")
+    saved = os.path.getmtime(result_store.path)
+    os.utime(result_path, (saved + 10, saved + 10))
+    assert store.is_stale(result_store.path, result_dir, "projectivity.csv")
+
+    result_store = store.open_store(result_dir, "projectivity.csv", ("layout", "projectivity"),
+                                    "selectivity", "stat")
+    assert len(result_store) == 3
@@ -0,0 +1,35 @@
+from __future__ import print_function
+
+import sweep
+
+def test_worker_cpus_cover_every_core_once():
+    for cpu_count in (1, 4, 7, 16):
+        for workers in range(1, cpu_count + 1):
+            cpus = []
+            for slot in range(workers):
+                cpus += sweep.get_worker_cpus(slot, workers, cpu_count)
+            assert cpus == list(range(cpu_count))
+
+def test_worker_cpus_extra_cores_go_to_first_slots():
+    assert sweep.get_worker_cpus(0, 3, 8) == [0, 1, 2]
+    assert sweep.get_worker_cpus(1, 3, 8) == [3, 4, 5]
+    assert sweep.get_worker_cpus(2, 3, 8) == [6, 7]
+
+def test_worker_cpus_more_workers_than_cores():
+    # every worker still gets a core, slots wrap around
+    assert sweep.get_worker_cpus(0, 8, 2) == [0]
+    assert sweep.get_worker_cpus(1, 8, 2) == [1]
+    assert sweep.get_worker_cpus(2, 8, 2) == [0]
+
+def test_pin_command(tmpdir, monkeypatch):
+    taskset = tmpdir.join("taskset")
+    taskset.write("")
+    monkeypatch.setattr(sweep, "TASKSET", str(taskset))
+
+    assert sweep.pin_command(["./hyadapt", "-e", "1"], [2, 3]) == \
+        [str(taskset), "-c", "2,3", "./hyadapt", "-e", "1"]
+    assert sweep.pin_command(("./hyadapt",), []) == ["./hyadapt"]
+
+def test_pin_command_without_taskset(tmpdir, monkeypatch):
+    monkeypatch.setattr(sweep, "TASKSET", str(tmpdir.join("missing")))
+    assert sweep.pin_command(["./hyadapt"], [0]) == ["./hyadapt"]
@@ -0,0 +1,51 @@
+from __future__ import print_function
+
+import pytest
+
+import topology
+
+# 2 sockets x 2 cores x 2 threads, siblings numbered like Linux does:
+# cpus 0-3 are the first thread of every core, 4-7 their SMT siblings
+SOCKETS = {0 : 0, 1 : 0, 2 : 1, 3 : 1, 4 : 0, 5 : 0, 6 : 1, 7 : 1}
+CORE_IDS = {0 : 0, 1 : 4, 2 : 0, 3 : 4, 4 : 0, 5 : 4, 6 : 0, 7 : 4}
+
+def make_sysfs(tmpdir):
+    sysfs = tmpdir.mkdir("cpu")
+    sysfs.join("online").write("0-7\n")
+    for cpu in range(8):
+        topology_dir = sysfs.mkdir("cpu%d" % cpu).mkdir("topology")
+        topology_dir.join("physical_package_id").write("%d\n" % SOCKETS[cpu])
+        topology_dir.join("core_id").write("%d\n" % CORE_IDS[cpu])
+    return str(sysfs)
+
+def test_parse_cpu_list():
+    assert topology.parse_cpu_list("0-3,8-9,12\n") == [0, 1, 2, 3, 8, 9, 12]
+    assert topology.parse_cpu_list("") == []
+
+def test_read_topology(tmpdir):
+    cpus = topology.read_topology(make_sysfs(tmpdir))
+    assert [tuple(info) for info in cpus] == [
+        (0, 0, 0, 0), (1, 0, 1, 0), (2, 1, 0, 0), (3, 1, 1, 0),
+        (4, 0, 0, 1), (5, 0, 1, 1), (6, 1, 0, 1), (7, 1, 1, 1)]
+
+def test_read_topology_without_sysfs(tmpdir):
+    cpus = topology.read_topology(str(tmpdir.join("missing")))
+    assert all(info.socket == 0 and info.thread == 0 for info in cpus)
+
+def test_boundaries_and_thread_counts(tmpdir):
+    cpus = topology.read_topology(make_sysfs(tmpdir))
+    assert dict(topology.get_boundaries(cpus)) == {
+        "smt" : 2, "socket_cores" : 2, "socket_threads" : 4, "cores" : 4, "threads" : 8}
+    assert topology.get_thread_counts(cpus) == [1, 2, 3, 4, 5, 8]
+    assert topology.describe_topology(cpus) == "2 sockets x 2 cores x 2 threads"
+
+def test_affinity_cpus(tmpdir):
+    cpus = topology.read_topology(make_sysfs(tmpdir))
+    # siblings of one core, then the other core of the socket
+    assert topology.get_affinity_cpus(cpus, "compact", 2) == [0, 4]
+    assert topology.get_affinity_cpus(cpus, "compact", 4) == [0, 1, 4, 5]
+    # one thread per core, alternating sockets
+    assert topology.get_affinity_cpus(cpus, "scatter", 2) == [0, 2]
+    assert topology.get_affinity_cpus(cpus, "scatter", 4) == [0, 1, 2, 3]
+    with pytest.raises(ValueError):
+        topology.get_affinity_cpus(cpus, "spread", 2)
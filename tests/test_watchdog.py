@@ -0,0 +1,63 @@
+from __future__ import print_function
+
+import sys
+import json
+import signal
+import subprocess
+
+import pytest
+
+import watchdog
+
+POLICY = watchdog.WatchdogPolicy(3, 60, 2, 0.0)
+
+def test_timeout_follows_slowest_run():
+    assert watchdog.get_timeout(POLICY, 100.0) == 300.0
+    assert watchdog.get_timeout(POLICY, 1.0) == 60
+    assert watchdog.get_timeout(watchdog.NO_RETRY, 100.0) is None
+
+def test_timeout_without_history():
+    assert watchdog.get_timeout(POLICY, None, estimate=50.0) == 150.0
+    # nothing to go by, the run is not limited
+    assert watchdog.get_timeout(POLICY, None) is None
+
+def test_sweep_timeout_without_history():
+    assert watchdog.get_sweep_timeout(POLICY, None) == 60 * watchdog.NO_HISTORY_FACTOR
+    assert watchdog.get_sweep_timeout(POLICY, None, estimate=50.0) == 150.0
+    assert watchdog.get_sweep_timeout(POLICY, 100.0) == 300.0
+    assert watchdog.get_sweep_timeout(watchdog.NO_RETRY, None) is None
+
+def test_retry_until_success():
+    results = iter([(["partial"], "timeout"), (["row 0.1 10"], None)])
+    assert watchdog.run_with_retry(lambda: next(results), POLICY) == ["row 0.1 10"]
+
+def test_retries_used_up():
+    with pytest.raises(watchdog.RunFailed) as info:
+        watchdog.run_with_retry(lambda: (["partial"], "exit code 1"), POLICY)
+    assert info.value.attempts == 3
+    assert info.value.reason == "exit code 1"
+    assert info.value.lines == ["partial"]
+
+def test_record_failure(tmpdir):
+    path = watchdog.get_failure_path(str(tmpdir.join("caching")))
+    watchdog.record_failure(path, ["./hyadapt", 1], "timeout", 3, params=["row"])
+    fp = open(path)
+    entry = json.loads(fp.read())
+    fp.close()
+    assert entry["command"] == ["./hyadapt", "1"]
+    assert entry["reason"] == "timeout"
+
+def test_watchdog_stops_run():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"],
+                               preexec_fn=watchdog.new_process_group)
+    with watchdog.Watchdog(process, 0.2, grace_period=5.0) as guard:
+        process.wait()
+    assert guard.expired
+    assert process.returncode == -signal.SIGTERM
+
+def test_watchdog_leaves_finished_run():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    with watchdog.Watchdog(process, 30.0) as guard:
+        process.wait()
+    assert not guard.expired
+    assert process.returncode == 0
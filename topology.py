@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+
+###################################################################################
+# CPU TOPOLOGY
+###################################################################################
+
+from __future__ import print_function
+import os
+import json
+import logging
+import collections
+import multiprocessing
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+CPU_SYSFS_DIR = "/sys/devices/system/cpu"
+
+# Topology of the machine a sweep ran on, next to its results
+TOPOLOGY_FILE_NAME = "topology.json"
+
+# One logical CPU.
+#   socket : physical package
+#   core   : physical core, numbered from 0 within its socket
+#   thread : SMT sibling, numbered from 0 within its core
+CpuInfo = collections.namedtuple('CpuInfo', ['cpu', 'socket', 'core', 'thread'])
+
+# How the threads of a run are placed.
+#   compact : fill the SMT siblings of a core, then the cores of a socket,
+#             then the next socket
+#   scatter : one thread per physical core, round-robin over the sockets,
+#             before any SMT sibling is used
+AFFINITY_ORDERS = {
+    "compact" : lambda info: (info.socket, info.core, info.thread),
+    "scatter" : lambda info: (info.thread, info.core, info.socket),
+}
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def parse_cpu_list(text):
+    """ CPUs of a sysfs list like "0-3,8-11".
+    """
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            low, high = part.split("-")
+            cpus.extend(range(int(low), int(high) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+def read_value(path):
+    fp = open(path)
+    value = fp.read().strip()
+    fp.close()
+    return value
+
+###################################################################################
+# TOPOLOGY
+###################################################################################
+
+def read_topology(sysfs_dir=None):
+    """ Every online CPU with its socket, core and SMT sibling number. Without
+        sysfs every CPU counts as a core of its own on a single socket.
+    """
+    if sysfs_dir is None:
+        sysfs_dir = CPU_SYSFS_DIR
+    online_path = os.path.join(sysfs_dir, "online")
+    if not os.path.exists(online_path):
+        LOG.warning("No CPU topology in %s, assuming one socket without SMT", sysfs_dir)
+        return [CpuInfo(cpu, 0, cpu, 0) for cpu in range(multiprocessing.cpu_count())]
+
+    # (socket, core id) -> sibling CPUs
+    siblings = collections.OrderedDict()
+    for cpu in parse_cpu_list(read_value(online_path)):
+        topology_dir = os.path.join(sysfs_dir, "cpu%d" % cpu, "topology")
+        try:
+            socket = int(read_value(os.path.join(topology_dir, "physical_package_id")))
+            core_id = int(read_value(os.path.join(topology_dir, "core_id")))
+        except (IOError, OSError, ValueError):
+            socket, core_id = 0, cpu
+        siblings.setdefault((socket, core_id), []).append(cpu)
+
+    # core ids are sparse and repeat across sockets
+    cpus = []
+    core_numbers = {}
+    for (socket, core_id), core_cpus in sorted(siblings.items()):
+        core = core_numbers.setdefault(socket, 0)
+        core_numbers[socket] = core + 1
+        for thread, cpu in enumerate(sorted(core_cpus)):
+            cpus.append(CpuInfo(cpu, socket, core, thread))
+
+    return sorted(cpus)
+
+def get_boundaries(cpus):
+    """ Thread counts at which a compact or scatter placement starts using
+        another core, socket or SMT sibling.
+    """
+    sockets = len(set(info.socket for info in cpus))
+    cores = len(set((info.socket, info.core) for info in cpus))
+    threads_per_core = max(info.thread for info in cpus) + 1
+
+    return collections.OrderedDict([
+        ("smt", threads_per_core),
+        ("socket_cores", cores // sockets),
+        ("socket_threads", len(cpus) // sockets),
+        ("cores", cores),
+        ("threads", len(cpus)),
+    ])
+
+def get_thread_counts(cpus):
+    """ Powers of two up to every logical CPU, plus each topology boundary
+        and the count right after it.
+    """
+    total = len(cpus)
+    counts = set()
+
+    count = 1
+    while count <= total:
+        counts.add(count)
+        count *= 2
+
+    for boundary in get_boundaries(cpus).values():
+        counts.add(boundary)
+        if boundary < total:
+            counts.add(boundary + 1)
+
+    return sorted(count for count in counts if count > 0)
+
+def get_affinity_cpus(cpus, policy, threads):
+    """ CPUs a run of threads threads is pinned to under the given policy.
+    """
+    if policy not in AFFINITY_ORDERS:
+        raise ValueError("Unknown affinity policy %s" % policy)
+    ordered = sorted(cpus, key=AFFINITY_ORDERS[policy])
+    return sorted(info.cpu for info in ordered[:threads])
+
+def describe_topology(cpus):
+    boundaries = get_boundaries(cpus)
+    sockets = len(set(info.socket for info in cpus))
+    return "%d sockets x %d cores x %d threads" % (sockets, boundaries["socket_cores"],
+                                                   boundaries["smt"])
+
+def write_topology(result_dir, cpus):
+    if not os.path.exists(result_dir):
+        os.makedirs(result_dir)
+
+    entry = collections.OrderedDict([
+        ("boundaries", get_boundaries(cpus)),
+        ("cpus", [list(info) for info in cpus]),
+    ])
+
+    fp = open(os.path.join(result_dir, TOPOLOGY_FILE_NAME), "w")
+    fp.write(json.dumps(entry))
+    fp.close()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+
+###################################################################################
+# WATCHDOG
+###################################################################################
+
+from __future__ import print_function
+import os
+import time
+import json
+import signal
+import logging
+import threading
+import collections
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# How runs are guarded.
+#   timeout_factor : a run may take this many times the slowest finished run
+#   min_timeout    : seconds, lower bound of the derived limit
+#   retries        : extra attempts after a failed or timed-out run
+#   backoff        : seconds before the first retry, doubled for every further one
+WatchdogPolicy = collections.namedtuple('WatchdogPolicy',
+                                        ['timeout_factor', 'min_timeout', 'retries', 'backoff'])
+
+NO_RETRY = WatchdogPolicy(0, 0, 0, 0.0)
+
+# Without a finished run or an estimate to go by, a sweep job, a single
+# configuration, may take this many times min_timeout
+NO_HISTORY_FACTOR = 10
+
+# Seconds between SIGTERM and SIGKILL
+KILL_GRACE_PERIOD = 10.0
+
+# Lost configurations, one JSON line each, next to the run journal
+FAILURE_FILE_NAME = "failures.log"
+
+###################################################################################
+# UTILS
+###################################################################################
+
+class RunFailed(Exception):
+    """ A run that still failed after all retries. lines holds whatever the
+        last attempt produced.
+    """
+
+    def __init__(self, reason, attempts, lines=None):
+        Exception.__init__(self, "%s after %d attempts" % (reason, attempts))
+        self.reason = reason
+        self.attempts = attempts
+        self.lines = lines or []
+
+def get_timeout(policy, history, estimate=None):
+    """ Time limit of one run given the slowest finished run. Before any run
+        finished, the limit follows the estimated run time; without one
+        there is nothing to go by and the run is not limited. None when the
+        run is not limited.
+    """
+    if policy.timeout_factor <= 0:
+        return None
+    if history is None:
+        if not estimate:
+            return None
+        history = estimate
+    return max(policy.min_timeout, policy.timeout_factor * history)
+
+def get_sweep_timeout(policy, history, estimate=None):
+    """ get_timeout of a sweep job. A job runs a single configuration, so
+        before any run finished it may still take NO_HISTORY_FACTOR times
+        min_timeout without an estimate.
+    """
+    timeout = get_timeout(policy, history, estimate)
+    if timeout is None and policy.timeout_factor > 0:
+        return policy.min_timeout * NO_HISTORY_FACTOR
+    return timeout
+
+def new_process_group():
+    """ Popen preexec_fn: run the benchmark in its own process group, so
+        wrappers like perf go down together with what they started.
+    """
+    os.setpgrp()
+
+def get_failure_path(result_dir):
+    return os.path.join(result_dir, FAILURE_FILE_NAME)
+
+def record_failure(path, command, reason, attempts, params=None):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    entry = collections.OrderedDict([
+        ("time", time.time()),
+        ("command", [str(arg) for arg in command]),
+        ("params", params),
+        ("reason", reason),
+        ("attempts", attempts),
+    ])
+
+    fp = open(path, "a")
+    fp.write(json.dumps(entry) + "\n")
+    fp.close()
+
+def log_failures(path):
+    """ Summary of the configurations lost so far.
+    """
+    if not os.path.exists(path):
+        return
+
+    fp = open(path)
+    entries = [json.loads(line) for line in fp if line.strip()]
+    fp.close()
+
+    if not entries:
+        return
+
+    LOG.error("%d configurations lost, see %s", len(entries), path)
+    for entry in entries:
+        LOG.error("  %s: %s", " ".join(entry["params"] or entry["command"]), entry["reason"])
+
+###################################################################################
+# WATCHDOG
+###################################################################################
+
+class Watchdog(object):
+    """ Stops a process that outlives its time limit: SIGTERM first, SIGKILL
+        if it is still around KILL_GRACE_PERIOD seconds later. Processes
+        started with new_process_group are signalled as a whole group.
+        The watchdog never reaps the process, it only looks at the
+        returncode, so the caller's wait4 still gets its resource usage.
+    """
+
+    def __init__(self, process, timeout, grace_period=None):
+        self.process = process
+        self.timeout = timeout
+        self.grace_period = grace_period if grace_period is not None else KILL_GRACE_PERIOD
+        self.expired = False
+        self.timer = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cancel()
+        # an interrupted harness takes its benchmark down with it, the
+        # process group no longer gets the terminal's Ctrl-C
+        if exc_type is not None and self.process.returncode is None:
+            self.signal(signal.SIGKILL)
+
+    def start(self):
+        if self.timeout is None:
+            return
+        self.timer = threading.Timer(self.timeout, self.terminate)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def cancel(self):
+        if self.timer is not None:
+            self.timer.cancel()
+
+    def terminate(self):
+        if self.process.returncode is not None:
+            return
+
+        self.expired = True
+        LOG.warning("Run exceeded %.0fs, sending SIGTERM to %d", self.timeout, self.process.pid)
+        self.signal(signal.SIGTERM)
+
+        self.timer = threading.Timer(self.grace_period, self.kill)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def kill(self):
+        # children of a group leader may outlive it
+        if self.process.returncode is not None and not self.is_group_leader():
+            return
+        LOG.warning("Run ignored SIGTERM, sending SIGKILL to %d", self.process.pid)
+        self.signal(signal.SIGKILL)
+
+    def is_group_leader(self):
+        try:
+            return os.getpgid(self.process.pid) == self.process.pid
+        except OSError:
+            # already reaped, the group may still be around
+            return self.process.returncode is not None
+
+    def signal(self, signal_number):
+        try:
+            if self.is_group_leader():
+                os.killpg(self.process.pid, signal_number)
+            else:
+                os.kill(self.process.pid, signal_number)
+        except OSError:
+            # already gone
+            pass
+
+###################################################################################
+# RETRY
+###################################################################################
+
+def run_with_retry(attempt, policy=NO_RETRY):
+    """ Call attempt() until it succeeds or the retries are used up.
+
+        attempt returns (lines, failure) where failure is None or the reason
+        the run failed. Returns the lines of the successful attempt, raises
+        RunFailed otherwise.
+    """
+    attempts = 0
+    while True:
+        lines, failure = attempt()
+        attempts += 1
+        if failure is None:
+            return lines
+
+        if attempts > policy.retries:
+            raise RunFailed(failure, attempts, lines)
+
+        delay = policy.backoff * (2 ** (attempts - 1))
+        LOG.warning("Run failed (%s), retrying in %.0fs (%d of %d)",
+                    failure, delay, attempts, policy.retries)
+        time.sleep(delay)
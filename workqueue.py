@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+
+###################################################################################
+# WORK QUEUE
+###################################################################################
+
+from __future__ import print_function
+import os
+import sys
+import time
+import json
+import socket
+import shutil
+import logging
+import argparse
+import tempfile
+import importlib
+import threading
+import subprocess
+import collections
+
+import sweep
+import counters
+import repetition
+import watchdog
+
+###################################################################################
+# LOGGING CONFIGURATION
+###################################################################################
+
+LOG = logging.getLogger(__name__)
+LOG_handler = logging.StreamHandler()
+LOG_formatter = logging.Formatter(
+    fmt='%(asctime)s [%(funcName)s:%(lineno)03d] %(levelname)-5s: %(message)s',
+    datefmt='%m-%d-%Y %H:%M:%S'
+)
+LOG_handler.setFormatter(LOG_formatter)
+LOG.addHandler(LOG_handler)
+LOG.setLevel(logging.INFO)
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# The queue lives in its own subdirectory of the directory given to --queue,
+# shared by the coordinator and every worker:
+#   .workqueue : marker, only directories holding it are ever wiped
+#   jobs/      : pending job units, claimed by renaming them into leases/
+#   leases/    : claimed units; a worker touches its lease while the job runs
+#   done/      : results waiting for the coordinator
+#   STOP       : created once the sweep is complete
+QUEUE_DIR_NAME = "workqueue"
+QUEUE_MARKER = ".workqueue"
+JOBS_DIR = "jobs"
+LEASES_DIR = "leases"
+DONE_DIR = "done"
+STOP_FILE = "STOP"
+
+JOB_EXTENSION = ".json"
+
+# Seconds without a heartbeat after which a lease is given to another worker
+LEASE_TIMEOUT = 60.0
+LEASE_HEARTBEAT = 10.0
+
+# Seconds between polls of the queue directory
+QUEUE_POLL_INTERVAL = 0.5
+
+###################################################################################
+# UTILS
+###################################################################################
+
+def get_job_id(index):
+    return "%06d" % index
+
+def get_function_name(function):
+    """ Importable name of a module-level function, also when its module is
+        the running script.
+    """
+    module = function.__module__
+    if module == "__main__":
+        module = os.path.splitext(os.path.basename(sys.modules[module].__file__))[0]
+    return module + "." + function.__name__
+
+def get_function(name):
+    module, function = name.rsplit(".", 1)
+    return getattr(importlib.import_module(module), function)
+
+def write_json(path, entry):
+    # readers only ever see complete files
+    temp_path = path + ".tmp"
+    fp = open(temp_path, "w")
+    fp.write(json.dumps(entry))
+    fp.close()
+    os.rename(temp_path, path)
+
+def read_json(path):
+    fp = open(path)
+    entry = json.loads(fp.read(), object_pairs_hook=collections.OrderedDict)
+    fp.close()
+    return entry
+
+def list_jobs(directory):
+    return sorted(file_name[:-len(JOB_EXTENSION)] for file_name in os.listdir(directory)
+                  if file_name.endswith(JOB_EXTENSION))
+
+def encode_task(task):
+    index, job, output_file, policy, collector, guard, timeout = task
+    return {
+        "index" : index,
+        "command" : list(job.command),
+        "parse" : get_function_name(job.parse) if job.parse is not None else None,
+        "params" : job.params,
+        "output_file" : output_file,
+        "policy" : list(policy),
+        "collector" : [collector.perf, list(collector.events)] if collector is not None else None,
+        "guard" : list(guard),
+        "timeout" : timeout,
+    }
+
+def decode_task(entry):
+    parse = get_function(entry["parse"]) if entry["parse"] is not None else None
+    collector = None
+    if entry["collector"] is not None:
+        collector = counters.CounterCollector(*entry["collector"])
+    return (entry["index"],
+            sweep.SweepJob(entry["command"], parse, entry["params"]),
+            entry["output_file"],
+            repetition.RepetitionPolicy(*entry["policy"]),
+            collector,
+            watchdog.WatchdogPolicy(*entry["guard"]),
+            entry["timeout"])
+
+###################################################################################
+# QUEUE
+###################################################################################
+
+class WorkQueue(object):
+    """ Job units of one sweep in a directory shared by the coordinator and
+        its workers, local processes or machines mounting the same path.
+
+        Claiming is an atomic rename from jobs/ into leases/, so every unit
+        runs on one worker at a time. A worker that stops renewing its lease
+        is presumed dead and its unit goes back to jobs/.
+    """
+
+    def __init__(self, queue_dir):
+        self.path = os.path.join(queue_dir, QUEUE_DIR_NAME)
+        self.marker = os.path.join(self.path, QUEUE_MARKER)
+        self.jobs_dir = os.path.join(self.path, JOBS_DIR)
+        self.leases_dir = os.path.join(self.path, LEASES_DIR)
+        self.done_dir = os.path.join(self.path, DONE_DIR)
+        self.stop_file = os.path.join(self.path, STOP_FILE)
+
+    def create(self):
+        # a queue only ever holds one sweep
+        if os.path.exists(self.path):
+            if not os.path.exists(self.marker):
+                raise ValueError("%s exists and is not a work queue, not wiping it" % self.path)
+            shutil.rmtree(self.path)
+        for directory in (self.jobs_dir, self.leases_dir, self.done_dir):
+            os.makedirs(directory)
+        open(self.marker, "w").close()
+
+    def submit(self, tasks):
+        for task in tasks:
+            job_id = get_job_id(task[0])
+            write_json(os.path.join(self.jobs_dir, job_id + JOB_EXTENSION), encode_task(task))
+
+    def stop(self):
+        open(self.stop_file, "w").close()
+
+    def is_stopped(self):
+        return os.path.exists(self.stop_file)
+
+    # WORKER SIDE
+
+    def claim(self):
+        """ Lease the next pending unit, None when there is none.
+        """
+        if not os.path.isdir(self.jobs_dir):
+            return None
+
+        for job_id in list_jobs(self.jobs_dir):
+            lease = os.path.join(self.leases_dir, job_id + JOB_EXTENSION)
+            try:
+                os.rename(os.path.join(self.jobs_dir, job_id + JOB_EXTENSION), lease)
+            except OSError:
+                # another worker was faster
+                continue
+            self.renew(job_id)
+            return job_id, read_json(lease)
+        return None
+
+    def renew(self, job_id):
+        try:
+            os.utime(os.path.join(self.leases_dir, job_id + JOB_EXTENSION), None)
+        except OSError:
+            # lease expired and was handed out again
+            pass
+
+    def complete(self, job_id, result):
+        write_json(os.path.join(self.done_dir, job_id + JOB_EXTENSION), result)
+        try:
+            os.remove(os.path.join(self.leases_dir, job_id + JOB_EXTENSION))
+        except OSError:
+            pass
+
+    # COORDINATOR SIDE
+
+    def requeue_expired(self, lease_timeout=None):
+        if lease_timeout is None:
+            lease_timeout = LEASE_TIMEOUT
+        now = time.time()
+        for job_id in list_jobs(self.leases_dir):
+            lease = os.path.join(self.leases_dir, job_id + JOB_EXTENSION)
+            try:
+                if now - os.path.getmtime(lease) < lease_timeout:
+                    continue
+                os.rename(lease, os.path.join(self.jobs_dir, job_id + JOB_EXTENSION))
+            except OSError:
+                continue
+            LOG.warning("Lease of job %s expired, requeued", job_id)
+
+    def collect(self):
+        """ Results pushed by the workers since the last call.
+        """
+        results = []
+        for job_id in list_jobs(self.done_dir):
+            path = os.path.join(self.done_dir, job_id + JOB_EXTENSION)
+            results.append(read_json(path))
+            os.remove(path)
+        return results
+
+###################################################################################
+# WORKER
+###################################################################################
+
+def _heartbeat(queue, job_id, finished):
+    while not finished.wait(LEASE_HEARTBEAT):
+        queue.renew(job_id)
+
+def run_worker(queue_dir, slot=0, workers=1):
+    """ Pull units from the queue and push their results back until the
+        coordinator stops the sweep.
+    """
+    queue = WorkQueue(queue_dir)
+    worker_id = "%s:%d" % (socket.gethostname(), os.getpid())
+    work_root = tempfile.mkdtemp(prefix="worker-")
+    sweep.setup_worker(slot, work_root, workers)
+
+    LOG.info("Worker %s on %s", worker_id, queue_dir)
+    try:
+        while not queue.is_stopped():
+            claimed = queue.claim()
+            if claimed is None:
+                time.sleep(QUEUE_POLL_INTERVAL)
+                continue
+
+            job_id, entry = claimed
+            finished = threading.Event()
+            heartbeat = threading.Thread(target=_heartbeat, args=(queue, job_id, finished))
+            heartbeat.daemon = True
+            heartbeat.start()
+            try:
+                index, lines, counters_mean, usage, duration, failure = sweep._run_job(decode_task(entry))
+            finally:
+                finished.set()
+                heartbeat.join()
+
+            queue.complete(job_id, {
+                "index" : index,
+                "lines" : lines,
+                "counters" : counters_mean,
+                "usage" : usage,
+                "duration" : duration,
+                "failure" : failure,
+                "worker" : worker_id,
+            })
+    finally:
+        shutil.rmtree(work_root, ignore_errors=True)
+
+###################################################################################
+# COORDINATOR
+###################################################################################
+
+def start_local_workers(queue_dir, workers):
+    script = os.path.realpath(__file__)
+    if script.endswith(".pyc"):
+        script = script[:-1]
+    return [subprocess.Popen([sys.executable, script,
+                              "--worker", queue_dir,
+                              "--slot", str(slot),
+                              "--workers", str(workers)])
+            for slot in range(workers)]
+
+def get_exited(processes):
+    return [process for process in processes if process.poll() is not None]
+
+def run_queued(tasks, queue_dir, workers, finish, lease_timeout=LEASE_TIMEOUT):
+    """ Serve the tasks of a sweep through the queue in queue_dir and call
+        finish(index, lines, counters, usage, duration, failure) for each result.
+        workers local worker processes are started; more can join from other
+        machines with `workqueue.py --worker <queue_dir>`. Raises
+        RuntimeError when every local worker died with jobs still pending.
+    """
+    queue = WorkQueue(queue_dir)
+    queue.create()
+    queue.submit(tasks)
+
+    pending = set(task[0] for task in tasks)
+    processes = start_local_workers(queue_dir, workers)
+
+    LOG.info("Serving %d jobs from %s to %d local workers", len(pending), queue_dir, workers)
+    try:
+        while pending:
+            for result in queue.collect():
+                index = result["index"]
+                # a requeued unit may finish twice
+                if index not in pending:
+                    continue
+                pending.discard(index)
+                failure = tuple(result["failure"]) if result["failure"] is not None else None
+                finish(index, result["lines"], result["counters"], result["usage"],
+                       result["duration"], failure)
+
+            if pending:
+                exited = get_exited(processes)
+                if len(exited) == len(processes):
+                    raise RuntimeError("All %d local workers exited (%s) with %d jobs pending" % (
+                        len(processes), ", ".join(str(process.returncode) for process in exited),
+                        len(pending)))
+                queue.requeue_expired(lease_timeout)
+                time.sleep(QUEUE_POLL_INTERVAL)
+    finally:
+        queue.stop()
+        for process in processes:
+            process.wait()
+
+###################################################################################
+# MAIN
+###################################################################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Run sweep jobs from a shared queue directory')
+
+    parser.add_argument("--worker", help='queue directory to pull jobs from', required=True)
+    parser.add_argument("--slot", help='worker slot on this machine, for core pinning', type=int, default=0)
+    parser.add_argument("--workers", help='workers sharing this machine', type=int, default=1)
+
+    args = parser.parse_args()
+
+    run_worker(os.path.realpath(args.worker), args.slot, args.workers)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+###################################################################################
+# RESULT WRITERS
+###################################################################################
+
+from __future__ import print_function
+import os
+import collections
+
+###################################################################################
+# CONFIGURATION
+###################################################################################
+
+# Result files kept open at once
+WRITER_POOL_SIZE = 64
+
+# Lines buffered per result file before they are written out
+WRITER_BATCH_SIZE = 1024
+
+###################################################################################
+# WRITER POOL
+###################################################################################
+
+class ResultWriterPool(object):
+    """ LRU pool of open result files in append mode.
+
+        Lines are buffered per file and written in batches; the least recently
+        used file is flushed and closed when the pool is full. Directories are
+        created the first time a file below them is opened.
+    """
+
+    def __init__(self, pool_size=WRITER_POOL_SIZE, batch_size=WRITER_BATCH_SIZE):
+        self.pool_size = max(1, pool_size)
+        self.batch_size = max(1, batch_size)
+        # path -> [file, pending lines]
+        self.writers = collections.OrderedDict()
+        self.directories = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, path, text):
+        writer = self.writers.pop(path, None)
+        if writer is None:
+            writer = self._open(path)
+        self.writers[path] = writer
+
+        writer[1].append(text)
+        if len(writer[1]) >= self.batch_size:
+            self._flush(writer)
+
+    def flush(self):
+        for writer in self.writers.values():
+            self._flush(writer)
+
+    def close(self):
+        while self.writers:
+            path, writer = self.writers.popitem(last=False)
+            self._close(writer)
+
+    def _open(self, path):
+        if len(self.writers) >= self.pool_size:
+            old_path, old_writer = self.writers.popitem(last=False)
+            self._close(old_writer)
+
+        directory = os.path.dirname(path)
+        if directory not in self.directories:
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self.directories.add(directory)
+
+        return [open(path, "a"), []]
+
+    def _flush(self, writer):
+        if writer[1]:
+            writer[0].write("".join(writer[1]))
+            del writer[1][:]
+
+    def _close(self, writer):
+        self._flush(writer)
+        writer[0].close()